@@ -24,15 +24,22 @@ install_requirements()
 from src.file_system.directory.directory_manager import initialize
 from src.database.core.schema import create_tables
 from src.database.users.user_manager import initialize_admin
+from src.database.logging.retention import start_log_retention
+from src.database.cart.reservations import start_reservation_sweeper
+from src.file_system.config.config_manager import get_logging_settings, get_paths
+from src.utils.logging.file_logging import configure_file_logging
 from src.gui.core import start_app
 
 """Main entry point for the Bicycle Shop Management application.
 
 This module initializes the application by:
 1. Checking for first-time setup
-2. Creating database tables
-3. Ensuring admin user exists
-4. Starting the GUI
+2. Starting the application log file writer
+3. Creating database tables
+4. Ensuring admin user exists
+5. Archiving old logs in the background
+6. Sweeping expired stock reservations in the background
+7. Starting the GUI
 
 The application will exit after creating config.ini on first run.
 """
@@ -46,20 +53,44 @@ def main():
     Note:
         Performs initialization in specific order:
         1. First-time setup check/config creation
-        2. Database table creation
-        3. Admin user initialization
-        4. GUI startup
+        2. Application log file writer
+        3. Database table creation
+        4. Admin user initialization
+        5. Background log retention
+        6. Background reservation sweeper
+        7. GUI startup
     """
     # Check if first run
     if initialize():
         return  # Exit after creating config.ini
 
+    # Send application logs to rotating files in the logs directory
+    logging_settings = get_logging_settings()
+    configure_file_logging(
+        get_paths()['logs_dir'],
+        level=logging_settings['log_level'],
+        max_bytes=logging_settings['log_max_bytes'],
+        rotate_interval_hours=logging_settings['log_rotate_interval_hours'],
+        backup_count=logging_settings['log_backup_count'],
+        compress=logging_settings['log_compress_rotated']
+    )
+
     # Ensure database tables are created before starting the app
     create_tables()
 
     # Ensure an admin user exists on startup
     initialize_admin()
 
+    # Archive logs outside the retention policy without delaying startup
+    start_log_retention(
+        logging_settings['retention_days'],
+        logging_settings['retention_max_rows'],
+        get_paths()['log_archive_dir']
+    )
+
+    # Clear expired cart holds periodically so the reservation table stays small
+    start_reservation_sweeper()
+
     # Start the GUI application
     start_app()
 
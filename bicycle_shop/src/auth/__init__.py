@@ -1,11 +1,39 @@
 from .core import (
     hash_password,
     verify_password,
-    authenticate_user
+    needs_rehash,
+    authenticate_user,
+    PASSWORD_HASHERS
+)
+from .service import run_auth_task
+from .session import (
+    start_session,
+    get_session,
+    is_session_admin,
+    end_session
+)
+from .throttle import (
+    LoginThrottledError,
+    check_login_allowed,
+    get_locked_accounts,
+    unlock_account,
+    get_terminal_id
 )
 
 __all__ = [
     'hash_password',
     'verify_password',
-    'authenticate_user'
-]
\ No newline at end of file
+    'needs_rehash',
+    'authenticate_user',
+    'PASSWORD_HASHERS',
+    'run_auth_task',
+    'start_session',
+    'get_session',
+    'is_session_admin',
+    'end_session',
+    'LoginThrottledError',
+    'check_login_allowed',
+    'get_locked_accounts',
+    'unlock_account',
+    'get_terminal_id'
+]
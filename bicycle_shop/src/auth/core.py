@@ -1,48 +1,148 @@
+import base64
 import hashlib
+import hmac
 import os
 from src.database.core.connection import get_connection
+from src.file_system.config.config_manager import get_security_settings
+from src.auth.throttle import check_login_allowed, record_login_failure, record_login_success
 
-def hash_password(password):
-    """Hash a password using PBKDF2 with a random salt.
+# Iterations used by hashes stored before the encoded format, they have no parameters saved
+LEGACY_PBKDF2_ITERATIONS = 100000
+SALT_BYTES = 16
+
+def _pbkdf2_sha256(password, salt, params):
+    """Derive a PBKDF2-SHA256 key, params is (iterations,)."""
+    iterations, = params
+    return hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt, iterations)
+
+def _scrypt(password, salt, params):
+    """Derive an scrypt key, params is (n, r, p)."""
+    n, r, p = params
+    # maxmem covers the 128 * n * r bytes scrypt needs with headroom for larger settings
+    return hashlib.scrypt(password.encode('utf-8'), salt=salt, n=n, r=r, p=p,
+                          maxmem=256 * n * r + 1024 * 1024, dklen=32)
+
+# Supported algorithms: name -> (key derivation function, number of integer parameters)
+PASSWORD_HASHERS = {
+    'pbkdf2_sha256': (_pbkdf2_sha256, 1),
+    'scrypt': (_scrypt, 3)
+}
+
+def hash_password(password, algorithm=None, params=None):
+    """Hash a password with a random salt in the encoded hash format.
     
     Args:
         password: The plaintext password to hash
+        algorithm: Name from PASSWORD_HASHERS (default: password_algorithm from config)
+        params: Tuple of integer cost parameters for the algorithm (default: from config)
         
     Returns:
-        tuple: (salt, hashed_password)
-            - salt: Random 16-byte salt used in hashing
-            - hashed_password: The resulting password hash
+        str: Encoded hash '<algorithm>$<param>...$<salt>$<hash>', with salt and
+             hash base64 encoded, e.g. 'pbkdf2_sha256$100000$...$...'
+            
+    Note:
+        Takes a noticeable time by design, call it through run_auth_task
+        from GUI handlers so the window stays responsive.
     """
+    if algorithm is None:
+        algorithm, params = get_password_hash_settings()
+    derive, _ = PASSWORD_HASHERS[algorithm]
     # Use a cryptographically secure 16-byte random salt
-    salt = os.urandom(16)
-    # Use PBKDF2 with SHA256 and 100k iterations for strong password hashing
-    # This provides good security against brute force and rainbow table attacks,
-    # 100k itterations meets the python recommended minimal for 16 byte, however 600k itterations would be better for security.
-    hashed_password = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt, 100000)
-    return salt, hashed_password
+    salt = os.urandom(SALT_BYTES)
+    hashed_password = derive(password, salt, params)
+    return "$".join([algorithm, *(str(value) for value in params), _b64encode(salt), _b64encode(hashed_password)])
 
 def verify_password(salt, stored_hash, password):
     """Verify if a password matches its stored hash.
     
     Args:
-        salt: The salt used in the original hash
-        stored_hash: The previously generated hash to verify against
+        salt: Salt column of the user, only used by legacy hashes (None for encoded hashes)
+        stored_hash: Encoded hash string, or a legacy raw PBKDF2 digest (bytes)
         password: The plaintext password to verify
         
     Returns:
         bool: True if password matches, False otherwise
     """
-    # Hash the provided password with same parameters and salt
-    # This allows comparing against the stored hash
-    hashed_password = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt, 100000)
-    return hashed_password == stored_hash
+    try:
+        algorithm, params, hash_salt, expected = parse_password_hash(salt, stored_hash)
+    except (KeyError, ValueError) as e:
+        print(f"Unreadable password hash: {e}")
+        return False
+    # Hash the provided password with the stored algorithm, parameters and salt
+    hashed_password = PASSWORD_HASHERS[algorithm][0](password, hash_salt, params)
+    # Constant time comparison so timing does not reveal how much of the hash matched
+    return hmac.compare_digest(hashed_password, expected)
+
+def needs_rehash(salt, stored_hash):
+    """Check whether a stored hash uses outdated parameters.
+    
+    Args:
+        salt: Salt column of the user
+        stored_hash: Stored password hash
+        
+    Returns:
+        bool: True if the hash is legacy or differs from the configured algorithm and cost
+    """
+    if isinstance(stored_hash, (bytes, bytearray)):
+        # Legacy digests are moved to the encoded format even when their cost is current
+        return True
+    try:
+        algorithm, params, _, _ = parse_password_hash(salt, stored_hash)
+    except (KeyError, ValueError):
+        return True
+    return (algorithm, params) != get_password_hash_settings()
+
+def parse_password_hash(salt, stored_hash):
+    """Split a stored hash into its parts.
+    
+    Args:
+        salt: Salt column of the user, used for legacy hashes
+        stored_hash: Encoded hash string or legacy raw digest
+        
+    Returns:
+        tuple: (algorithm, params, salt, digest)
+        
+    Raises:
+        ValueError: If the encoded hash is malformed
+        KeyError: If the algorithm is not supported
+    """
+    if isinstance(stored_hash, (bytes, bytearray)):
+        # Stored before the encoded format: raw PBKDF2 digest with the salt in its own column
+        return 'pbkdf2_sha256', (LEGACY_PBKDF2_ITERATIONS,), salt, bytes(stored_hash)
 
-def authenticate_user(username, password):
+    algorithm, *fields = stored_hash.split("$")
+    _, param_count = PASSWORD_HASHERS[algorithm]
+    if len(fields) != param_count + 2:
+        raise ValueError(f"Expected {param_count + 2} fields for {algorithm}, got {len(fields)}")
+    params = tuple(int(value) for value in fields[:param_count])
+    return algorithm, params, _b64decode(fields[-2]), _b64decode(fields[-1])
+
+def get_password_hash_settings():
+    """Get the configured algorithm and its cost parameters.
+    
+    Returns:
+        tuple: (algorithm, params) as used by hash_password
+    """
+    settings = get_security_settings()
+    if settings['password_algorithm'] == 'scrypt':
+        return 'scrypt', (settings['scrypt_n'], settings['scrypt_r'], settings['scrypt_p'])
+    return 'pbkdf2_sha256', (settings['password_iterations'],)
+
+def _b64encode(data):
+    """Encode bytes as unpadded base64 text."""
+    return base64.b64encode(data).decode('ascii').rstrip("=")
+
+def _b64decode(text):
+    """Decode unpadded base64 text."""
+    return base64.b64decode(text + "=" * (-len(text) % 4))
+
+def authenticate_user(username, password, terminal=None):
     """Authenticate a user and retrieve their details.
     
     Args:
         username: Username to authenticate
         password: Password to verify
+        terminal: Terminal the attempt comes from (default: this machine)
         
     Returns:
         tuple: (authenticated, is_admin, needs_password_change, first_name, last_name, user_id)
@@ -55,7 +155,12 @@ def authenticate_user(username, password):
             
     Raises:
         ValueError: If database returns unexpected number of columns
+        LoginThrottledError: If the username or terminal is throttled, raised
+            before any database or hashing work
     """
+    # Refuse throttled attempts before paying for a key derivation
+    check_login_allowed(username, terminal)
+
     # Fetch all required user details in one query for efficiency
     # Using parameterized query to prevent SQL injection
     conn = get_connection()
@@ -65,7 +170,8 @@ def authenticate_user(username, password):
     conn.close()
 
     if not result:
-        # Return None values if user not found
+        # Return None values if user not found, counted like a wrong password so usernames cannot be probed freely
+        record_login_failure(username, terminal)
         return False, None, None, None, None, None
 
     # Validate expected number of columns to catch database schema changes
@@ -77,5 +183,29 @@ def authenticate_user(username, password):
 
     # Verify password and return full user context if valid
     if verify_password(stored_salt, stored_hash, password):
+        record_login_success(username)
+        if needs_rehash(stored_salt, stored_hash):
+            _rehash_password(user_id, stored_hash, password)
         return True, bool(is_admin), bool(password_changed), first_name, last_name, user_id
-    return False, None, None, None, None, None
\ No newline at end of file
+    record_login_failure(username, terminal)
+    return False, None, None, None, None, None
+
+def _rehash_password(user_id, old_hash, password):
+    """Store a new hash with the current settings after a successful login.
+    
+    Note:
+        Only replaces the hash that was just verified, so a password
+        changed meanwhile is never overwritten.
+    """
+    try:
+        new_hash = hash_password(password)
+        conn = get_connection()
+        try:
+            conn.execute("UPDATE Users SET password = ?, salt = NULL WHERE id = ? AND password = ?",
+                         (new_hash, user_id, old_hash))
+            conn.commit()
+        finally:
+            conn.close()
+    except Exception as e:
+        # The login already succeeded, the upgrade is retried next time
+        print(f"Error upgrading password hash: {e}")
@@ -0,0 +1,55 @@
+from concurrent.futures import ThreadPoolExecutor
+import tkinter as tk
+
+# Password hashing runs here so the Tk thread never waits on a key derivation,
+# hashlib releases the GIL while hashing so the window keeps redrawing
+_auth_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="auth-worker")
+
+# How often the Tk thread checks for a finished task, in milliseconds
+POLL_INTERVAL_MS = 20
+
+def run_auth_task(widget, task, args=(), on_done=None, on_error=None):
+    """Run a slow authentication task in the background and deliver its result on the Tk thread.
+    
+    Args:
+        widget: Widget used to schedule polling, the result is dropped if it is destroyed
+        task: Function to run, e.g. authenticate_user or update_user_password
+        args: Positional arguments for task
+        on_done: Called on the Tk thread with the task's return value
+        on_error: Called on the Tk thread with the exception if the task raised
+        
+    Returns:
+        Future: Future of the background task
+        
+    Note:
+        Results are handed back through widget.after, so callbacks can
+        update widgets safely. Callers should show a busy state (e.g.
+        "Signing in...") and ignore repeat submissions until a callback runs.
+    """
+    future = _auth_executor.submit(task, *args)
+
+    def check_result():
+        """Poll the background task and hand over the result once done."""
+        try:
+            if not widget.winfo_exists():
+                return
+        except tk.TclError:
+            return
+
+        if not future.done():
+            widget.after(POLL_INTERVAL_MS, check_result)
+            return
+
+        try:
+            result = future.result()
+        except Exception as e:
+            if on_error:
+                on_error(e)
+            else:
+                print(f"Error during authentication task: {e}")
+            return
+        if on_done:
+            on_done(result)
+
+    widget.after(POLL_INTERVAL_MS, check_result)
+    return future
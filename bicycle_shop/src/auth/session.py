@@ -0,0 +1,124 @@
+from src.database.core.connection import get_connection
+from src.database.core.changes import get_data_versions
+
+def start_session(global_state, user_id, username, first_name, last_name, is_admin):
+    """Create the session of a user who has just signed in.
+
+    Args:
+        global_state: Application state dictionary
+        user_id: ID of the signed in user
+        username: Username of the signed in user
+        first_name: User's first name
+        last_name: User's last name
+        is_admin: Whether the user has admin privileges
+
+    Returns:
+        dict: The new session, see get_session
+
+    Note:
+        The current_* keys of global_state are kept in step with the
+        session so existing readers see the same values.
+    """
+    session = {
+        'user_id': user_id,
+        'username': username,
+        'first_name': first_name,
+        'last_name': last_name,
+        'is_admin': bool(is_admin),
+        # Users version the details were read at, any later user change triggers a reload
+        'users_version': get_data_versions('users')[0]
+    }
+    global_state['session'] = session
+    _sync_global_state(global_state, session)
+    return session
+
+def get_session(global_state):
+    """Get the signed in user's session.
+
+    Args:
+        global_state: Application state dictionary
+
+    Returns:
+        dict | None: Session with user_id, username, first_name, last_name
+                     and is_admin, None if nobody is signed in
+
+    Note:
+        Served from memory while no user has changed. Promoting, demoting,
+        updating or deleting users marks the 'users' domain changed, the
+        next call then reloads the user's row once so role and header data
+        are never stale. A user deleted meanwhile ends the session.
+    """
+    session = global_state.get('session')
+    if session is None:
+        return None
+
+    version = get_data_versions('users')[0]
+    if session['users_version'] != version:
+        session = _reload_session(global_state, session, version)
+    return session
+
+def is_session_admin(global_state):
+    """Check whether the signed in user has admin privileges.
+
+    Args:
+        global_state: Application state dictionary
+
+    Returns:
+        bool: True if a user is signed in and is an admin
+    """
+    session = get_session(global_state)
+    return bool(session and session['is_admin'])
+
+def end_session(global_state):
+    """Forget the signed in user, called on logout.
+
+    Args:
+        global_state: Application state dictionary
+    """
+    global_state['session'] = None
+    _sync_global_state(global_state, None)
+
+def _reload_session(global_state, session, version):
+    """Re-read the session user's details after a change to the users."""
+    conn = get_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute("SELECT username, first_name, last_name, is_admin FROM Users WHERE id = ?",
+                       (session['user_id'],))
+        row = cursor.fetchone()
+    finally:
+        conn.close()
+
+    if not row:
+        end_session(global_state)
+        return None
+
+    username, first_name, last_name, is_admin = row
+    session.update({
+        'username': username,
+        'first_name': first_name,
+        'last_name': last_name,
+        'is_admin': bool(is_admin),
+        'users_version': version
+    })
+    _sync_global_state(global_state, session)
+    return session
+
+def _sync_global_state(global_state, session):
+    """Mirror the session into the current_* keys of global_state."""
+    if session is None:
+        global_state.update({
+            'current_username': None,
+            'current_first_name': None,
+            'current_last_name': None,
+            'current_user_id': None,
+            'current_admin_id': None
+        })
+        return
+    global_state.update({
+        'current_username': session['username'],
+        'current_first_name': session['first_name'],
+        'current_last_name': session['last_name'],
+        'current_user_id': session['user_id'],
+        'current_admin_id': session['user_id'] if session['is_admin'] else None
+    })
@@ -0,0 +1,229 @@
+import platform
+import threading
+import time
+
+from src.database.core.connection import get_connection
+from src.database.logging.alerts import record_alert_events, current_minute
+from src.file_system.config.config_manager import get_security_settings
+
+# Failure timestamps per (scope, key), scope is 'user' or 'terminal'
+_failures = {}
+# Keys whose persisted failures have already been loaded
+_loaded_keys = set()
+_throttle_lock = threading.Lock()
+
+class LoginThrottledError(Exception):
+    """Raised when a login attempt is refused before the password is checked.
+
+    Attributes:
+        retry_after: Seconds until another attempt is allowed
+        locked: True for a lockout, False for a short backoff delay
+    """
+
+    def __init__(self, retry_after, locked):
+        self.retry_after = retry_after
+        self.locked = locked
+        seconds = max(1, int(retry_after + 0.999))
+        if locked:
+            message = f"Too many failed attempts, try again in {_describe_wait(seconds)}"
+        else:
+            message = f"Please wait {_describe_wait(seconds)} before trying again"
+        super().__init__(message)
+
+def get_terminal_id():
+    """Get the identifier of this terminal (till) for per-terminal throttling.
+
+    Returns:
+        str: Network name of the machine
+    """
+    return platform.node() or "local"
+
+def check_login_allowed(username, terminal=None):
+    """Refuse a login attempt if its username or terminal is throttled.
+
+    Args:
+        username: Username being signed in to
+        terminal: Terminal identifier (default: get_terminal_id())
+
+    Raises:
+        LoginThrottledError: If the attempt must wait for a backoff delay or lockout
+
+    Note:
+        Only touches in-memory counters once a key is loaded, so refused
+        attempts cost microseconds instead of a key derivation. Accounts
+        lock after login_max_failures, terminals only back off so one
+        person guessing at a till cannot lock everyone else out of it.
+    """
+    settings = get_security_settings()
+    now = time.time()
+    for scope, key in _throttle_keys(username, terminal):
+        failures = _get_failures(scope, key, settings, now)
+        if scope == 'user':
+            if len(failures) >= settings['login_max_failures']:
+                retry_after = failures[-1] + settings['login_lockout_minutes'] * 60 - now
+                if retry_after > 0:
+                    raise LoginThrottledError(retry_after, locked=True)
+                continue
+            # Exponential backoff between attempts against the same account: 1s, 2s, 4s...
+            excess = len(failures)
+        else:
+            # A shared till is never locked, that would lock out every account on it,
+            # past its limit attempts from it back off instead
+            excess = len(failures) - settings['login_terminal_max_failures'] + 1
+        if excess <= 0:
+            continue
+        delay = min(2 ** (excess - 1), settings['login_backoff_max_seconds'])
+        retry_after = failures[-1] + delay - now
+        if retry_after > 0:
+            raise LoginThrottledError(retry_after, locked=False)
+
+def record_login_failure(username, terminal=None):
+    """Count a failed login against the username and terminal.
+
+    Args:
+        username: Username that failed to sign in
+        terminal: Terminal identifier (default: get_terminal_id())
+
+    Note:
+        A failure that starts a lockout is added to the 'login_lockouts'
+        alert bucket for the dashboard.
+    """
+    settings = get_security_settings()
+    now = time.time()
+    lockouts = 0
+    for scope, key in _throttle_keys(username, terminal):
+        failures = _get_failures(scope, key, settings, now)
+        with _throttle_lock:
+            failures.append(now)
+        if scope == 'user' and len(failures) >= settings['login_max_failures']:
+            # Attempts are refused while locked, so reaching the limit always starts a new lockout
+            lockouts += 1
+
+    if not settings['login_throttle_persist'] and not lockouts:
+        return
+    conn = get_connection()
+    try:
+        cursor = conn.cursor()
+        if settings['login_throttle_persist']:
+            cursor.executemany("INSERT INTO LoginFailures (scope, key, attempted_at) VALUES (?, ?, ?)",
+                               [(scope, key, now) for scope, key in _throttle_keys(username, terminal)])
+            # Failures older than the window no longer count, keep the table small
+            cursor.execute("DELETE FROM LoginFailures WHERE attempted_at < ?",
+                           (now - settings['login_failure_window_minutes'] * 60,))
+        if lockouts:
+            record_alert_events(cursor, {('login_lockouts', current_minute()): lockouts})
+        conn.commit()
+    except Exception as e:
+        print(f"Error recording login failure: {e}")
+    finally:
+        conn.close()
+
+def record_login_success(username):
+    """Clear the failure history of a username after it signs in.
+
+    Args:
+        username: Username that signed in
+
+    Note:
+        Terminal counters are not reset so one valid account cannot be
+        used to clear the history of attempts against others.
+    """
+    _clear_failures(username)
+
+def unlock_account(username):
+    """Lift the lockout of a username before it expires.
+
+    Args:
+        username: Username to unlock, as listed by get_locked_accounts
+    """
+    _clear_failures(username, force=True)
+
+def get_locked_accounts():
+    """List usernames currently locked out.
+
+    Returns:
+        list: (username, seconds remaining) tuples, longest remaining first
+
+    Note:
+        Reads the persisted failures when they are kept, so accounts locked
+        before a restart are listed too.
+    """
+    settings = get_security_settings()
+    now = time.time()
+    lockout = settings['login_lockout_minutes'] * 60
+    window_start = now - settings['login_failure_window_minutes'] * 60
+
+    if settings['login_throttle_persist']:
+        conn = get_connection()
+        try:
+            snapshot = conn.execute("""
+                SELECT key, COUNT(*), MAX(attempted_at) FROM LoginFailures
+                WHERE scope = 'user' AND attempted_at >= ?
+                GROUP BY key
+            """, (window_start,)).fetchall()
+        finally:
+            conn.close()
+    else:
+        with _throttle_lock:
+            snapshot = [
+                (key, len([t for t in times if t >= window_start]), times[-1])
+                for (scope, key), times in _failures.items() if scope == 'user' and times
+            ]
+    locked = [
+        (key, last_failure + lockout - now) for key, count, last_failure in snapshot
+        if count >= settings['login_max_failures'] and last_failure + lockout > now
+    ]
+    return sorted(locked, key=lambda account: account[1], reverse=True)
+
+def _clear_failures(username, force=False):
+    """Forget the failures of a username in memory and, when persisted, in the database."""
+    key = ('user', (username or "").lower())
+    with _throttle_lock:
+        had_failures = bool(_failures.pop(key, None))
+        _loaded_keys.add(key)
+
+    # Failures persisted before a restart may not have been loaded yet
+    if (had_failures or force) and get_security_settings()['login_throttle_persist']:
+        conn = get_connection()
+        try:
+            conn.execute("DELETE FROM LoginFailures WHERE scope = ? AND key = ?", key)
+            conn.commit()
+        finally:
+            conn.close()
+
+def _throttle_keys(username, terminal):
+    """Get the (scope, key) pairs an attempt is counted under."""
+    return [('user', (username or "").lower()), ('terminal', terminal or get_terminal_id())]
+
+def _get_failures(scope, key, settings, now):
+    """Get the failure timestamps of a key inside the window, loading persisted ones on first use."""
+    cache_key = (scope, key)
+    window_start = now - settings['login_failure_window_minutes'] * 60
+
+    if settings['login_throttle_persist'] and cache_key not in _loaded_keys:
+        conn = get_connection()
+        try:
+            rows = conn.execute("""
+                SELECT attempted_at FROM LoginFailures
+                WHERE scope = ? AND key = ? AND attempted_at >= ?
+                ORDER BY attempted_at
+            """, (scope, key, window_start)).fetchall()
+        finally:
+            conn.close()
+        with _throttle_lock:
+            _failures[cache_key] = [row[0] for row in rows]
+            _loaded_keys.add(cache_key)
+
+    with _throttle_lock:
+        failures = _failures.setdefault(cache_key, [])
+        # Drop failures that have slid out of the window
+        while failures and failures[0] < window_start:
+            failures.pop(0)
+        return failures
+
+def _describe_wait(seconds):
+    """Describe a wait for messages (e.g. "5 seconds", "3 minutes")."""
+    if seconds < 60:
+        return f"{seconds} second{'s' if seconds != 1 else ''}"
+    minutes = (seconds + 59) // 60
+    return f"{minutes} minute{'s' if minutes != 1 else ''}"
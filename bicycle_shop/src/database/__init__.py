@@ -1,9 +1,10 @@
 from .core import get_connection, create_tables
 from .users import (
-    initialize_admin, get_current_user_admin_status, get_all_users,
+    initialize_admin, get_current_user_admin_status, get_all_users, get_users_page,
     update_user_details, get_username_by_id, get_user_id_by_username,
     delete_user, promote_user_to_admin, demote_user_from_admin,
-    register_user, update_user_password
+    register_user, update_user_password,
+    import_users, export_users
 )
 from .products import (
     add_product, update_product, delete_product, list_product,
@@ -14,26 +15,34 @@ from .categories import (
     update_category, delete_category
 )
 from .cart import (
-    add_to_cart, get_cart_items, update_cart_quantity
+    add_to_cart, get_cart_items, update_cart_quantity, get_available_stock,
+    get_cart_lines, get_cart_summary, get_cart_model, apply_cart_changes
 )
 from .discounts import (
     add_discount, update_discount, toggle_discount_status,
     delete_discount, get_all_discounts, increment_discount_uses,
-    verify_discount_qr
+    verify_discount_qr, lookup_discount
+)
+from .orders import (
+    new_checkout_token, checkout, get_order, get_user_orders
 )
 from .logging import (
-    log_user_action, log_admin_action, export_logs_to_temp_file,
-    get_dashboard_stats, get_dashboard_alerts
+    log_user_action, log_admin_action, export_logs, write_logs_csv,
+    write_logs_jsonl, write_logs_text,
+    get_log_page, get_logs_since, get_dashboard_stats, get_dashboard_alerts,
+    flush_logs, stop_log_writer, archive_old_logs, start_log_retention,
+    list_archive_months, read_archived_logs, iter_archived_log_rows
 )
 
 __all__ = [
     # Core
     'get_connection', 'create_tables',
     # Users
-    'initialize_admin', 'get_current_user_admin_status', 'get_all_users',
+    'initialize_admin', 'get_current_user_admin_status', 'get_all_users', 'get_users_page',
     'update_user_details', 'get_username_by_id', 'get_user_id_by_username',
     'delete_user', 'promote_user_to_admin', 'demote_user_from_admin',
-    'register_user', 'update_user_password'
+    'register_user', 'update_user_password',
+    'import_users', 'export_users',
     # Products
     'add_product', 'update_product', 'delete_product', 'list_product',
     'get_products', 'get_product_by_id',
@@ -41,12 +50,18 @@ __all__ = [
     'add_category', 'get_categories', 'get_category_id', 'get_category_name',
     'update_category', 'delete_category',
     # Cart
-    'add_to_cart', 'get_cart_items', 'update_cart_quantity',
+    'add_to_cart', 'get_cart_items', 'update_cart_quantity', 'get_available_stock',
+    'get_cart_lines', 'get_cart_summary', 'get_cart_model', 'apply_cart_changes',
     # Discounts
     'add_discount', 'update_discount', 'toggle_discount_status',
     'delete_discount', 'get_all_discounts', 'increment_discount_uses',
-    'verify_discount_qr',
+    'verify_discount_qr', 'lookup_discount',
+    # Orders
+    'new_checkout_token', 'checkout', 'get_order', 'get_user_orders',
     # Logging
-    'log_user_action', 'log_admin_action', 'export_logs_to_temp_file',
-    'get_dashboard_stats', 'get_dashboard_alerts'
+    'log_user_action', 'log_admin_action', 'export_logs', 'write_logs_csv',
+    'write_logs_jsonl', 'write_logs_text',
+    'get_log_page', 'get_logs_since', 'get_dashboard_stats', 'get_dashboard_alerts',
+    'flush_logs', 'stop_log_writer', 'archive_old_logs', 'start_log_retention',
+    'list_archive_months', 'read_archived_logs', 'iter_archived_log_rows'
 ]
\ No newline at end of file
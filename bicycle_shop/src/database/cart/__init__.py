@@ -1,11 +1,35 @@
 from .cart_manager import (
     add_to_cart,
     get_cart_items,
-    update_cart_quantity
+    get_cart_lines,
+    get_cart_summary,
+    update_cart_quantity,
+    apply_cart_changes
+)
+from .cart_model import (
+    get_cart_model,
+    discard_cart_model
+)
+from .reservations import (
+    get_available_stock,
+    release_reservations,
+    sweep_expired_reservations,
+    start_reservation_sweeper,
+    stop_reservation_sweeper
 )
 
 __all__ = [
     'add_to_cart',
     'get_cart_items',
-    'update_cart_quantity'
+    'get_cart_lines',
+    'get_cart_summary',
+    'update_cart_quantity',
+    'apply_cart_changes',
+    'get_cart_model',
+    'discard_cart_model',
+    'get_available_stock',
+    'release_reservations',
+    'sweep_expired_reservations',
+    'start_reservation_sweeper',
+    'stop_reservation_sweeper'
 ]
\ No newline at end of file
@@ -1,4 +1,11 @@
+import time
+
 from src.database.core.connection import get_connection
+from src.database.core.changes import mark_changed
+from src.database.cart.reservations import (
+    HELD_BY_OTHERS_SQL, held_by_others_sql, hold_expiry, hold_stock, release_reservations
+)
+from src.database.cart.cart_model import get_cart_model, update_cart_model
 
 def add_to_cart(user_id, product_id, quantity=1):
     """Add or update product quantity in user's cart.
@@ -9,55 +16,49 @@ def add_to_cart(user_id, product_id, quantity=1):
         quantity: Amount to add (default: 1)
         
     Returns:
-        tuple: (success, message)
+        tuple: (success, message, quantity)
             - success: True if operation succeeded
             - message: Success/error message
+            - quantity: Quantity of the product now in the cart, None if nothing changed
             
     Note:
         Will update quantity if product already exists in cart.
-        Validates against available product stock.
+        A single upsert on the (user_id, product_id) unique index checks
+        available stock (stock minus other carts' active holds) and writes
+        the row together under the write lock, so concurrent adds from
+        several tills can never exceed stock. The cart line then holds its
+        full quantity for cart_hold_minutes.
     """
+    now, expires_at = time.time(), hold_expiry()
+    held_params = (product_id, now, user_id)
     conn = get_connection()
-    cursor = conn.cursor()
-    
-    # Check if product already exists in user's cart for update vs insert decision
-    cursor.execute("""
-        SELECT quantity FROM ShoppingCart 
-        WHERE user_id = ? AND product_id = ?
-    """, (user_id, product_id))
-    result = cursor.fetchone()
-    
-    # Verify sufficient stock is available before adding/updating
-    cursor.execute("SELECT stock FROM Products WHERE id = ?", (product_id,))
-    stock = cursor.fetchone()[0]
-    
-    # Update existing cart item quantity
-    if result:
-        new_quantity = result[0] + quantity
-        if new_quantity > stock:
-            conn.close()
-            return False, "Cannot add more than available stock"
-        
-        # Using parameterized query to prevent SQL injection
-        cursor.execute("""
-            UPDATE ShoppingCart 
-            SET quantity = ?
-            WHERE user_id = ? AND product_id = ?
-        """, (new_quantity, user_id, product_id))
-    # Insert new cart item
-    else:
-        if quantity > stock:
-            conn.close() 
-            return False, "Cannot add more than available stock"
-            
-        cursor.execute("""
+    try:
+        # Take the write lock up front so the stock read and the write cannot interleave with another till
+        conn.execute("BEGIN IMMEDIATE")
+        cursor = conn.cursor()
+        # Insert only if the product has the stock, otherwise add to the existing row if the total still fits
+        cursor.execute(f"""
             INSERT INTO ShoppingCart (user_id, product_id, quantity)
-            VALUES (?, ?, ?)
-        """, (user_id, product_id, quantity))
-    
-    conn.commit()
-    conn.close()
-    return True, "Product added to cart"
+            SELECT ?, id, ? FROM Products WHERE id = ? AND stock - {HELD_BY_OTHERS_SQL} >= ?
+            ON CONFLICT(user_id, product_id) DO UPDATE
+                SET quantity = quantity + excluded.quantity
+                WHERE quantity + excluded.quantity <=
+                    (SELECT stock FROM Products WHERE id = excluded.product_id) - {HELD_BY_OTHERS_SQL}
+            RETURNING quantity
+        """, (user_id, quantity, product_id) + held_params + (quantity,) + held_params)
+        row = cursor.fetchone()
+        if row is not None:
+            hold_stock(cursor, user_id, product_id, row[0], expires_at)
+        conn.commit()
+    finally:
+        conn.close()
+
+    if row is None:
+        # Either the product is out of stock or the cart already holds all of it
+        return False, "Cannot add more than available stock", None
+    update_cart_model(user_id, product_id, row[0])
+    mark_changed('cart')
+    return True, "Product added to cart", row[0]
 
 def get_cart_items(user_id):
     """Get all items in user's cart with product details.
@@ -85,6 +86,76 @@ def get_cart_items(user_id):
     conn.close()
     return items
 
+def get_cart_lines(user_id):
+    """Get the lines of a user's cart with only the columns the cart shows.
+    
+    Args:
+        user_id: ID of the user whose cart to retrieve
+        
+    Returns:
+        list: (product_id, name, price, image, quantity) tuples in the
+              order products were added
+              
+    Note:
+        Leaner than get_cart_items, descriptions and QR paths are not read.
+    """
+    conn = get_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT p.id, p.name, p.price, p.image, c.quantity
+            FROM ShoppingCart c
+            JOIN Products p ON c.product_id = p.id
+            WHERE c.user_id = ?
+            ORDER BY c.id
+        """, (user_id,))
+        return cursor.fetchall()
+    finally:
+        conn.close()
+
+def get_cart_summary(user_id, discount_id=None):
+    """Get the totals of a user's cart, with an optional discount preview.
+    
+    Args:
+        user_id: ID of the user whose cart to total
+        discount_id: ID of a discount to preview (optional, ignored if inactive)
+        
+    Returns:
+        dict: Cart totals:
+            - item_count: Total quantity of all lines
+            - subtotal: Price of all lines before discounts
+            - discount_percentage: Percentage of the discount, 0 if none applies
+            - discount_amount: Amount taken off the subtotal
+            - total: Amount to pay
+            
+    Note:
+        Computed by one aggregate query, no product rows are returned.
+        Rounded the same way checkout rounds the placed order.
+    """
+    conn = get_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT COALESCE(SUM(c.quantity), 0),
+                   ROUND(COALESCE(SUM(c.quantity * p.price), 0), 2),
+                   COALESCE((SELECT percentage FROM Discounts WHERE id = ? AND active = 1), 0)
+            FROM ShoppingCart c
+            JOIN Products p ON c.product_id = p.id
+            WHERE c.user_id = ?
+        """, (discount_id, user_id))
+        item_count, subtotal, percentage = cursor.fetchone()
+    finally:
+        conn.close()
+
+    discount_amount = round(subtotal * percentage / 100, 2)
+    return {
+        'item_count': item_count,
+        'subtotal': subtotal,
+        'discount_percentage': percentage,
+        'discount_amount': discount_amount,
+        'total': round(subtotal - discount_amount, 2)
+    }
+
 def update_cart_quantity(user_id, product_id, quantity):
     """Update quantity of item in cart.
     
@@ -94,39 +165,122 @@ def update_cart_quantity(user_id, product_id, quantity):
         quantity: New quantity (0 removes item)
         
     Returns:
-        tuple: (success, message)
+        tuple: (success, message, quantity)
             - success: True if operation succeeded
             - message: Success/error message
+            - quantity: Quantity of the product now in the cart (0 once removed),
+                        None if nothing changed
             
     Note:
-        Quantity of 0 removes item from cart.
-        Validates against available product stock.
+        Quantity of 0 removes item from cart and releases its hold.
+        The availability check is part of the UPDATE so it cannot go stale
+        between checking and writing, a successful update refreshes the hold.
     """
+    now, expires_at = time.time(), hold_expiry()
     conn = get_connection()
-    cursor = conn.cursor()
-    
-    # Remove item if quantity is 0 or less
-    if quantity <= 0:
-        cursor.execute("""
-            DELETE FROM ShoppingCart 
-            WHERE user_id = ? AND product_id = ?
-        """, (user_id, product_id))
-    else:
-        # Verify stock availability before updating
-        cursor.execute("SELECT stock FROM Products WHERE id = ?", (product_id,))
-        stock = cursor.fetchone()[0]
-        
-        if quantity > stock:
-            conn.close()
-            return False, "Quantity exceeds available stock"
-        
-        # Update quantity using parameterized query for security
-        cursor.execute("""
-            UPDATE ShoppingCart 
-            SET quantity = ?
-            WHERE user_id = ? AND product_id = ?
-        """, (quantity, user_id, product_id))
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        cursor = conn.cursor()
+        if quantity <= 0:
+            # Remove item if quantity is 0 or less
+            cursor.execute("""
+                DELETE FROM ShoppingCart 
+                WHERE user_id = ? AND product_id = ?
+            """, (user_id, product_id))
+            release_reservations(cursor, user_id, [product_id])
+            row = (0,)
+        else:
+            # Only applied when the new quantity fits the stock not held by other carts
+            cursor.execute(f"""
+                UPDATE ShoppingCart 
+                SET quantity = ?
+                WHERE user_id = ? AND product_id = ?
+                  AND ? <= (SELECT stock FROM Products WHERE id = ?) - {HELD_BY_OTHERS_SQL}
+                RETURNING quantity
+            """, (quantity, user_id, product_id, quantity, product_id, product_id, now, user_id))
+            row = cursor.fetchone()
+            if row is not None:
+                hold_stock(cursor, user_id, product_id, row[0], expires_at)
+        conn.commit()
+    finally:
+        conn.close()
+
+    if row is None:
+        return False, "Quantity exceeds available stock", None
+    update_cart_model(user_id, product_id, row[0])
+    mark_changed('cart')
+    return True, "Cart updated", row[0]
+
+def apply_cart_changes(user_id, changes):
+    """Set the quantities of several cart lines at once.
     
-    conn.commit()
-    conn.close()
-    return True, "Cart updated"
\ No newline at end of file
+    Args:
+        user_id: ID of the user whose cart to change
+        changes: Iterable of (product_id, quantity) pairs, a quantity of 0
+                 removes the line and a later pair for the same product
+                 replaces an earlier one
+                 
+    Returns:
+        tuple: (success, message, cart)
+            - success: True if every change was applied
+            - message: Success/error message
+            - cart: The user's cart after the call, see get_cart_model
+            
+    Note:
+        All or nothing: every line is checked against the stock not held
+        by other carts in one query and all are written in one BEGIN
+        IMMEDIATE transaction, if any line does not fit nothing changes.
+        Kept lines have their holds refreshed, removed lines release them.
+    """
+    # Coalesce repeated changes to the same product, the last one wins
+    quantities = {}
+    for product_id, quantity in changes:
+        quantities[product_id] = max(quantity, 0)
+    if not quantities:
+        return True, "Cart updated", get_cart_model(user_id)
+
+    now, expires_at = time.time(), hold_expiry()
+    values = ", ".join("(?, ?)" for _ in quantities)
+    params = [value for change in quantities.items() for value in change]
+    conn = get_connection()
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        cursor = conn.cursor()
+        # Check every line in one pass while holding the write lock
+        cursor.execute(f"""
+            WITH changes(product_id, quantity) AS (VALUES {values})
+            SELECT changes.product_id, changes.quantity, p.name,
+                   p.stock - {held_by_others_sql('changes.product_id')}
+            FROM changes
+            LEFT JOIN Products p ON p.id = changes.product_id
+        """, params + [now, user_id])
+        for product_id, quantity, name, available in cursor.fetchall():
+            if quantity == 0:
+                continue
+            if name is None:
+                conn.rollback()
+                return False, "Product no longer exists", get_cart_model(user_id)
+            if quantity > available:
+                conn.rollback()
+                return False, f"Only {max(available, 0)} of {name} available", get_cart_model(user_id)
+
+        removed = [product_id for product_id, quantity in quantities.items() if quantity == 0]
+        kept = [(product_id, quantity) for product_id, quantity in quantities.items() if quantity > 0]
+        cursor.executemany("DELETE FROM ShoppingCart WHERE user_id = ? AND product_id = ?",
+                           [(user_id, product_id) for product_id in removed])
+        release_reservations(cursor, user_id, removed)
+        cursor.executemany("""
+            INSERT INTO ShoppingCart (user_id, product_id, quantity)
+            VALUES (?, ?, ?)
+            ON CONFLICT(user_id, product_id) DO UPDATE SET quantity = excluded.quantity
+        """, [(user_id, product_id, quantity) for product_id, quantity in kept])
+        for product_id, quantity in kept:
+            hold_stock(cursor, user_id, product_id, quantity, expires_at)
+        conn.commit()
+    finally:
+        conn.close()
+
+    for product_id, quantity in quantities.items():
+        update_cart_model(user_id, product_id, quantity)
+    mark_changed('cart')
+    return True, "Cart updated", get_cart_model(user_id)
@@ -0,0 +1,79 @@
+from src.database.core.changes import get_data_versions
+
+# Loaded carts by user ID: {'lines': {product_id: line dict}, 'products_version': int}
+# Lines keep the order products were first added in
+_cart_models = {}
+
+def get_cart_model(user_id):
+    """Get the in-memory cart of a user, loading it on first use.
+
+    Args:
+        user_id: ID of the user whose cart to get
+
+    Returns:
+        dict: Cart with:
+            - lines: {product_id: {'name', 'price', 'image', 'quantity'}}
+            - item_count: Total quantity of all lines
+            - subtotal: Price of all lines before discounts
+
+    Note:
+        The cart managers apply every successful mutation to the loaded
+        cart, so it is only read from the database again after a product
+        change (a new price, a deleted product) or once discarded.
+        Treat the result as read only.
+    """
+    products_version = get_data_versions('products')[0]
+    model = _cart_models.get(user_id)
+    if model is None or model['products_version'] != products_version:
+        # Imported here, cart_manager imports this module
+        from src.database.cart.cart_manager import get_cart_lines
+        lines = {
+            product_id: {'name': name, 'price': price, 'image': image, 'quantity': quantity}
+            for product_id, name, price, image, quantity in get_cart_lines(user_id)
+        }
+        model = {'lines': lines, 'products_version': products_version}
+        _summarize(model)
+        _cart_models[user_id] = model
+    return model
+
+def update_cart_model(user_id, product_id, quantity):
+    """Apply a committed quantity change to a loaded cart.
+
+    Args:
+        user_id: ID of the user whose cart changed
+        product_id: ID of the changed product
+        quantity: Quantity now in the database, 0 once removed
+
+    Note:
+        A product not yet in the loaded cart discards it instead, its name
+        and price are read with the rest of the cart on the next use.
+    """
+    model = _cart_models.get(user_id)
+    if model is None:
+        return
+    lines = model['lines']
+    if quantity <= 0:
+        lines.pop(product_id, None)
+    elif product_id in lines:
+        lines[product_id]['quantity'] = quantity
+    else:
+        discard_cart_model(user_id)
+        return
+    _summarize(model)
+
+def discard_cart_model(user_id=None):
+    """Forget loaded carts so they are read again on next use.
+
+    Args:
+        user_id: User whose cart to forget, None forgets every cart
+    """
+    if user_id is None:
+        _cart_models.clear()
+    else:
+        _cart_models.pop(user_id, None)
+
+def _summarize(model):
+    """Recompute the item count and subtotal of a cart from its lines."""
+    lines = model['lines'].values()
+    model['item_count'] = sum(line['quantity'] for line in lines)
+    model['subtotal'] = round(sum(line['price'] * line['quantity'] for line in lines), 2)
@@ -0,0 +1,143 @@
+import threading
+import time
+
+from src.database.core.connection import get_connection
+from src.file_system.config.config_manager import get_store_settings
+
+def held_by_others_sql(product_expr):
+    """Build the subquery totalling other users' unexpired holds of a product.
+
+    Args:
+        product_expr: SQL expression for the product ID, a column of the
+                      outer query to correlate with or '?'
+
+    Returns:
+        str: Parenthesised subquery taking (now, user_id) after any
+             parameters of product_expr, served by idx_reservations_product
+    """
+    return f"""(
+    SELECT COALESCE(SUM(quantity), 0) FROM StockReservations
+    WHERE product_id = {product_expr} AND expires_at > ? AND user_id != ?
+)"""
+
+# Quantity of a product held by other users' unexpired reservations.
+# Parameters: (product_id, now, user_id).
+HELD_BY_OTHERS_SQL = held_by_others_sql('?')
+
+_sweeper_thread = None
+_sweeper_stop = threading.Event()
+
+def hold_expiry():
+    """Get the expiry time for a hold created or refreshed now.
+
+    Returns:
+        float: Unix timestamp cart_hold_minutes from now
+    """
+    return time.time() + get_store_settings()['cart_hold_minutes'] * 60
+
+def hold_stock(cursor, user_id, product_id, quantity, expires_at):
+    """Create or refresh the hold of a cart line.
+
+    Args:
+        cursor: Cursor of the caller's open transaction
+        user_id: ID of the user holding the stock
+        product_id: ID of the held product
+        quantity: Total quantity held, the user's full cart quantity of the product
+        expires_at: Unix timestamp the hold lapses at
+    """
+    cursor.execute("""
+        INSERT INTO StockReservations (user_id, product_id, quantity, expires_at)
+        VALUES (?, ?, ?, ?)
+        ON CONFLICT(user_id, product_id) DO UPDATE
+            SET quantity = excluded.quantity, expires_at = excluded.expires_at
+    """, (user_id, product_id, quantity, expires_at))
+
+def release_reservations(cursor, user_id, product_ids=None):
+    """Release a user's holds, on removal from the cart or at checkout.
+
+    Args:
+        cursor: Cursor of the caller's open transaction
+        user_id: ID of the user whose holds are released
+        product_ids: Products to release, None for every hold of the user
+    """
+    if product_ids is None:
+        cursor.execute("DELETE FROM StockReservations WHERE user_id = ?", (user_id,))
+    else:
+        cursor.executemany("DELETE FROM StockReservations WHERE user_id = ? AND product_id = ?",
+                           [(user_id, product_id) for product_id in product_ids])
+
+def get_available_stock(product_id, user_id=None):
+    """Get the stock of a product not held by other carts.
+
+    Args:
+        product_id: ID of the product
+        user_id: User whose own holds count as available to them (None counts every hold)
+
+    Returns:
+        int | None: Stock minus active holds, None if the product does not exist
+    """
+    conn = get_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute(f"SELECT stock - {HELD_BY_OTHERS_SQL} FROM Products WHERE id = ?",
+                       (product_id, time.time(), -1 if user_id is None else user_id, product_id))
+        row = cursor.fetchone()
+        return max(row[0], 0) if row else None
+    finally:
+        conn.close()
+
+def sweep_expired_reservations():
+    """Delete holds whose time has passed.
+
+    Returns:
+        int: Number of holds removed
+
+    Note:
+        Expired holds are already ignored by every availability check,
+        sweeping only keeps the table and its index small.
+    """
+    conn = get_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute("DELETE FROM StockReservations WHERE expires_at <= ?", (time.time(),))
+        conn.commit()
+        return cursor.rowcount
+    finally:
+        conn.close()
+
+def start_reservation_sweeper(interval=None):
+    """Sweep expired holds on a background thread until stopped.
+
+    Args:
+        interval: Seconds between sweeps (default: reservation_sweep_seconds from config)
+
+    Returns:
+        Thread: The running sweeper thread
+    """
+    global _sweeper_thread
+    if interval is None:
+        interval = get_store_settings()['reservation_sweep_seconds']
+    if _sweeper_thread is not None and _sweeper_thread.is_alive():
+        return _sweeper_thread
+
+    _sweeper_stop.clear()
+
+    def run():
+        # Wait first, startup already has enough database work
+        while not _sweeper_stop.wait(interval):
+            try:
+                sweep_expired_reservations()
+            except Exception as e:
+                print(f"Error sweeping stock reservations: {e}")
+
+    _sweeper_thread = threading.Thread(target=run, name="reservation-sweeper", daemon=True)
+    _sweeper_thread.start()
+    return _sweeper_thread
+
+def stop_reservation_sweeper():
+    """Stop the sweeper thread, called when the application closes."""
+    global _sweeper_thread
+    _sweeper_stop.set()
+    if _sweeper_thread is not None:
+        _sweeper_thread.join(timeout=5)
+        _sweeper_thread = None
@@ -1,5 +1,6 @@
 import sqlite3
 from src.database.core.connection import get_connection
+from src.database.core.changes import mark_changed
 
 def add_category(name):
     """Add a new category to the database.
@@ -22,6 +23,7 @@ def add_category(name):
         # Use parameterized query to prevent SQL injection
         cursor.execute("INSERT INTO Categories (name) VALUES (?)", (name,))
         conn.commit()
+        mark_changed('categories')
         return True, "Category added successfully!"
     except sqlite3.IntegrityError:
         # Return specific error for duplicate category names
@@ -100,6 +102,7 @@ def update_category(category_id, new_name):
         # Use parameterized query to prevent SQL injection
         cursor.execute("UPDATE Categories SET name = ? WHERE id = ?", (new_name, category_id))
         conn.commit()
+        mark_changed('categories')
         return True, "Category updated successfully!"
     except sqlite3.Error as e:
         return False, f"Failed to update category: {str(e)}"
@@ -138,6 +141,8 @@ def delete_category(category_id):
         # Then delete the category after products are updated
         cursor.execute("DELETE FROM Categories WHERE id = ?", (category_id,))
         conn.commit()
+        # Products are unlisted as part of the delete so both domains change
+        mark_changed('categories', 'products')
         return True, "Category deleted successfully and associated products unlisted!"
     except sqlite3.Error as e:
         return False, f"Failed to delete category: {str(e)}"
@@ -1,7 +1,10 @@
 from .connection import get_connection
 from .schema import create_tables
+from .changes import mark_changed, get_data_versions
 
 __all__ = [
     'get_connection',
-    'create_tables'
-]
\ No newline at end of file
+    'create_tables',
+    'mark_changed',
+    'get_data_versions'
+]
@@ -0,0 +1,33 @@
+import threading
+
+# Version counter per data domain (products, categories, cart, users, ...)
+# Bumped by the database managers on every mutation so caches can detect stale data
+_data_versions = {}
+_versions_lock = threading.Lock()
+
+def mark_changed(*domains):
+    """Record that the data behind one or more domains has changed.
+
+    Args:
+        *domains: Names of the changed data domains (e.g. 'products', 'cart')
+
+    Note:
+        Called by the database managers after a successful commit.
+        Thread safe so background workers can also report changes.
+    """
+    with _versions_lock:
+        for domain in domains:
+            _data_versions[domain] = _data_versions.get(domain, 0) + 1
+
+def get_data_versions(*domains):
+    """Get the current version counters for the given data domains.
+
+    Args:
+        *domains: Names of the data domains to read
+
+    Returns:
+        tuple: Version number for each domain in the order requested,
+               0 for domains that have never changed
+    """
+    with _versions_lock:
+        return tuple(_data_versions.get(domain, 0) for domain in domains)
@@ -1,4 +1,5 @@
 from .connection import get_connection
+from src.database.logging.partitions import setup_log_partitions
 
 def create_tables():
     """Create necessary database tables.
@@ -8,9 +9,15 @@ def create_tables():
         - Categories: Product categories
         - Products: Store products with their details
         - ShoppingCart: User shopping cart items
+        - StockReservations: Expiring stock holds of cart lines
         - Discounts: Store discount codes and their usage
-        - UserActions: Log of user activities
-        - AdminActions: Log of administrative actions
+        - Orders: Placed orders with their totals and applied discount
+        - OrderItems: Products of each order with the price paid
+        - UserActions: Log of user activities (monthly partitions behind a view)
+        - AdminActions: Log of administrative actions (monthly partitions behind a view)
+        - LogSequences: Next log id for each log kind
+        - AlertBuckets: Per-minute counts used by dashboard alerts
+        - LoginFailures: Recent failed logins used by the login throttle
         
     Note:
         Uses SQLite foreign keys for referential integrity between tables.
@@ -19,8 +26,12 @@ def create_tables():
     conn = get_connection()
     cursor = conn.cursor()
 
+    # Let log retention return freed pages in small steps, only takes effect on a new database
+    cursor.execute("PRAGMA auto_vacuum = INCREMENTAL")
+
     # User table with authentication and role management
-    # Password and salt stored as BLOB for binary storage
+    # Password holds an encoded hash string (algorithm$params$salt$hash),
+    # older rows keep a raw digest BLOB with the salt in its own column
     cursor.execute('''
         CREATE TABLE IF NOT EXISTS Users (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -35,6 +46,13 @@ def create_tables():
         )
     ''')
 
+    # Case-insensitive indexes behind the prefix search and sort orders of get_users_page
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_users_username_nocase ON Users(username COLLATE NOCASE)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_users_first_name ON Users(first_name COLLATE NOCASE)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_users_name ON Users(last_name COLLATE NOCASE, first_name COLLATE NOCASE)")
+    # Admin filter and the last admin checks
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_users_admin ON Users(is_admin, id)")
+
     # Simple categories table with unique names
     cursor.execute('''
         CREATE TABLE IF NOT EXISTS Categories (
@@ -73,6 +91,33 @@ def create_tables():
         )
     """)
 
+    # One row per product in each cart, the upserts in cart_manager rely on it
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_cart_user_product'")
+    if not cursor.fetchone():
+        # Older databases could hold duplicate rows, merge them before enforcing uniqueness
+        cursor.execute("""
+            UPDATE ShoppingCart
+            SET quantity = (SELECT SUM(quantity) FROM ShoppingCart AS other
+                            WHERE other.user_id = ShoppingCart.user_id AND other.product_id = ShoppingCart.product_id)
+            WHERE id IN (SELECT MIN(id) FROM ShoppingCart GROUP BY user_id, product_id HAVING COUNT(*) > 1)
+        """)
+        cursor.execute("DELETE FROM ShoppingCart WHERE id NOT IN (SELECT MIN(id) FROM ShoppingCart GROUP BY user_id, product_id)")
+        cursor.execute("CREATE UNIQUE INDEX idx_cart_user_product ON ShoppingCart(user_id, product_id)")
+
+    # Stock held by cart lines for a limited time, available stock is stock minus unexpired holds
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS StockReservations (
+            user_id INTEGER NOT NULL,
+            product_id INTEGER NOT NULL,
+            quantity INTEGER NOT NULL,
+            expires_at REAL NOT NULL,
+            PRIMARY KEY (user_id, product_id)
+        ) WITHOUT ROWID
+    """)
+    # Covers the held stock aggregate per product, and the expiry sweep
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_reservations_product ON StockReservations(product_id, expires_at, quantity, user_id)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_reservations_expiry ON StockReservations(expires_at)")
+
     # Discounts table for promotional features
     # Tracks usage and active status
     cursor.execute("""
@@ -87,33 +132,62 @@ def create_tables():
         )
     """)
 
-    # Audit logging tables for user and admin actions
-    # Separate tables for different detail requirements
+    # Orders placed at checkout, client_token makes a repeated submission a no-op
+    # Discount and prices are copied so later edits never change a placed order
     cursor.execute("""
-        CREATE TABLE IF NOT EXISTS UserActions (
+        CREATE TABLE IF NOT EXISTS Orders (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
-            timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
-            user_id INTEGER,
-            action_type TEXT,
-            details TEXT,
-            status TEXT,
-            FOREIGN KEY (user_id) REFERENCES Users(id)
+            user_id INTEGER NOT NULL,
+            client_token TEXT UNIQUE NOT NULL,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            subtotal REAL NOT NULL,
+            discount_id INTEGER,
+            discount_percentage INTEGER NOT NULL DEFAULT 0,
+            discount_amount REAL NOT NULL DEFAULT 0,
+            total REAL NOT NULL,
+            FOREIGN KEY (user_id) REFERENCES Users(id),
+            FOREIGN KEY (discount_id) REFERENCES Discounts(id)
         )
     """)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_orders_user ON Orders(user_id, id)")
 
     cursor.execute("""
-        CREATE TABLE IF NOT EXISTS AdminActions (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
-            admin_id INTEGER,
-            action_type TEXT,
-            target_type TEXT,
-            target_id INTEGER,
-            details TEXT,
-            status TEXT,
-            FOREIGN KEY (admin_id) REFERENCES Users(id)
+        CREATE TABLE IF NOT EXISTS OrderItems (
+            order_id INTEGER NOT NULL,
+            product_id INTEGER NOT NULL,
+            product_name TEXT NOT NULL,
+            unit_price REAL NOT NULL,
+            quantity INTEGER NOT NULL,
+            line_total REAL NOT NULL,
+            PRIMARY KEY (order_id, product_id),
+            FOREIGN KEY (order_id) REFERENCES Orders(id),
+            FOREIGN KEY (product_id) REFERENCES Products(id)
         )
     """)
 
+    # Audit logging tables for user and admin actions, partitioned by month
+    # UserActions and AdminActions are views over the partitions, see partitions.py
+    setup_log_partitions(cursor)
+
+    # Recent failed logins behind the login throttle, only read on first use of each key
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS LoginFailures (
+            scope TEXT NOT NULL,
+            key TEXT NOT NULL,
+            attempted_at REAL NOT NULL
+        )
+    """)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_loginfailures_key ON LoginFailures(scope, key, attempted_at)")
+
+    # Per-minute event counts behind the dashboard alerts, keyed for range reads by metric
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS AlertBuckets (
+            metric TEXT NOT NULL,
+            minute INTEGER NOT NULL,
+            count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (metric, minute)
+        ) WITHOUT ROWID
+    """)
+
     conn.commit()
     conn.close()
\ No newline at end of file
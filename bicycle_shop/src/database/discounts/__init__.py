@@ -5,7 +5,10 @@ from .discount_manager import (
     delete_discount,
     toggle_discount_status,
     increment_discount_uses,
-    verify_discount_qr
+    record_discount_use,
+    verify_discount_qr,
+    lookup_discount,
+    invalidate_discount_cache
 )
 
 __all__ = [
@@ -15,5 +18,8 @@ __all__ = [
     'delete_discount',
     'toggle_discount_status',
     'increment_discount_uses',
-    'verify_discount_qr'
+    'record_discount_use',
+    'verify_discount_qr',
+    'lookup_discount',
+    'invalidate_discount_cache'
 ]
\ No newline at end of file
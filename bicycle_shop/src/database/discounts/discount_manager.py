@@ -1,5 +1,13 @@
 import sqlite3
 from src.database.core.connection import get_connection
+from src.database.core.changes import mark_changed
+from src.database.logging.alerts import record_alert_events, current_minute
+
+# Discount records by QR payload (name, percentage), None for codes that match no discount.
+# Cleared whenever a discount is added, edited, toggled or deleted.
+_discount_cache = {}
+# Entries kept before the cache is cleared, bounds it against scans of unknown codes
+MAX_CACHED_DISCOUNTS = 256
 
 def add_discount(name, percentage):
     """Add new discount with QR code.
@@ -31,6 +39,8 @@ def add_discount(name, percentage):
             """, (name, percentage, qr_path))
         new_discount_id = cursor.lastrowid
         conn.commit()
+        mark_changed('discounts')
+        invalidate_discount_cache()
         return True, new_discount_id, "Discount added successfully"
     except sqlite3.IntegrityError:
         # Handle duplicate discount names
@@ -99,6 +109,8 @@ def update_discount(discount_id, name, percentage):
                              (new_qr_path, discount_id))
                              
                 conn.commit()
+                mark_changed('discounts')
+                invalidate_discount_cache()
                 return True, "Discount updated successfully"
             except sqlite3.IntegrityError:
                 return False, "A discount with this name already exists"
@@ -131,6 +143,8 @@ def delete_discount(discount_id):
             cleanup_old_discount_qr(qr_path)
             cursor.execute("DELETE FROM Discounts WHERE id = ?", (discount_id,))
             conn.commit()
+            mark_changed('discounts')
+            invalidate_discount_cache()
             return True, "Discount deleted successfully"
         return False, "Discount not found"
     except Exception as e:
@@ -155,6 +169,8 @@ def toggle_discount_status(discount_id):
         # Use NOT operator to flip boolean active status
         cursor.execute("UPDATE Discounts SET active = NOT active WHERE id = ?", (discount_id,))
         conn.commit()
+        mark_changed('discounts')
+        invalidate_discount_cache()
         return True, "Discount status toggled successfully"
     except Exception as e:
         return False, f"Error toggling discount status: {str(e)}"
@@ -175,30 +191,59 @@ def increment_discount_uses(discount_id):
     conn = get_connection()
     cursor = conn.cursor()
     try:
-        # Update usage count and last used timestamp
-        cursor.execute("""
-            UPDATE Discounts 
-            SET uses = uses + 1, last_used = CURRENT_TIMESTAMP
-            WHERE id = ?
-        """, (discount_id,))
+        record_discount_use(cursor, discount_id)
         conn.commit()
+        mark_changed('discounts')
         return True, "Discount usage incremented"
     except Exception as e:
         return False, f"Error incrementing discount usage: {str(e)}"
     finally:
         conn.close()
 
-def verify_discount_qr(qr_data):
-    """Verify QR code data and return discount details.
+def record_discount_use(cursor, discount_id):
+    """Count one use of a discount inside the caller's transaction.
     
     Args:
-        qr_data: QR code data to verify
+        cursor: Cursor of the caller's open transaction
+        discount_id: ID of the discount used
         
     Returns:
-        tuple: (success, discount_id, message)
-            - success: True if discount is valid
-            - discount_id: ID of valid discount, None if invalid
+        bool: True if the discount exists
+        
+    Note:
+        Used by checkout so the use is only counted when an order is placed.
+        The caller marks 'discounts' changed after committing.
+    """
+    # Update usage count and last used timestamp
+    cursor.execute("""
+        UPDATE Discounts 
+        SET uses = uses + 1, last_used = CURRENT_TIMESTAMP
+        WHERE id = ?
+    """, (discount_id,))
+    # Count the use towards the discount usage alert
+    if cursor.rowcount:
+        record_alert_events(cursor, {('discount_uses', current_minute()): 1})
+    return bool(cursor.rowcount)
+
+def lookup_discount(qr_data):
+    """Find the discount a QR code payload refers to.
+    
+    Args:
+        qr_data: QR code data in the format DISCOUNT:name:percentage
+        
+    Returns:
+        tuple: (success, discount, message)
+            - success: True if the discount exists and is active
+            - discount: Dict with id, name, percentage, qr_code_path and
+                        active, None if the code matches no discount
             - message: Success/error message
+            
+    Note:
+        Records are cached by payload, so scanning a code again (or
+        verifying it and then applying it) costs no query. The cache is
+        cleared by add, update, toggle and delete, usage counts are not
+        part of the record so purchases never invalidate it. Each call
+        returns a copy of the cached record.
     """
     # Validate QR code format (DISCOUNT:name:percentage)
     if not qr_data.startswith("DISCOUNT:"):
@@ -208,31 +253,76 @@ def verify_discount_qr(qr_data):
         # Parse QR code data
         _, name, percentage = qr_data.split(":")
         percentage = int(percentage)
+    except ValueError:
+        return False, None, "Invalid QR code data"
+
+    key = (name, percentage)
+    if key in _discount_cache:
+        discount = _discount_cache[key]
+    else:
+        try:
+            discount = _fetch_discount(name, percentage)
+        except Exception as e:
+            return False, None, f"Error verifying discount: {str(e)}"
+        if len(_discount_cache) >= MAX_CACHED_DISCOUNTS:
+            _discount_cache.clear()
+        _discount_cache[key] = discount
+
+    if discount is None:
+        return False, None, "Discount not found"
+    # Callers get their own copy, changing it must not alter the cached record
+    discount = dict(discount)
+    if not discount['active']:
+        return False, discount, "Discount is not active"
+    return True, discount, f"Valid discount: {percentage}% off"
+
+def verify_discount_qr(qr_data):
+    """Verify QR code data and return discount details.
+    
+    Args:
+        qr_data: QR code data to verify
         
-        conn = get_connection()
-        cursor = conn.cursor()
+    Returns:
+        tuple: (success, discount_id, message)
+            - success: True if discount is valid
+            - discount_id: ID of valid discount, None if invalid
+            - message: Success/error message
+            
+    Note:
+        Served from the lookup_discount cache, use lookup_discount
+        directly when the percentage is needed as well.
+    """
+    success, discount, message = lookup_discount(qr_data)
+    return success, discount['id'] if success else None, message
+
+def invalidate_discount_cache():
+    """Forget every cached discount lookup so the next scan reads the database."""
+    _discount_cache.clear()
 
-        # Check discount exists and is active
+def _fetch_discount(name, percentage):
+    """Read a discount by name and percentage, found through the unique index on name.
+
+    Returns:
+        dict | None: Discount record or None if not found
+    """
+    conn = get_connection()
+    try:
+        cursor = conn.cursor()
         cursor.execute("""
-            SELECT id, active, uses 
+            SELECT id, name, percentage, qr_code_path, active
             FROM Discounts 
             WHERE name = ? AND percentage = ?
         """, (name, percentage))
-        
-        result = cursor.fetchone()
-        if not result:
-            return False, None, "Discount not found"
-            
-        discount_id, active, uses = result
-        
-        if not active:
-            return False, None, "Discount is not active"
-            
-        return True, discount_id, f"Valid discount: {percentage}% off"
-            
-    except ValueError:
-        return False, None, "Invalid QR code data"
-    except Exception as e:
-        return False, None, f"Error verifying discount: {str(e)}"
+        row = cursor.fetchone()
     finally:
-        conn.close()
\ No newline at end of file
+        conn.close()
+    if not row:
+        return None
+    discount_id, name, percentage, qr_code_path, active = row
+    return {
+        'id': discount_id,
+        'name': name,
+        'percentage': percentage,
+        'qr_code_path': qr_code_path,
+        'active': bool(active)
+    }
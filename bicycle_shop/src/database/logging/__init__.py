@@ -1,15 +1,83 @@
 from .log_manager import (
     log_user_action,
     log_admin_action,
-    export_logs_to_temp_file,
-    get_dashboard_stats,
+    get_log_page,
+    get_logs_since,
+    LOG_PAGE_SIZE,
     get_dashboard_alerts
 )
 
+from .log_writer import (
+    flush_logs,
+    request_flush,
+    stop_log_writer
+)
+
+from .export import (
+    export_logs,
+    write_logs_csv,
+    write_logs_jsonl,
+    write_logs_text,
+    LOG_WRITERS,
+    EXPORT_COLUMNS
+)
+
+from .dashboard_stats import (
+    get_dashboard_stats,
+    invalidate_dashboard_stats,
+    DASHBOARD_KPIS
+)
+
+from .alerts import (
+    get_alert_counts,
+    record_alert_events
+)
+
+from .retention import (
+    archive_old_logs,
+    start_log_retention,
+    incremental_vacuum,
+    enable_incremental_vacuum,
+    list_archive_months,
+    read_archived_logs,
+    iter_archived_log_rows
+)
+
+from .partitions import (
+    LOG_TABLES,
+    get_log_partitions,
+    drop_log_partition
+)
+
 __all__ = [
     'log_user_action',
     'log_admin_action',
-    'export_logs_to_temp_file',
+    'get_log_page',
+    'get_logs_since',
+    'LOG_PAGE_SIZE',
     'get_dashboard_stats',
-    'get_dashboard_alerts'
+    'get_dashboard_alerts',
+    'flush_logs',
+    'request_flush',
+    'stop_log_writer',
+    'export_logs',
+    'write_logs_csv',
+    'write_logs_jsonl',
+    'write_logs_text',
+    'LOG_WRITERS',
+    'EXPORT_COLUMNS',
+    'invalidate_dashboard_stats',
+    'DASHBOARD_KPIS',
+    'get_alert_counts',
+    'record_alert_events',
+    'archive_old_logs',
+    'start_log_retention',
+    'incremental_vacuum',
+    'enable_incremental_vacuum',
+    'list_archive_months',
+    'read_archived_logs',
+    'iter_archived_log_rows',
+    'LOG_TABLES',
+    'get_log_partitions',
+    'drop_log_partition'
 ]
\ No newline at end of file
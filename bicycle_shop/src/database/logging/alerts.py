@@ -0,0 +1,102 @@
+import time
+from datetime import datetime, timezone
+
+from src.database.core.connection import get_connection
+
+# Minutes of buckets kept, must cover the longest configured alert window
+ALERT_BUCKET_RETENTION_MINUTES = 24 * 60
+
+# Log entries counted towards an alert metric: (log kind, action type, status) -> metric
+ALERT_LOG_RULES = {
+    ('user', 'login', 'failure'): 'failed_user_logins',
+    ('admin', 'admin_login', 'failed'): 'failed_admin_logins'
+}
+
+def current_minute():
+    """Get the current bucket key.
+
+    Returns:
+        int: Minutes since the Unix epoch (UTC)
+    """
+    return int(time.time() // 60)
+
+def timestamp_to_minute(timestamp):
+    """Convert a log timestamp to its bucket key.
+
+    Args:
+        timestamp: UTC timestamp string in CURRENT_TIMESTAMP format ('YYYY-MM-DD HH:MM:SS')
+
+    Returns:
+        int: Minutes since the Unix epoch
+    """
+    moment = datetime.strptime(timestamp, '%Y-%m-%d %H:%M:%S').replace(tzinfo=timezone.utc)
+    return int(moment.timestamp() // 60)
+
+def record_alert_events(cursor, counts):
+    """Add event counts to the per-minute alert buckets.
+
+    Args:
+        cursor: Cursor of the caller's open transaction
+        counts: Dict of (metric, minute) -> number of events
+
+    Note:
+        Runs inside the caller's transaction so buckets always agree with
+        the rows that produced them. Buckets older than
+        ALERT_BUCKET_RETENTION_MINUTES are pruned on each call.
+    """
+    if not counts:
+        return
+    cursor.executemany("""
+        INSERT INTO AlertBuckets (metric, minute, count)
+        VALUES (?, ?, ?)
+        ON CONFLICT(metric, minute) DO UPDATE SET count = count + excluded.count
+    """, [(metric, minute, count) for (metric, minute), count in counts.items()])
+    cursor.execute("DELETE FROM AlertBuckets WHERE minute < ?",
+                   (current_minute() - ALERT_BUCKET_RETENTION_MINUTES,))
+
+def count_log_alert_events(batch):
+    """Count the log entries in a writer batch that feed alert metrics.
+
+    Args:
+        batch: List of (kind, values) entries from the log writer, values
+               starting with the timestamp
+
+    Returns:
+        dict: (metric, minute) -> number of events
+    """
+    counts = {}
+    for kind, values in batch:
+        # Status is always the last column and action type follows the timestamp and user
+        metric = ALERT_LOG_RULES.get((kind, values[2], values[-1]))
+        if metric:
+            key = (metric, timestamp_to_minute(values[0]))
+            counts[key] = counts.get(key, 0) + 1
+    return counts
+
+def get_alert_counts(windows):
+    """Sum the alert buckets of each metric over its window.
+
+    Args:
+        windows: Dict of metric -> window length in minutes
+
+    Returns:
+        dict: metric -> number of events in the window
+
+    Note:
+        Reads at most one bucket row per minute of each window through the
+        primary key, independent of how large the log tables are.
+    """
+    now = current_minute()
+    conn = get_connection()
+    cursor = conn.cursor()
+    try:
+        counts = {}
+        for metric, window in windows.items():
+            cursor.execute("""
+                SELECT COALESCE(SUM(count), 0) FROM AlertBuckets
+                WHERE metric = ? AND minute > ?
+            """, (metric, now - window))
+            counts[metric] = cursor.fetchone()[0]
+        return counts
+    finally:
+        conn.close()
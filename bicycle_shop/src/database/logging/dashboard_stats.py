@@ -0,0 +1,93 @@
+import threading
+import time
+
+from src.database.core.connection import get_connection
+from src.database.core.changes import get_data_versions
+
+# Seconds a stats snapshot is reused, also covers changes made outside this process
+STATS_CACHE_TTL = 30
+
+# Dashboard KPIs: name -> (SQL expression, data domains it depends on)
+# New KPIs only need an entry here, all are computed together in one query
+DASHBOARD_KPIS = {
+    'total_users': ("(SELECT COUNT(*) FROM Users)", ('users',)),
+    'total_admins': ("(SELECT COUNT(*) FROM Users WHERE is_admin = 1)", ('users',)),
+    'total_products': ("(SELECT COUNT(*) FROM Products)", ('products',)),
+    'listed_products': ("(SELECT COUNT(*) FROM Products WHERE listed = 1)", ('products',)),
+    'total_categories': ("(SELECT COUNT(*) FROM Categories)", ('categories',)),
+    'active_discounts': ("(SELECT COUNT(*) FROM Discounts WHERE active = 1)", ('discounts',)),
+    'inventory_value': ("(SELECT COALESCE(SUM(price * stock), 0) FROM Products)", ('products',)),
+    'cart_items': ("(SELECT COALESCE(SUM(quantity), 0) FROM ShoppingCart)", ('cart',)),
+    'cart_value': ("""(SELECT COALESCE(SUM(ShoppingCart.quantity * Products.price), 0)
+                       FROM ShoppingCart JOIN Products ON ShoppingCart.product_id = Products.id)""",
+                   ('cart', 'products'))
+}
+
+_stats_cache = {'snapshot': None, 'versions': None, 'expires': 0}
+_stats_lock = threading.Lock()
+
+def get_dashboard_stats():
+    """Get statistics for admin dashboard.
+
+    Returns:
+        dict: Dashboard statistics keyed by DASHBOARD_KPIS name:
+            - total_users: Total number of users
+            - total_admins: Total number of admin users
+            - total_products: Total number of products
+            - listed_products: Number of listed products
+            - total_categories: Total number of categories
+            - active_discounts: Number of active discounts
+            - inventory_value: Total value of stock on hand
+            - cart_items: Number of items across all carts
+            - cart_value: Total value of all carts
+
+    Note:
+        Every KPI is computed in a single query and the snapshot is cached.
+        It is reused until STATS_CACHE_TTL expires or one of the data
+        domains the KPIs depend on changes, so returning to the dashboard
+        is usually free.
+    """
+    domains = _get_stat_domains()
+    versions = get_data_versions(*domains)
+
+    with _stats_lock:
+        if (_stats_cache['snapshot'] is not None
+                and _stats_cache['versions'] == versions
+                and time.monotonic() < _stats_cache['expires']):
+            return dict(_stats_cache['snapshot'])
+
+    snapshot = _compute_stats()
+
+    with _stats_lock:
+        _stats_cache.update({
+            'snapshot': snapshot,
+            'versions': versions,
+            'expires': time.monotonic() + STATS_CACHE_TTL
+        })
+    return dict(snapshot)
+
+def invalidate_dashboard_stats():
+    """Discard the cached stats snapshot so the next read recomputes it."""
+    with _stats_lock:
+        _stats_cache.update({'snapshot': None, 'versions': None, 'expires': 0})
+
+def _get_stat_domains():
+    """Get every data domain the dashboard KPIs depend on, in a stable order."""
+    return tuple(sorted({domain for _, kpi_domains in DASHBOARD_KPIS.values() for domain in kpi_domains}))
+
+def _compute_stats():
+    """Run the combined KPI query.
+
+    Returns:
+        dict: KPI name -> value
+    """
+    names = list(DASHBOARD_KPIS)
+    query = "SELECT " + ",\n       ".join(f"{DASHBOARD_KPIS[name][0]} AS {name}" for name in names)
+
+    conn = get_connection()
+    cursor = conn.cursor()
+    try:
+        cursor.execute(query)
+        return dict(zip(names, cursor.fetchone()))
+    finally:
+        conn.close()
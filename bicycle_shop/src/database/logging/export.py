@@ -0,0 +1,179 @@
+import csv
+import json
+
+from src.database.core.connection import get_connection
+from src.database.logging.log_writer import flush_logs
+from src.database.logging.partitions import LOG_TABLES, get_log_partitions
+
+# Rows pulled from the cursor at a time while streaming an export
+EXPORT_FETCH_SIZE = 500
+
+# Exported columns per log kind, matching the rows yielded by export_logs
+EXPORT_COLUMNS = {
+    'user': ('id', 'timestamp', 'username', 'action_type', 'details', 'status'),
+    'admin': ('id', 'timestamp', 'username', 'action_type', 'target_type', 'target_id',
+              'details', 'status')
+}
+
+def export_logs(kind='user', since=None, until=None, user=None, action_type=None,
+                status=None, limit=None):
+    """Stream log rows matching the given filters, newest first.
+
+    Args:
+        kind: 'user' for UserActions or 'admin' for AdminActions
+        since: Only rows at or after this timestamp ('YYYY-MM-DD[ HH:MM:SS]')
+        until: Only rows before this timestamp ('YYYY-MM-DD[ HH:MM:SS]')
+        user: Only rows for this user, either a user ID or a username
+        action_type: Only rows with this action type string (e.g. 'login')
+        status: Only rows with this status (e.g. 'success', 'failed')
+        limit: Maximum number of rows, None for no limit
+
+    Yields:
+        tuple: One row per log entry in EXPORT_COLUMNS[kind] order
+
+    Raises:
+        ValueError: If kind is not 'user' or 'admin'
+
+    Note:
+        Only the monthly partitions overlapping since/until are queried.
+        Rows are fetched EXPORT_FETCH_SIZE at a time from a query on the
+        timestamp indexes, so memory stays constant however large the window
+        is and only matching rows are read. The connection stays open until
+        the generator is exhausted or closed.
+    """
+    if kind not in EXPORT_COLUMNS:
+        raise ValueError(f"Unknown log kind: {kind}")
+
+    user_column = LOG_TABLES[kind]['user_column']
+    if kind == 'admin':
+        select_columns = "target_type, target_id, details, status"
+    else:
+        select_columns = "details, status"
+
+    # Build the WHERE clause from the filters that were given, {t} is filled
+    # in with each partition table name
+    conditions, params = [], []
+    if since is not None:
+        conditions.append("{t}.timestamp >= ?")
+        params.append(since)
+    if until is not None:
+        conditions.append("{t}.timestamp < ?")
+        params.append(until)
+    if user is not None:
+        if isinstance(user, int):
+            conditions.append(f"{{t}}.{user_column} = ?")
+        else:
+            # Resolve the username once so the user index can be used
+            conditions.append(f"{{t}}.{user_column} = (SELECT id FROM Users WHERE username = ?)")
+        params.append(user)
+    if action_type is not None:
+        conditions.append("{t}.action_type = ?")
+        params.append(action_type)
+    if status is not None:
+        conditions.append("{t}.status = ?")
+        params.append(status)
+    where = " WHERE " + " AND ".join(conditions) if conditions else ""
+
+    # Include entries still waiting in the log writer queue
+    flush_logs()
+    conn = get_connection()
+    try:
+        cursor = conn.cursor()
+        remaining = limit
+        # Partitions hold disjoint months, reading them newest first keeps the overall order
+        for _, table in get_log_partitions(cursor, kind, since, until):
+            if remaining is not None and remaining <= 0:
+                break
+            query = f"""
+                SELECT {table}.id,
+                       {table}.timestamp,
+                       COALESCE(Users.username, 'Unknown User') as username,
+                       {table}.action_type,
+                       {select_columns}
+                FROM {table}
+                LEFT JOIN Users ON {table}.{user_column} = Users.id
+                {where.format(t=table)}
+                ORDER BY {table}.timestamp DESC, {table}.id DESC
+            """
+            query_params = list(params)
+            if remaining is not None:
+                query += " LIMIT ?"
+                query_params.append(remaining)
+
+            # A separate cursor per partition, the outer one is reused by the next listing
+            rows_cursor = conn.cursor()
+            rows_cursor.execute(query, query_params)
+            while True:
+                rows = rows_cursor.fetchmany(EXPORT_FETCH_SIZE)
+                if not rows:
+                    break
+                if remaining is not None:
+                    remaining -= len(rows)
+                yield from rows
+    finally:
+        conn.close()
+
+def write_logs_csv(rows, file, kind='user'):
+    """Write log rows to a file as CSV with a header row.
+
+    Args:
+        rows: Iterable of rows from export_logs
+        file: Text file opened with newline=''
+        kind: Log kind the rows came from, selects the header
+
+    Returns:
+        int: Number of rows written
+    """
+    writer = csv.writer(file)
+    writer.writerow(EXPORT_COLUMNS[kind])
+    count = 0
+    for row in rows:
+        writer.writerow(row)
+        count += 1
+    return count
+
+def write_logs_jsonl(rows, file, kind='user'):
+    """Write log rows to a file as JSON lines, one object per row.
+
+    Args:
+        rows: Iterable of rows from export_logs
+        file: Text file to write to
+        kind: Log kind the rows came from, selects the field names
+
+    Returns:
+        int: Number of rows written
+    """
+    columns = EXPORT_COLUMNS[kind]
+    count = 0
+    for row in rows:
+        file.write(json.dumps(dict(zip(columns, row))) + "\n")
+        count += 1
+    return count
+
+def write_logs_text(rows, file, kind='user'):
+    """Write log rows to a file as pipe-delimited text.
+
+    Args:
+        rows: Iterable of rows from export_logs
+        file: Text file to write to
+        kind: Unused, accepted so all writers share one signature
+
+    Returns:
+        int: Number of rows written
+
+    Note:
+        The leading id column is dropped, as in the on-screen log viewers.
+    """
+    count = 0
+    for row in rows:
+        file.write(" | ".join(map(str, row[1:])) + "\n")
+        count += 1
+    return count
+
+# Writers by file extension, used by the admin export
+LOG_WRITERS = {
+    '.csv': write_logs_csv,
+    '.jsonl': write_logs_jsonl,
+    '.log': write_logs_text,
+    '.txt': write_logs_text
+}
@@ -1,8 +1,13 @@
-import tempfile
-import os
 from src.database.core.connection import get_connection
+from src.database.logging.log_writer import enqueue_log, request_flush
+from src.database.logging.alerts import get_alert_counts
+from src.database.logging.partitions import fetch_log_rows
+from src.file_system.config.config_manager import get_alert_settings
 
-def log_user_action(user_id, action_type, details, status="success"):
+# Number of log rows fetched per page by the log viewers
+LOG_PAGE_SIZE = 500
+
+def log_user_action(user_id, action_type, details, status="success", created_at=None):
     """Log user action to database.
     
     Args:
@@ -10,18 +15,15 @@ def log_user_action(user_id, action_type, details, status="success"):
         action_type: Type of action being performed
         details: Additional details about the action
         status: Action status (default: "success")
+        created_at: Unix time the action happened (default: now)
+        
+    Note:
+        Queued for the background log writer, which inserts entries in
+        batched transactions so callers never wait on a disk sync.
     """
-    conn = get_connection()
-    cursor = conn.cursor()
-    # Use parameterized query to prevent SQL injection
-    cursor.execute("""
-        INSERT INTO UserActions (user_id, action_type, details, status)
-        VALUES (?, ?, ?, ?)
-    """, (user_id, action_type, details, status))
-    conn.commit()
-    conn.close()
-
-def log_admin_action(admin_id, action_type, target_type, target_id, details, status="success"):
+    enqueue_log('user', (user_id, action_type, details, status), created_at)
+
+def log_admin_action(admin_id, action_type, target_type, target_id, details, status="success", created_at=None):
     """Log admin action to database.
     
     Args:
@@ -31,127 +33,116 @@ def log_admin_action(admin_id, action_type, target_type, target_id, details, sta
         target_id: ID of the target entity
         details: Additional details about the action
         status: Action status (default: "success")
+        created_at: Unix time the action happened (default: now)
+        
+    Note:
+        Queued for the background log writer, which inserts entries in
+        batched transactions so callers never wait on a disk sync.
     """
-    conn = get_connection()
-    cursor = conn.cursor()
-    # Use parameterized query to prevent SQL injection
-    cursor.execute("""
-        INSERT INTO AdminActions (admin_id, action_type, target_type, target_id, details, status)
-        VALUES (?, ?, ?, ?, ?, ?)
-    """, (admin_id, action_type, target_type, target_id, details, status))
-    conn.commit()
-    conn.close()
-
-def export_logs_to_temp_file(admin_only=False):
-    """Export logs to temporary file for viewing.
+    enqueue_log('admin', (admin_id, action_type, target_type, target_id, details, status), created_at)
+
+def _log_page_query(admin_only, table):
+    """Build the base SELECT used by the paged and tailing log readers.
     
     Args:
-        admin_only: If True, export only admin actions; if False, export user actions
+        admin_only: If True, read admin actions; if False, read user actions
+        table: Log partition table to read
         
     Returns:
-        str: Path to the temporary log file
+        str: Query without WHERE/ORDER BY
+    """
+    if admin_only:
+        # Admin logs include additional target information
+        return f"""
+            SELECT {table}.id,
+                   timestamp,
+                   COALESCE(Users.username, 'Unknown User') as username,
+                   action_type,
+                   target_type,
+                   details,
+                   status
+            FROM {table}
+            LEFT JOIN Users ON {table}.admin_id = Users.id
+        """
+
+    # User logs have simpler structure
+    return f"""
+        SELECT {table}.id,
+               timestamp,
+               COALESCE(Users.username, 'Unknown User') as username,
+               action_type,
+               details,
+               status
+        FROM {table}
+        LEFT JOIN Users ON {table}.user_id = Users.id
+    """
+
+def get_log_page(admin_only=False, before_id=None, limit=LOG_PAGE_SIZE):
+    """Fetch one page of logs, newest first, using keyset pagination.
+    
+    Args:
+        admin_only: If True, read admin actions; if False, read user actions
+        before_id: Only return rows with an id lower than this (None for the newest page)
+        limit: Maximum number of rows to return
         
+    Returns:
+        list: Log tuples starting with the row id, followed by the same columns
+              displayed by the log viewers:
+            - Admin: (id, timestamp, username, action_type, target_type, details, status)
+            - User: (id, timestamp, username, action_type, details, status)
+            
     Note:
-        Creates temporary file in application's temp directory.
-        File should be deleted after use.
+        Pages walk the primary key index backwards, so fetching any page costs
+        the same regardless of how deep into the log it is. Only the monthly
+        partitions that can hold the page are read. Pass the id of the last
+        row returned as before_id to fetch the next page.
     """
-    from src.file_system.config.config_manager import get_absolute_path
+    # Separate query shapes keep the keyset condition a plain range on the primary key
+    if before_id is None:
+        def build_query(table):
+            return _log_page_query(admin_only, table) + f" ORDER BY {table}.id DESC LIMIT ?"
+        params = ()
+    else:
+        def build_query(table):
+            return _log_page_query(admin_only, table) + f" WHERE {table}.id < ? ORDER BY {table}.id DESC LIMIT ?"
+        params = (before_id,)
 
-   # Create temp directory in application directory for log files
-    temp_dir = get_absolute_path('temp')
-    os.makedirs(temp_dir, exist_ok=True)
-    
-    # Create temporary file that will be cleaned up after use
-    temp_file = tempfile.NamedTemporaryFile(
-        mode='w',
-        delete=False,
-        suffix='.log',
-        dir=temp_dir
-    )
-    
+    # Show what is committed, queued entries are written meanwhile and appear on the next refresh
+    request_flush()
     conn = get_connection()
     cursor = conn.cursor()
-    
     try:
-        if admin_only:
-            # Admin logs include additional target information
-            cursor.execute("""
-                SELECT timestamp, 
-                       COALESCE(Users.username, 'Unknown User') as username,
-                       action_type, 
-                       target_type, 
-                       details, 
-                       status 
-                FROM AdminActions 
-                LEFT JOIN Users ON AdminActions.admin_id = Users.id
-                ORDER BY timestamp DESC
-            """)
-        else:
-            # User logs have simpler structure
-            cursor.execute("""
-                SELECT timestamp,
-                       COALESCE(Users.username, 'Unknown User') as username,
-                       action_type,
-                       details,
-                       status 
-                FROM UserActions 
-                LEFT JOIN Users ON UserActions.user_id = Users.id
-                ORDER BY timestamp DESC
-            """)
-        
-        # Write logs to temp file in pipe-delimited format
-        for row in cursor:
-            temp_file.write(" | ".join(map(str, row)) + "\n")
-            
-        temp_file.close()
-        return temp_file.name
+        return fetch_log_rows(cursor, 'admin' if admin_only else 'user', build_query, params, limit)
     finally:
         conn.close()
 
-def get_dashboard_stats():
-    """Get statistics for admin dashboard.
+def get_logs_since(admin_only=False, after_id=0, limit=LOG_PAGE_SIZE):
+    """Fetch logs written after a known row, oldest first.
     
+    Args:
+        admin_only: If True, read admin actions; if False, read user actions
+        after_id: Only return rows with an id greater than this
+        limit: Maximum number of rows to return
+        
     Returns:
-        dict: Dashboard statistics containing:
-            - total_users: Total number of users
-            - total_admins: Total number of admin users
-            - total_products: Total number of products
-            - listed_products: Number of listed products
-            - total_categories: Total number of categories
-            - active_discounts: Number of active discounts
+        list: Log tuples in the same format as get_log_page, in ascending id order
+        
+    Note:
+        Used by the live tail view to poll for new rows, each poll is a
+        range scan on the primary key so it stays cheap however large the
+        log is. Only partitions holding ids above after_id are read, the
+        rest are skipped after one id lookup each. Queued entries are not
+        flushed first, they are picked up by the next poll once the log
+        writer has written them.
     """
+    def build_query(table):
+        return _log_page_query(admin_only, table) + f" WHERE {table}.id > ? ORDER BY {table}.id ASC LIMIT ?"
+
     conn = get_connection()
     cursor = conn.cursor()
-
     try:
-        stats = {}
-
-        # Gather system-wide statistics in single database connection
-        # Total users
-        cursor.execute("SELECT COUNT(*) FROM Users")
-        stats['total_users'] = cursor.fetchone()[0]
-        
-        # Total admins
-        cursor.execute("SELECT COUNT(*) FROM Users WHERE is_admin = 1")
-        stats['total_admins'] = cursor.fetchone()[0]
-        
-        # Total products
-        cursor.execute("SELECT COUNT(*) FROM Products")
-        stats['total_products'] = cursor.fetchone()[0]
-        
-        # Listed products
-        cursor.execute("SELECT COUNT(*) FROM Products WHERE listed = 1")
-        stats['listed_products'] = cursor.fetchone()[0]
-        
-        # Total categories
-        cursor.execute("SELECT COUNT(*) FROM Categories")
-        stats['total_categories'] = cursor.fetchone()[0]
-        
-        # Active discounts
-        cursor.execute("SELECT COUNT(*) FROM Discounts WHERE active = 1")
-        stats['active_discounts'] = cursor.fetchone()[0]
-
-        return stats
+        return fetch_log_rows(cursor, 'admin' if admin_only else 'user', build_query, (after_id,), limit,
+                              newest_first=False, after_id=after_id)
     finally:
         conn.close()
 
@@ -165,54 +156,67 @@ def get_dashboard_alerts():
             
     Note:
         Checks for:
-        - Failed admin logins in last hour
-        - Failed user logins in last 30 minutes
-        - Low stock products (less than 5)
-        - High discount usage in last hour
+        - Failed admin logins within the configured window
+        - Failed user logins within the configured window
+        - Login lockouts started by the login throttle
+        - Low stock listed products
+        - High discount usage within the configured window
+        Event counts come from the per-minute alert buckets so the cost does
+        not grow with the log tables. Thresholds and windows are read from
+        the Alerts section of config.ini.
     """
-    conn = get_connection()
-    cursor = conn.cursor()
+    settings = get_alert_settings()
+    # Buckets for failed logins are written with the log batches. Counts reflect committed
+    # batches, queued entries are written meanwhile and count on the next refresh
+    request_flush()
+    counts = get_alert_counts({
+        'failed_admin_logins': settings['failed_admin_login_window_minutes'],
+        'failed_user_logins': settings['failed_user_login_window_minutes'],
+        'discount_uses': settings['discount_use_window_minutes'],
+        'login_lockouts': settings['login_lockout_window_minutes']
+    })
     alerts = []
-    
-    # Check recent failed admin login attempts (last hour)
-    cursor.execute("""
-        SELECT COUNT(*) FROM AdminActions 
-        WHERE action_type = 'admin_login' 
-        AND status = 'failed'
-        AND timestamp >= datetime('now', '-1 hour')
-    """)
-    admin_failed_logins = cursor.fetchone()[0]
-    if admin_failed_logins >= 2:
-        alerts.append(("Warning", f"{admin_failed_logins} failed admin login attempts in last hour"))
-
-    # Check recent failed user login attempts (last 30 minutes)
-    cursor.execute("""
-        SELECT COUNT(*) FROM UserActions 
-        WHERE action_type = 'login' 
-        AND status = 'failure'
-        AND timestamp >= datetime('now', '-30 minutes')
-    """)
-    user_failed_logins = cursor.fetchone()[0]
-    if user_failed_logins >= 3:
-        alerts.append(("Warning", f"{user_failed_logins} failed user login attempts in last 30 minutes"))
+
+    # Check recent failed admin login attempts
+    admin_failed_logins = counts['failed_admin_logins']
+    if admin_failed_logins >= settings['failed_admin_login_threshold']:
+        window = _describe_window(settings['failed_admin_login_window_minutes'])
+        alerts.append(("Warning", f"{admin_failed_logins} failed admin login attempts in last {window}"))
+
+    # Check recent failed user login attempts
+    user_failed_logins = counts['failed_user_logins']
+    if user_failed_logins >= settings['failed_user_login_threshold']:
+        window = _describe_window(settings['failed_user_login_window_minutes'])
+        alerts.append(("Warning", f"{user_failed_logins} failed user login attempts in last {window}"))
+
+    # Check for login lockouts started by the throttle
+    lockouts = counts['login_lockouts']
+    if lockouts >= settings['login_lockout_threshold']:
+        window = _describe_window(settings['login_lockout_window_minutes'])
+        alerts.append(("Warning", f"{lockouts} login lockouts in last {window}"))
 
     # Check for products with low stock
-    cursor.execute("""
-        SELECT COUNT(*) FROM Products 
-        WHERE stock < 5 AND listed = 1
-    """)
-    low_stock = cursor.fetchone()[0]
+    conn = get_connection()
+    cursor = conn.cursor()
+    try:
+        cursor.execute("""
+            SELECT COUNT(*) FROM Products 
+            WHERE stock < ? AND listed = 1
+        """, (settings['low_stock_threshold'],))
+        low_stock = cursor.fetchone()[0]
+    finally:
+        conn.close()
     if low_stock > 0:
         alerts.append(("Warning", f"{low_stock} products low on stock"))
 
     # Check for unusual discount usage patterns
-    cursor.execute("""
-        SELECT SUM(uses) FROM Discounts 
-        WHERE last_used >= datetime('now', '-1 hour')
-    """)
-    recent_discount_uses = cursor.fetchone()[0] or 0  # Use 0 if None
-    if recent_discount_uses >= 10:
-        alerts.append(("Warning", f"High discount usage: {recent_discount_uses} uses in last hour"))
-
-    conn.close()
-    return alerts
\ No newline at end of file
+    recent_discount_uses = counts['discount_uses']
+    if recent_discount_uses >= settings['discount_use_threshold']:
+        window = _describe_window(settings['discount_use_window_minutes'])
+        alerts.append(("Warning", f"High discount usage: {recent_discount_uses} uses in last {window}"))
+
+    return alerts
+
+def _describe_window(minutes):
+    """Describe an alert window for messages (e.g. "hour", "30 minutes")."""
+    return "hour" if minutes == 60 else f"{minutes} minutes"
@@ -0,0 +1,220 @@
+import atexit
+import queue
+import threading
+import time
+from datetime import datetime, timezone
+
+import sqlite3
+
+from src.database.core.connection import get_connection
+from src.database.logging.alerts import record_alert_events, count_log_alert_events
+from src.database.logging.partitions import (
+    LOG_TABLES, ensure_log_partition, allocate_log_ids, timestamp_month, forget_log_partitions
+)
+
+# Maximum log entries held in memory waiting to be written
+LOG_QUEUE_SIZE = 10000
+# Entries written per transaction, a batch is flushed as soon as it is full
+LOG_FLUSH_BATCH_SIZE = 200
+# Seconds a partial batch may wait before it is flushed
+LOG_FLUSH_INTERVAL = 0.5
+# Seconds a caller waits for queue space before writing the entry itself
+LOG_ENQUEUE_TIMEOUT = 0.05
+
+# Control messages passed through the queue alongside log entries
+_FLUSH = 'flush'
+_STOP = 'stop'
+
+_log_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+_writer_thread = None
+_writer_lock = threading.Lock()
+
+def enqueue_log(table, values, created_at=None):
+    """Queue a log entry for the background writer.
+
+    Args:
+        table: 'user' for UserActions or 'admin' for AdminActions
+        values: Column values in LOG_TABLES column order, excluding the
+                id assigned by the writer and the timestamp captured here
+        created_at: Unix time the action happened (default: now)
+
+    Note:
+        The timestamp is taken when the action happens, not when the
+        batch is written, in the same UTC format as CURRENT_TIMESTAMP.
+        Backpressure policy: if the queue is full the caller waits up to
+        LOG_ENQUEUE_TIMEOUT for space, then writes the entry synchronously
+        so audit entries are never dropped.
+    """
+    moment = datetime.now(timezone.utc) if created_at is None else datetime.fromtimestamp(created_at, timezone.utc)
+    timestamp = moment.strftime('%Y-%m-%d %H:%M:%S')
+    entry = (table, (timestamp,) + tuple(values))
+
+    _ensure_writer_started()
+    try:
+        _log_queue.put(entry, timeout=LOG_ENQUEUE_TIMEOUT)
+    except queue.Full:
+        # Writer is falling behind, apply backpressure by paying the write cost here
+        _write_batch([entry])
+
+def flush_logs(timeout=5.0):
+    """Wait until every log entry queued so far has been written.
+
+    Args:
+        timeout: Maximum seconds to wait
+
+    Returns:
+        bool: True if the queue was flushed, False if the wait timed out
+
+    Note:
+        Blocks the caller, only used off the Tk thread by export and
+        retention which must see every entry. Screens use request_flush.
+    """
+    if not _is_writer_running():
+        return True
+    done = threading.Event()
+    try:
+        _log_queue.put((_FLUSH, done), timeout=timeout)
+    except queue.Full:
+        return False
+    return done.wait(timeout)
+
+def request_flush():
+    """Ask the writer to write its pending batch now without waiting for it.
+
+    Note:
+        Used by the log screens on the Tk thread, they show what is already
+        committed and pick up the requested entries on their next refresh.
+    """
+    if not _is_writer_running():
+        return
+    try:
+        _log_queue.put_nowait((_FLUSH, None))
+    except queue.Full:
+        # The writer is busy with a full queue and flushes batches as it goes anyway
+        pass
+
+def stop_log_writer(timeout=5.0):
+    """Drain the queue and stop the background writer.
+
+    Args:
+        timeout: Maximum seconds to wait for the writer to finish
+
+    Note:
+        Registered with atexit and called when the application closes,
+        the writer restarts automatically if more entries are logged.
+    """
+    global _writer_thread
+    with _writer_lock:
+        thread = _writer_thread
+        if thread is None or not thread.is_alive():
+            return
+        _log_queue.put((_STOP, None))
+        thread.join(timeout)
+        _writer_thread = None
+
+def _ensure_writer_started():
+    """Start the background writer thread if it is not already running."""
+    global _writer_thread
+    if _is_writer_running():
+        return
+    with _writer_lock:
+        if _writer_thread is None or not _writer_thread.is_alive():
+            _writer_thread = threading.Thread(target=_writer_loop, name="log-writer", daemon=True)
+            _writer_thread.start()
+
+def _is_writer_running():
+    """Check whether the background writer thread is alive."""
+    thread = _writer_thread
+    return thread is not None and thread.is_alive()
+
+def _writer_loop():
+    """Collect queued entries and write them in batches on size or time thresholds."""
+    batch = []
+    deadline = None
+
+    while True:
+        timeout = None if deadline is None else max(0, deadline - time.monotonic())
+        try:
+            kind, payload = _log_queue.get(timeout=timeout)
+        except queue.Empty:
+            # Oldest entry in the batch has waited LOG_FLUSH_INTERVAL
+            _write_batch(batch)
+            batch, deadline = [], None
+            continue
+
+        if kind == _FLUSH:
+            _write_batch(batch)
+            batch, deadline = [], None
+            # Requests from request_flush have no waiter to notify
+            if payload is not None:
+                payload.set()
+        elif kind == _STOP:
+            # Entries queued before the stop message were already received, write them and exit
+            _write_batch(batch)
+            return
+        else:
+            batch.append((kind, payload))
+            if deadline is None:
+                deadline = time.monotonic() + LOG_FLUSH_INTERVAL
+            if len(batch) >= LOG_FLUSH_BATCH_SIZE:
+                _write_batch(batch)
+                batch, deadline = [], None
+
+def _write_batch(batch):
+    """Write a batch of log entries in a single transaction.
+
+    Args:
+        batch: List of (table, values) entries from enqueue_log
+
+    Note:
+        Entries go to the monthly partition of their timestamp. Ids are
+        reserved per kind in the same transaction, in queue order.
+    """
+    if not batch:
+        return
+
+    for attempt in range(2):
+        conn = get_connection()
+        try:
+            cursor = conn.cursor()
+            _insert_batch(cursor, batch)
+            # Alert buckets are updated in the same transaction as the rows they count
+            record_alert_events(cursor, count_log_alert_events(batch))
+            conn.commit()
+            return
+        except sqlite3.OperationalError as e:
+            conn.rollback()
+            if attempt == 0 and "no such table" in str(e):
+                # A partition was dropped elsewhere, forget cached partitions and retry once
+                forget_log_partitions()
+                continue
+            print(f"Error writing log batch: {e}")
+            return
+        except Exception as e:
+            # Keep the writer alive, a failed batch must not stop later logging
+            print(f"Error writing log batch: {e}")
+            return
+        finally:
+            conn.close()
+
+def _insert_batch(cursor, batch):
+    """Insert batch entries into their partitions with newly reserved ids."""
+    for kind, spec in LOG_TABLES.items():
+        rows = [values for table, values in batch if table == kind]
+        if not rows:
+            continue
+        first_id = allocate_log_ids(cursor, kind, len(rows))
+
+        by_month = {}
+        for offset, values in enumerate(rows):
+            by_month.setdefault(timestamp_month(values[0]), []).append((first_id + offset,) + tuple(values))
+
+        columns = spec['columns']
+        placeholders = ", ".join("?" for _ in columns)
+        for month, month_rows in by_month.items():
+            partition = ensure_log_partition(cursor, kind, month)
+            cursor.executemany(f"INSERT INTO {partition} ({', '.join(columns)}) VALUES ({placeholders})",
+                               month_rows)
+
+# Make sure queued entries reach the database however the application exits
+atexit.register(stop_log_writer)
@@ -0,0 +1,300 @@
+import threading
+
+from src.database.core import connection
+
+# Log tables split into one partition table per month, e.g. UserActions_2024_03.
+# The base name is kept as a UNION ALL view over every partition for ad hoc queries.
+LOG_TABLES = {
+    'user': {
+        'table': 'UserActions',
+        'user_column': 'user_id',
+        'columns': ('id', 'timestamp', 'user_id', 'action_type', 'details', 'status'),
+        'definition': """
+            id INTEGER PRIMARY KEY,
+            timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+            user_id INTEGER,
+            action_type TEXT,
+            details TEXT,
+            status TEXT,
+            FOREIGN KEY (user_id) REFERENCES Users(id)
+        """
+    },
+    'admin': {
+        'table': 'AdminActions',
+        'user_column': 'admin_id',
+        'columns': ('id', 'timestamp', 'admin_id', 'action_type', 'target_type',
+                    'target_id', 'details', 'status'),
+        'definition': """
+            id INTEGER PRIMARY KEY,
+            timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+            admin_id INTEGER,
+            action_type TEXT,
+            target_type TEXT,
+            target_id INTEGER,
+            details TEXT,
+            status TEXT,
+            FOREIGN KEY (admin_id) REFERENCES Users(id)
+        """
+    }
+}
+
+# Partitions known to exist, keyed by database path so switching databases starts fresh
+_known_partitions = set()
+_partition_lock = threading.Lock()
+
+def partition_table(kind, month):
+    """Get the partition table name for a log kind and month.
+
+    Args:
+        kind: 'user' or 'admin'
+        month: Month string (YYYY-MM)
+
+    Returns:
+        str: Table name such as UserActions_2024_03
+    """
+    return f"{LOG_TABLES[kind]['table']}_{month.replace('-', '_')}"
+
+def timestamp_month(timestamp):
+    """Get the partition month of a log timestamp ('YYYY-MM-DD HH:MM:SS')."""
+    return str(timestamp)[:7]
+
+def setup_log_partitions(cursor):
+    """Create the partition bookkeeping and move any unpartitioned log rows into partitions.
+
+    Args:
+        cursor: Cursor of the caller's open transaction
+
+    Note:
+        Called from create_tables. Databases created before partitioning
+        have UserActions/AdminActions as plain tables, their rows are copied
+        into monthly partitions with their ids unchanged and the table is
+        replaced by the view. This runs once per database.
+    """
+    # Next log id per kind, ids stay unique and increasing across partitions
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS LogSequences (
+            kind TEXT PRIMARY KEY,
+            last_id INTEGER NOT NULL
+        )
+    """)
+
+    for kind, spec in LOG_TABLES.items():
+        table = spec['table']
+        cursor.execute("SELECT type FROM sqlite_master WHERE name = ?", (table,))
+        existing = cursor.fetchone()
+
+        last_id = 0
+        if existing and existing[0] == 'table':
+            columns = ", ".join(spec['columns'])
+            cursor.execute(f"SELECT DISTINCT substr(timestamp, 1, 7) FROM {table}")
+            for (month,) in cursor.fetchall():
+                partition = ensure_log_partition(cursor, kind, month, rebuild_view=False)
+                cursor.execute(f"""
+                    INSERT INTO {partition} ({columns})
+                    SELECT {columns} FROM {table} WHERE substr(timestamp, 1, 7) = ?
+                """, (month,))
+            cursor.execute(f"SELECT COALESCE(MAX(id), 0) FROM {table}")
+            last_id = cursor.fetchone()[0]
+            # AUTOINCREMENT may have handed out higher ids that were since deleted
+            cursor.execute("SELECT seq FROM sqlite_sequence WHERE name = ?", (table,))
+            row = cursor.fetchone()
+            if row:
+                last_id = max(last_id, row[0])
+            cursor.execute(f"DROP TABLE {table}")
+
+        cursor.execute("INSERT OR IGNORE INTO LogSequences (kind, last_id) VALUES (?, ?)", (kind, last_id))
+        _rebuild_log_view(cursor, kind)
+
+def ensure_log_partition(cursor, kind, month, rebuild_view=True):
+    """Create the partition for a month if it does not exist yet.
+
+    Args:
+        cursor: Cursor of the caller's open transaction
+        kind: 'user' or 'admin'
+        month: Month string (YYYY-MM)
+        rebuild_view: Whether to add a new partition to the base view
+
+    Returns:
+        str: Partition table name
+    """
+    table = partition_table(kind, month)
+    cache_key = (connection.DB_PATH, table)
+    if cache_key in _known_partitions:
+        return table
+
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,))
+    if not cursor.fetchone():
+        cursor.execute(f"CREATE TABLE {table} ({LOG_TABLES[kind]['definition']})")
+        # Indexes for filtered reads, each ends with timestamp so results come out already ordered
+        user_column = LOG_TABLES[kind]['user_column']
+        cursor.execute(f"CREATE INDEX idx_{table.lower()}_timestamp ON {table}(timestamp)")
+        cursor.execute(f"CREATE INDEX idx_{table.lower()}_user ON {table}({user_column}, timestamp)")
+        cursor.execute(f"CREATE INDEX idx_{table.lower()}_action ON {table}(action_type, timestamp)")
+        if rebuild_view:
+            _rebuild_log_view(cursor, kind)
+
+    with _partition_lock:
+        _known_partitions.add(cache_key)
+    return table
+
+def allocate_log_ids(cursor, kind, count):
+    """Reserve a block of log ids.
+
+    Args:
+        cursor: Cursor of the caller's open transaction
+        kind: 'user' or 'admin'
+        count: Number of ids needed
+
+    Returns:
+        int: First id of the block, the rest follow consecutively
+
+    Note:
+        The update takes the write lock, so concurrent writers get
+        disjoint blocks once their transactions commit.
+    """
+    cursor.execute("UPDATE LogSequences SET last_id = last_id + ? WHERE kind = ?", (count, kind))
+    cursor.execute("SELECT last_id FROM LogSequences WHERE kind = ?", (kind,))
+    return cursor.fetchone()[0] - count + 1
+
+def get_log_partitions(cursor, kind, since=None, until=None, newest_first=True):
+    """List the partitions that can hold rows in a timestamp range.
+
+    Args:
+        cursor: Open database cursor
+        kind: 'user' or 'admin'
+        since: Start of the range ('YYYY-MM[-DD HH:MM:SS]'), None for unbounded
+        until: End of the range ('YYYY-MM[-DD HH:MM:SS]'), None for unbounded
+        newest_first: Order partitions newest first, otherwise oldest first
+
+    Returns:
+        list: (month, table name) tuples for partitions overlapping the range
+    """
+    base = LOG_TABLES[kind]['table']
+    cursor.execute("""
+        SELECT name FROM sqlite_master
+        WHERE type = 'table' AND name GLOB ?
+    """, (f"{base}_[0-9][0-9][0-9][0-9]_[0-9][0-9]",))
+
+    partitions = []
+    for (name,) in cursor.fetchall():
+        month = name[len(base) + 1:].replace('_', '-')
+        if (since and month < timestamp_month(since)) or (until and month > timestamp_month(until)):
+            continue
+        partitions.append((month, name))
+    return sorted(partitions, reverse=newest_first)
+
+def _partitions_after(cursor, kind, after_id):
+    """List the partitions holding ids above after_id, oldest first.
+
+    Note:
+        Every partition is checked, not just the newest ones. Entries are
+        stamped when the action happens but get their id when the batch is
+        written, so a row stamped just before a month boundary can land in
+        the previous month's partition with an id above rows already in the
+        new one. Each check is a single lookup on the primary key.
+    """
+    partitions = []
+    for month, table in get_log_partitions(cursor, kind, newest_first=False):
+        cursor.execute(f"SELECT MAX(id) FROM {table}")
+        max_id = cursor.fetchone()[0]
+        if max_id is None or max_id <= after_id:
+            continue
+        partitions.append((month, table))
+    return partitions
+
+def fetch_log_rows(cursor, kind, build_query, params, limit, newest_first=True, after_id=None):
+    """Run a keyset query on each partition and merge the results by id.
+
+    Args:
+        cursor: Open database cursor
+        kind: 'user' or 'admin'
+        build_query: Callable taking a partition table name and returning a query
+                     that selects the id first, orders by id in the requested
+                     direction and ends with LIMIT ?
+        params: Query parameters before the limit
+        limit: Maximum number of rows to return
+        newest_first: True for descending ids, False for ascending
+        after_id: Lowest id bound of an ascending query, partitions holding
+                  only ids up to it are skipped without being queried
+
+    Returns:
+        list: Up to limit rows ordered by id
+
+    Note:
+        Ids increase with write order and partitions follow the month of
+        each entry's timestamp, so id ranges of neighbouring months can
+        overlap slightly around a month boundary. Partitions are visited by
+        month and the walk stops as soon as the next partition's id range
+        cannot improve on the rows already found. A page near either end of
+        the log usually touches a single partition.
+    """
+    if after_id is not None and not newest_first:
+        partitions = _partitions_after(cursor, kind, after_id)
+    else:
+        partitions = get_log_partitions(cursor, kind, newest_first=newest_first)
+
+    rows = []
+    for _, table in partitions:
+        if len(rows) >= limit:
+            cursor.execute(f"SELECT MIN(id), MAX(id) FROM {table}")
+            min_id, max_id = cursor.fetchone()
+            if min_id is None:
+                continue
+            worst_id = rows[limit - 1][0]
+            if (newest_first and max_id < worst_id) or (not newest_first and min_id > worst_id):
+                break
+        cursor.execute(build_query(table), tuple(params) + (limit,))
+        rows.extend(cursor.fetchall())
+        rows.sort(key=lambda row: row[0], reverse=newest_first)
+        del rows[limit:]
+    return rows
+
+def drop_log_partition(kind, month):
+    """Delete a whole month of logs.
+
+    Args:
+        kind: 'user' or 'admin'
+        month: Month string (YYYY-MM)
+
+    Returns:
+        bool: True if the partition existed and was dropped
+
+    Note:
+        Dropping the table frees its pages in one step instead of deleting
+        rows one at a time. Callers wanting to keep the rows should archive
+        them first, as archive_old_logs does.
+    """
+    table = partition_table(kind, month)
+    conn = connection.get_connection()
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,))
+        if not cursor.fetchone():
+            return False
+        cursor.execute(f"DROP TABLE {table}")
+        _rebuild_log_view(cursor, kind)
+        conn.commit()
+        with _partition_lock:
+            _known_partitions.discard((connection.DB_PATH, table))
+        return True
+    finally:
+        conn.close()
+
+def forget_log_partitions():
+    """Clear the cache of known partitions so they are checked again on next use."""
+    with _partition_lock:
+        _known_partitions.clear()
+
+def _rebuild_log_view(cursor, kind):
+    """Recreate the base view as a UNION ALL over the current partitions."""
+    spec = LOG_TABLES[kind]
+    base, columns = spec['table'], ", ".join(spec['columns'])
+    partitions = get_log_partitions(cursor, kind, newest_first=False)
+
+    cursor.execute(f"DROP VIEW IF EXISTS {base}")
+    if partitions:
+        body = "\nUNION ALL\n".join(f"SELECT {columns} FROM {table}" for _, table in partitions)
+    else:
+        # No logs yet, keep the view queryable with the right columns
+        body = f"SELECT {', '.join(f'NULL AS {column}' for column in spec['columns'])} WHERE 0"
+    cursor.execute(f"CREATE VIEW {base} AS {body}")
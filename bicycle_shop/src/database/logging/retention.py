@@ -0,0 +1,324 @@
+import gzip
+import json
+import os
+import threading
+
+from src.database.core.connection import get_connection
+from src.database.logging.log_writer import flush_logs
+from src.database.logging.partitions import LOG_TABLES, get_log_partitions, drop_log_partition
+
+# Rows moved from a log table to the archive per transaction
+ARCHIVE_BATCH_SIZE = 1000
+# Free pages returned to the filesystem per incremental vacuum step
+VACUUM_PAGES_PER_STEP = 500
+
+def archive_old_logs(retention_days, max_rows, archive_dir, batch_size=ARCHIVE_BATCH_SIZE):
+    """Move log rows outside the retention policy into compressed monthly archives.
+
+    Args:
+        retention_days: Rows older than this many days are archived (0 disables the age policy)
+        max_rows: Only the newest max_rows rows of each table are kept (0 disables the row policy)
+        archive_dir: Directory archive files are written to
+        batch_size: Rows moved per transaction
+
+    Returns:
+        dict: Number of rows archived per log kind ('user', 'admin')
+
+    Note:
+        Rows are appended to gzip JSON lines files named
+        <kind>_actions_<YYYY-MM>.jsonl.gz by the month of their timestamp.
+        Each batch is written to the archive before it is deleted, so an
+        interrupted run can only leave duplicates in the archive, never lose
+        rows. Monthly partitions that fall entirely outside the policy are
+        dropped as a whole once archived, only the partition straddling the
+        cutoff is deleted from row by row. Batches keep write locks short so
+        logging continues meanwhile. Freed pages are then returned with an
+        incremental vacuum.
+    """
+    # Queued entries must be in the table before deciding what to keep
+    flush_logs()
+    os.makedirs(archive_dir, exist_ok=True)
+
+    archived = {}
+    for kind, spec in LOG_TABLES.items():
+        cutoff_id = _get_archive_cutoff_id(kind, retention_days, max_rows)
+        archived[kind] = _archive_partitions(kind, spec, cutoff_id, archive_dir, batch_size) if cutoff_id else 0
+
+    if any(archived.values()):
+        incremental_vacuum()
+    return archived
+
+def start_log_retention(retention_days, max_rows, archive_dir):
+    """Run archive_old_logs on a background thread.
+
+    Args:
+        retention_days: Age policy in days, see archive_old_logs
+        max_rows: Row count policy, see archive_old_logs
+        archive_dir: Directory archive files are written to
+
+    Returns:
+        Thread: Started daemon thread running the archive
+
+    Note:
+        Called at startup so large archives never delay the login screen.
+    """
+    def run():
+        try:
+            archive_old_logs(retention_days, max_rows, archive_dir)
+        except Exception as e:
+            print(f"Error archiving logs: {e}")
+
+    thread = threading.Thread(target=run, name="log-retention", daemon=True)
+    thread.start()
+    return thread
+
+def incremental_vacuum(pages=VACUUM_PAGES_PER_STEP):
+    """Return free database pages to the filesystem in small steps.
+
+    Args:
+        pages: Maximum pages released per step
+
+    Returns:
+        bool: True if pages could be released, False if the database is not
+              in incremental auto_vacuum mode and was left untouched
+
+    Note:
+        New databases are created with auto_vacuum=INCREMENTAL. Databases
+        created before that stay in their mode, this runs from the startup
+        retention thread while the UI is live and never converts them, since
+        that takes a full VACUUM holding an exclusive lock for the whole
+        rebuild. Convert them once with enable_incremental_vacuum while the
+        application is closed, freed pages are reused by SQLite meanwhile.
+    """
+    conn = get_connection()
+    try:
+        if conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+            return False
+
+        previous_free = None
+        while True:
+            free_pages = conn.execute("PRAGMA freelist_count").fetchone()[0]
+            # Stop once everything is released or a step makes no progress
+            if free_pages == 0 or free_pages == previous_free:
+                break
+            previous_free = free_pages
+            conn.execute(f"PRAGMA incremental_vacuum({int(pages)})").fetchall()
+        return True
+    finally:
+        conn.close()
+
+def enable_incremental_vacuum():
+    """Convert the database to incremental auto_vacuum mode, a one-time maintenance step.
+
+    Returns:
+        bool: True if the database was converted, False if it already was
+
+    Note:
+        Offline maintenance only: call it while the application is closed,
+        from a Python shell in the bicycle_shop directory after
+        import src.file_system (which loads the modules in startup order).
+        The full VACUUM it needs rewrites the whole file under an exclusive
+        lock, any other writer fails meanwhile.
+    """
+    conn = get_connection()
+    try:
+        if conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2:
+            return False
+        # auto_vacuum can only change on an existing database through a full VACUUM
+        conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        conn.execute("VACUUM")
+        return True
+    finally:
+        conn.close()
+
+def list_archive_months(kind, archive_dir):
+    """List the months available in the log archive.
+
+    Args:
+        kind: 'user' or 'admin'
+        archive_dir: Directory archive files are written to
+
+    Returns:
+        list: Month strings (YYYY-MM), newest first
+    """
+    if not os.path.isdir(archive_dir):
+        return []
+    prefix, suffix = f"{kind}_actions_", ".jsonl.gz"
+    months = [
+        name[len(prefix):-len(suffix)] for name in os.listdir(archive_dir)
+        if name.startswith(prefix) and name.endswith(suffix)
+    ]
+    return sorted(months, reverse=True)
+
+def read_archived_logs(kind, archive_dir, since=None, until=None):
+    """Stream archived log rows for a range of months.
+
+    Args:
+        kind: 'user' or 'admin'
+        archive_dir: Directory archive files are written to
+        since: First month to include (YYYY-MM), None for the oldest
+        until: Last month to include (YYYY-MM), None for the newest
+
+    Yields:
+        dict: Archived row with the table columns plus the username at archive time
+
+    Note:
+        Files are decompressed one line at a time so any range can be read
+        without loading it into memory.
+    """
+    for month in sorted(list_archive_months(kind, archive_dir)):
+        if (since and month < since) or (until and month > until):
+            continue
+        with gzip.open(_archive_path(kind, archive_dir, month), 'rt', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+def iter_archived_log_rows(kind, archive_dir, month, after_id=None):
+    """Stream one archived month in the same row format as get_log_page.
+
+    Args:
+        kind: 'user' or 'admin'
+        archive_dir: Directory archive files are written to
+        month: Month to read (YYYY-MM)
+        after_id: Only yield rows with a higher id (None for the whole month)
+
+    Yields:
+        tuple: Log tuples oldest first, starting with the row id:
+            - Admin: (id, timestamp, username, action_type, target_type, details, status)
+            - User: (id, timestamp, username, action_type, details, status)
+
+    Note:
+        Archives are appended in id order, so the file is read one line at
+        a time and the caller stops after a page, memory never holds more
+        than the rows taken. Rows repeated by an interrupted archive run
+        have an id no higher than the last one yielded and are skipped.
+    """
+    last_id = -1 if after_id is None else after_id
+    for record in read_archived_logs(kind, archive_dir, since=month, until=month):
+        if record['id'] <= last_id:
+            continue
+        last_id = record['id']
+        username = record.get('username') or 'Unknown User'
+        if kind == 'admin':
+            yield (record['id'], record['timestamp'], username, record['action_type'],
+                   record['target_type'], record['details'], record['status'])
+        else:
+            yield (record['id'], record['timestamp'], username, record['action_type'],
+                   record['details'], record['status'])
+
+def _get_archive_cutoff_id(kind, retention_days, max_rows):
+    """Find the highest row id that falls outside the retention policy.
+
+    Returns:
+        int | None: Rows with an id up to and including this are archived, None if none qualify
+    """
+    conn = get_connection()
+    cursor = conn.cursor()
+    try:
+        cutoffs = []
+        if retention_days > 0:
+            age = f"-{int(retention_days)} days"
+            cursor.execute("SELECT strftime('%Y-%m', 'now', ?)", (age,))
+            # Only partitions up to the cutoff month can hold rows that are too old
+            for _, table in get_log_partitions(cursor, kind, until=cursor.fetchone()[0]):
+                cursor.execute(f"SELECT MAX(id) FROM {table} WHERE timestamp < datetime('now', ?)", (age,))
+                cutoffs.append(cursor.fetchone()[0])
+        if max_rows > 0:
+            # Count back from the newest partition until the row limit is passed
+            kept = 0
+            for _, table in get_log_partitions(cursor, kind):
+                cursor.execute(f"SELECT COUNT(*) FROM {table}")
+                count = cursor.fetchone()[0]
+                if kept + count > max_rows:
+                    # Id of the newest row beyond the row limit, walks the primary key index
+                    cursor.execute(f"SELECT id FROM {table} ORDER BY id DESC LIMIT 1 OFFSET ?",
+                                   (max_rows - kept,))
+                    cutoffs.append(cursor.fetchone()[0])
+                    break
+                kept += count
+        cutoffs = [cutoff for cutoff in cutoffs if cutoff is not None]
+        return max(cutoffs) if cutoffs else None
+    finally:
+        conn.close()
+
+def _archive_partitions(kind, spec, cutoff_id, archive_dir, batch_size):
+    """Move rows up to cutoff_id from the log partitions to the archive.
+
+    Returns:
+        int: Number of rows archived
+    """
+    conn = get_connection()
+    cursor = conn.cursor()
+    try:
+        partitions = []
+        for month, table in get_log_partitions(cursor, kind, newest_first=False):
+            cursor.execute(f"SELECT MIN(id), MAX(id) FROM {table}")
+            min_id, max_id = cursor.fetchone()
+            if min_id is not None and min_id > cutoff_id:
+                break
+            partitions.append((month, table, max_id))
+    finally:
+        conn.close()
+
+    total = 0
+    for month, table, max_id in partitions:
+        whole = max_id is None or max_id <= cutoff_id
+        # Whole partitions are read in batches and dropped at the end instead of deleted row by row
+        total += _archive_table(kind, spec, table, cutoff_id, archive_dir, batch_size, delete=not whole)
+        if whole:
+            drop_log_partition(kind, month)
+    return total
+
+def _archive_table(kind, spec, table, cutoff_id, archive_dir, batch_size, delete=True):
+    """Copy rows up to cutoff_id from one log partition to the archive in batches.
+
+    Args:
+        delete: Delete each batch once archived, False when the partition is dropped afterwards
+
+    Returns:
+        int: Number of rows archived
+    """
+    columns = spec['columns']
+    select_columns = ", ".join(f"{table}.{column}" for column in columns)
+    query = f"""
+        SELECT {select_columns}, Users.username
+        FROM {table}
+        LEFT JOIN Users ON {table}.{spec['user_column']} = Users.id
+        WHERE {table}.id > ? AND {table}.id <= ?
+        ORDER BY {table}.id ASC
+        LIMIT ?
+    """
+
+    total = 0
+    last_id = -1
+    while True:
+        conn = get_connection()
+        cursor = conn.cursor()
+        try:
+            cursor.execute(query, (last_id, cutoff_id, batch_size))
+            rows = cursor.fetchall()
+            if not rows:
+                return total
+
+            # Write the batch to the archive before deleting it from the live table
+            by_month = {}
+            for row in rows:
+                record = dict(zip(columns + ('username',), row))
+                by_month.setdefault(str(record['timestamp'])[:7], []).append(record)
+            for month, records in by_month.items():
+                with gzip.open(_archive_path(kind, archive_dir, month), 'at', encoding='utf-8') as f:
+                    for record in records:
+                        f.write(json.dumps(record) + "\n")
+
+            last_id = rows[-1][0]
+            if delete:
+                cursor.execute(f"DELETE FROM {table} WHERE id <= ?", (last_id,))
+                conn.commit()
+            total += len(rows)
+        finally:
+            conn.close()
+
+def _archive_path(kind, archive_dir, month):
+    """Build the archive file path for a log kind and month."""
+    return os.path.join(archive_dir, f"{kind}_actions_{month}.jsonl.gz")
@@ -0,0 +1,13 @@
+from .order_manager import (
+    new_checkout_token,
+    checkout,
+    get_order,
+    get_user_orders
+)
+
+__all__ = [
+    'new_checkout_token',
+    'checkout',
+    'get_order',
+    'get_user_orders'
+]
\ No newline at end of file
@@ -0,0 +1,166 @@
+import time
+import uuid
+
+from src.database.core.connection import get_connection
+from src.database.core.changes import mark_changed
+from src.database.cart.reservations import HELD_BY_OTHERS_SQL, release_reservations
+from src.database.cart.cart_model import discard_cart_model
+from src.database.discounts.discount_manager import record_discount_use
+
+def new_checkout_token():
+    """Create a client token for one checkout attempt.
+
+    Returns:
+        str: Random token, generate one per cart view and reuse it for every
+             click so repeated submissions place a single order
+    """
+    return uuid.uuid4().hex
+
+def checkout(user_id, client_token, discount_id=None):
+    """Turn a user's cart into an order.
+
+    Args:
+        user_id: ID of the user checking out
+        client_token: Token from new_checkout_token identifying this attempt
+        discount_id: ID of a verified discount to apply (optional)
+
+    Returns:
+        tuple: (success, order_id, message)
+            - success: True if the order was placed (or already had been)
+            - order_id: ID of the order, None if checkout failed
+            - message: Success/error message
+
+    Note:
+        Runs in one BEGIN IMMEDIATE transaction: checks each line against
+        the stock not held by other carts, snapshots prices, applies the
+        discount and counts its use, records the order and its items,
+        decrements stock, then clears the cart and its holds. Any failure
+        rolls everything back. A token that already placed an order returns
+        that order instead of charging twice.
+    """
+    conn = get_connection()
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        cursor = conn.cursor()
+
+        # A repeated submission of the same attempt returns the order it already placed
+        cursor.execute("SELECT id FROM Orders WHERE client_token = ?", (client_token,))
+        existing = cursor.fetchone()
+        if existing:
+            conn.rollback()
+            return True, existing[0], "Order already placed"
+
+        # Snapshot each line with the price at the moment of purchase
+        cursor.execute("""
+            SELECT p.id, p.name, p.price, c.quantity, p.stock
+            FROM ShoppingCart c
+            JOIN Products p ON c.product_id = p.id
+            WHERE c.user_id = ?
+            ORDER BY c.id
+        """, (user_id,))
+        lines = cursor.fetchall()
+        if not lines:
+            conn.rollback()
+            return False, None, "Your cart is empty"
+
+        # Only stock not held by other carts can be bought
+        now = time.time()
+        for product_id, name, _, quantity, stock in lines:
+            cursor.execute(f"SELECT {HELD_BY_OTHERS_SQL}", (product_id, now, user_id))
+            available = stock - cursor.fetchone()[0]
+            if quantity > available:
+                conn.rollback()
+                return False, None, f"Only {max(available, 0)} of {name} available"
+
+        subtotal = round(sum(price * quantity for _, _, price, quantity, _ in lines), 2)
+        percentage = 0
+        if discount_id is not None:
+            cursor.execute("SELECT percentage, active FROM Discounts WHERE id = ?", (discount_id,))
+            discount = cursor.fetchone()
+            if not discount or not discount[1]:
+                conn.rollback()
+                return False, None, "Discount is no longer available"
+            percentage = discount[0]
+            # Uses are counted on purchase, not when the coupon is scanned
+            record_discount_use(cursor, discount_id)
+        discount_amount = round(subtotal * percentage / 100, 2)
+        total = round(subtotal - discount_amount, 2)
+
+        cursor.execute("""
+            INSERT INTO Orders (user_id, client_token, subtotal, discount_id, discount_percentage,
+                                discount_amount, total)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, (user_id, client_token, subtotal, discount_id, percentage, discount_amount, total))
+        order_id = cursor.lastrowid
+
+        cursor.executemany("""
+            INSERT INTO OrderItems (order_id, product_id, product_name, unit_price, quantity, line_total)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, [(order_id, product_id, name, price, quantity, round(price * quantity, 2))
+              for product_id, name, price, quantity, _ in lines])
+
+        cursor.executemany("UPDATE Products SET stock = stock - ? WHERE id = ?",
+                           [(quantity, product_id) for product_id, _, _, quantity, _ in lines])
+
+        cursor.execute("DELETE FROM ShoppingCart WHERE user_id = ?", (user_id,))
+        release_reservations(cursor, user_id)
+        conn.commit()
+    except Exception as e:
+        conn.rollback()
+        return False, None, f"Error placing order: {str(e)}"
+    finally:
+        conn.close()
+
+    discard_cart_model(user_id)
+    mark_changed('cart', 'products', *(('discounts',) if discount_id is not None else ()))
+    return True, order_id, f"Order #{order_id} placed, total £{total:.2f}"
+
+def get_order(order_id):
+    """Get an order with its items.
+
+    Args:
+        order_id: ID of the order
+
+    Returns:
+        tuple | None: (order, items) or None if not found
+            - order: (id, user_id, created_at, subtotal, discount_percentage, discount_amount, total)
+            - items: List of (product_id, product_name, unit_price, quantity, line_total)
+    """
+    conn = get_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT id, user_id, created_at, subtotal, discount_percentage, discount_amount, total
+            FROM Orders WHERE id = ?
+        """, (order_id,))
+        order = cursor.fetchone()
+        if not order:
+            return None
+        cursor.execute("""
+            SELECT product_id, product_name, unit_price, quantity, line_total
+            FROM OrderItems WHERE order_id = ?
+        """, (order_id,))
+        return order, cursor.fetchall()
+    finally:
+        conn.close()
+
+def get_user_orders(user_id):
+    """Get a user's orders, newest first.
+
+    Args:
+        user_id: ID of the user
+
+    Returns:
+        list: (id, created_at, total) tuples
+    """
+    conn = get_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT id, created_at, total FROM Orders
+            WHERE user_id = ?
+            ORDER BY id DESC
+        """, (user_id,))
+        return cursor.fetchall()
+    finally:
+        conn.close()
@@ -4,6 +4,7 @@ import shutil
 from src.file_system.products.products_manager import handle_product_directory, handle_product_image, handle_qr_code
 from src.file_system.config.config_manager import get_paths
 from src.database.core.connection import get_connection
+from src.database.core.changes import mark_changed
 
 
 def add_product(name, price, qr_code, listed, description, category_id, image, stock):
@@ -43,6 +44,7 @@ def add_product(name, price, qr_code, listed, description, category_id, image, s
         new_product_id = cursor.lastrowid
         conn.commit()
         conn.close()
+        mark_changed('products')
         return True, new_product_id, "Product added successfully"
     except Exception as e:
         return False, None, f"Error adding product: {str(e)}"
@@ -156,6 +158,7 @@ def update_product(product_id, name, price, qr_code, description, category_id, i
                     print(f"Error removing old directory: {e}")
         
         conn.commit()
+        mark_changed('products')
         return True
         
     except Exception as e:
@@ -186,6 +189,7 @@ def delete_product(product_id):
     cursor.execute("DELETE FROM Products WHERE id = ?", (product_id,))
     conn.commit()
     conn.close()
+    mark_changed('products')
     
     # Then clean up filesystem
     if os.path.exists(product_dir):
@@ -203,6 +207,7 @@ def list_product(product_id, listed):
     cursor.execute("UPDATE Products SET listed = ? WHERE id = ?", (listed, product_id))
     conn.commit()
     conn.close()
+    mark_changed('products')
 
 def get_products(listed_only=True):
     """Retrieve all products from the database.
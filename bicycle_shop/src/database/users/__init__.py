@@ -2,6 +2,9 @@ from .user_manager import (
     initialize_admin,
     get_current_user_admin_status,
     get_all_users,
+    get_users_page,
+    USER_PAGE_SIZE,
+    USER_SORT_ORDERS,
     update_user_details,
     get_username_by_id,
     get_user_id_by_username,
@@ -11,11 +14,23 @@ from .user_manager import (
     register_user,
     update_user_password
 )
+from .bulk import (
+    read_user_records,
+    import_users,
+    write_import_report,
+    export_users,
+    write_users_csv,
+    write_users_jsonl,
+    USER_WRITERS
+)
 
 __all__ = [
     'initialize_admin',
     'get_current_user_admin_status',
     'get_all_users',
+    'get_users_page',
+    'USER_PAGE_SIZE',
+    'USER_SORT_ORDERS',
     'update_user_details',
     'get_username_by_id',
     'get_user_id_by_username',
@@ -23,5 +38,12 @@ __all__ = [
     'promote_user_to_admin',
     'demote_user_from_admin',
     'register_user',
-    'update_user_password'
+    'update_user_password',
+    'read_user_records',
+    'import_users',
+    'write_import_report',
+    'export_users',
+    'write_users_csv',
+    'write_users_jsonl',
+    'USER_WRITERS'
 ]
\ No newline at end of file
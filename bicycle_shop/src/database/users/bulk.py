@@ -0,0 +1,297 @@
+import csv
+import json
+import multiprocessing
+import os
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from src.auth.core import hash_password, get_password_hash_settings
+from src.database.core.connection import get_connection
+from src.database.core.changes import mark_changed
+
+# Users validated, hashed and inserted per transaction during an import
+IMPORT_CHUNK_SIZE = 500
+# Rows pulled from the cursor at a time while streaming an export
+EXPORT_FETCH_SIZE = 500
+
+# Exported columns, passwords and salts are never exported
+USER_EXPORT_COLUMNS = ('id', 'username', 'first_name', 'last_name', 'age', 'is_admin')
+
+# Columns every imported record must have, is_admin is optional
+USER_IMPORT_FIELDS = ('username', 'first_name', 'last_name', 'password', 'age')
+
+def read_user_records(file_path):
+    """Stream user records from an import file.
+
+    Args:
+        file_path: Path to a .csv file with a header row, a .json file holding
+                   a list of objects or a .jsonl file with one object per line
+
+    Yields:
+        dict: One record per user, keyed by column name
+
+    Raises:
+        ValueError: If the file type is not supported
+    """
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension == '.csv':
+        with open(file_path, newline='', encoding='utf-8-sig') as f:
+            yield from csv.DictReader(f)
+    elif extension == '.jsonl':
+        with open(file_path, encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    elif extension == '.json':
+        with open(file_path, encoding='utf-8') as f:
+            yield from json.load(f)
+    else:
+        raise ValueError(f"Unsupported user import file type: {extension}")
+
+def import_users(records, chunk_size=IMPORT_CHUNK_SIZE, workers=None, on_progress=None):
+    """Create many users at once.
+
+    Args:
+        records: Iterable of dicts with username, first_name, last_name,
+                 password, age and optionally is_admin
+        chunk_size: Users validated, hashed and inserted per transaction
+        workers: Processes used for password hashing (default: one per CPU)
+        on_progress: Optional callback taking (rows processed, users imported)
+                     called after each chunk, runs on the importing thread
+
+    Returns:
+        tuple: (imported, errors)
+            - imported: Number of users created
+            - errors: List of (row, username, message) tuples for rejected
+                      records, row counting records from 1
+
+    Note:
+        Each record gets the same checks as registration through
+        validate_user_fields, with usernames checked against the database
+        once per chunk instead of once per row. Password hashing is spread
+        over a process pool since it dominates the cost, and each chunk is
+        inserted in a single transaction. Usernames are unique regardless of
+        case. Imported admins must change their password on first login,
+        like the default admin.
+    """
+    # Imported lazily, the validation package pulls in the GUI utilities
+    from src.utils.validation.users import validate_user_fields
+
+    algorithm, params = get_password_hash_settings()
+    hasher = partial(hash_password, algorithm=algorithm, params=params)
+
+    imported = 0
+    errors = []
+    seen = set()
+    processed = 0
+    # Spawned workers start clean, forking from the running app would copy
+    # locks held by its other threads (log writer, sqlite) into the children
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn')) as pool:
+        for chunk in _chunks(enumerate(records, start=1), chunk_size):
+            valid = []
+            for row, record in chunk:
+                user, message = _parse_user_record(record)
+                if user is not None:
+                    is_valid, message = validate_user_fields(
+                        user['username'], user['first_name'], user['last_name'],
+                        user['password'], user['password'], user['age'], check_unique=False
+                    )
+                    # Usernames differing only in case count as the same, like registration
+                    if is_valid and user['username'].lower() in seen:
+                        is_valid, message = False, "Username appears more than once in the import."
+                    if is_valid:
+                        seen.add(user['username'].lower())
+                        valid.append((row, user))
+                        continue
+                errors.append((row, str(record.get('username', '')) if isinstance(record, dict) else '', message))
+
+            valid = _drop_existing_usernames(valid, errors)
+            if valid:
+                workers_used = workers or os.cpu_count() or 1
+                hashes = pool.map(hasher, [user['password'] for _, user in valid],
+                                  chunksize=max(1, len(valid) // (workers_used * 4)))
+                imported += _insert_users(list(zip(valid, hashes)), errors)
+
+            processed += len(chunk)
+            if on_progress:
+                on_progress(processed, imported)
+
+    if imported:
+        mark_changed('users')
+    errors.sort()
+    return imported, errors
+
+def write_import_report(errors, file):
+    """Write the rejected records of an import as CSV.
+
+    Args:
+        errors: Error list returned by import_users
+        file: Text file opened with newline=''
+
+    Returns:
+        int: Number of rows written
+    """
+    writer = csv.writer(file)
+    writer.writerow(('row', 'username', 'error'))
+    writer.writerows(errors)
+    return len(errors)
+
+def export_users(fetch_size=EXPORT_FETCH_SIZE):
+    """Stream every user ordered by ID.
+
+    Args:
+        fetch_size: Rows pulled from the cursor at a time
+
+    Yields:
+        tuple: One row per user in USER_EXPORT_COLUMNS order
+
+    Note:
+        Memory stays constant however many users are registered. The
+        connection stays open until the generator is exhausted or closed.
+    """
+    conn = get_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute(f"SELECT {', '.join(USER_EXPORT_COLUMNS)} FROM Users ORDER BY id")
+        while True:
+            rows = cursor.fetchmany(fetch_size)
+            if not rows:
+                break
+            yield from rows
+    finally:
+        conn.close()
+
+def write_users_csv(rows, file):
+    """Write user rows to a file as CSV with a header row.
+
+    Args:
+        rows: Iterable of rows from export_users
+        file: Text file opened with newline=''
+
+    Returns:
+        int: Number of rows written
+    """
+    writer = csv.writer(file)
+    writer.writerow(USER_EXPORT_COLUMNS)
+    count = 0
+    for row in rows:
+        writer.writerow(row)
+        count += 1
+    return count
+
+def write_users_jsonl(rows, file):
+    """Write user rows to a file as JSON lines, one object per row.
+
+    Args:
+        rows: Iterable of rows from export_users
+        file: Text file to write to
+
+    Returns:
+        int: Number of rows written
+    """
+    count = 0
+    for row in rows:
+        file.write(json.dumps(dict(zip(USER_EXPORT_COLUMNS, row))) + "\n")
+        count += 1
+    return count
+
+# Writers by file extension, used by the admin export
+USER_WRITERS = {
+    '.csv': write_users_csv,
+    '.jsonl': write_users_jsonl
+}
+
+def _chunks(items, size):
+    """Split an iterable into lists of at most size items without reading it all."""
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def _parse_user_record(record):
+    """Normalise an import record.
+
+    Returns:
+        tuple: (user dict or None, error message)
+    """
+    if not isinstance(record, dict):
+        return None, "Record is not an object."
+    missing = [field for field in USER_IMPORT_FIELDS if field not in record]
+    if missing:
+        return None, f"Missing fields: {', '.join(missing)}"
+
+    user = {field: str(record[field]).strip() if record[field] is not None else "" for field in USER_IMPORT_FIELDS}
+    # Passwords are taken as given, spaces may be part of them
+    user['password'] = "" if record['password'] is None else str(record['password'])
+    is_admin = record.get('is_admin', False)
+    if isinstance(is_admin, str):
+        is_admin = is_admin.strip().lower() in ('1', 'true', 'yes', 'y')
+    user['is_admin'] = bool(is_admin)
+    return user, "Valid"
+
+def _drop_existing_usernames(valid, errors):
+    """Reject records whose username is already registered in any case, one query per chunk."""
+    if not valid:
+        return valid
+    usernames = [user['username'] for _, user in valid]
+    conn = get_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute(f"SELECT username FROM Users WHERE username COLLATE NOCASE IN ({', '.join('?' * len(usernames))})",
+                       usernames)
+        existing = {row[0].lower() for row in cursor.fetchall()}
+    finally:
+        conn.close()
+
+    remaining = []
+    for row, user in valid:
+        if user['username'].lower() in existing:
+            errors.append((row, user['username'], "Username already exists."))
+        else:
+            remaining.append((row, user))
+    return remaining
+
+def _insert_users(hashed_users, errors):
+    """Insert one chunk of validated users in a single transaction.
+
+    Returns:
+        int: Number of users inserted
+
+    Note:
+        If the chunk is rejected (a username registered meanwhile), it is
+        retried row by row so only the conflicting records are reported.
+    """
+    rows = [
+        (user['username'], user['first_name'], user['last_name'], password_hash, None,
+         int(user['age']), int(user['is_admin']), 0 if user['is_admin'] else 1)
+        for (_, user), password_hash in hashed_users
+    ]
+    query = """
+        INSERT INTO Users (username, first_name, last_name, password, salt, age, is_admin, password_changed)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    conn = get_connection()
+    try:
+        try:
+            conn.executemany(query, rows)
+            conn.commit()
+            return len(rows)
+        except sqlite3.IntegrityError:
+            conn.rollback()
+
+        inserted = 0
+        for ((row, user), _), values in zip(hashed_users, rows):
+            try:
+                conn.execute(query, values)
+                inserted += 1
+            except sqlite3.IntegrityError:
+                errors.append((row, user['username'], "Username already exists."))
+        conn.commit()
+        return inserted
+    finally:
+        conn.close()
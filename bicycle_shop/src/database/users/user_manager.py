@@ -1,6 +1,7 @@
 import sqlite3
 from src.auth.core import hash_password
 from src.database.core.connection import get_connection
+from src.database.core.changes import mark_changed
 
 def register_user(username, first_name, last_name, password, age):
     """Register a new user in the database.
@@ -21,8 +22,8 @@ def register_user(username, first_name, last_name, password, age):
     Raises:
         sqlite3.IntegrityError: If username already exists
     """
-    # Hash pasword with random salt for security
-    salt, hashed_password = hash_password(password)
+    # Hash pasword with random salt for security, the salt is stored inside the encoded hash
+    hashed_password = hash_password(password)
 
     conn = get_connection()
     cursor = conn.cursor()
@@ -32,9 +33,10 @@ def register_user(username, first_name, last_name, password, age):
         cursor.execute("""
             INSERT INTO Users (username, first_name, last_name, password, salt, age, is_admin, password_changed) 
             VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, (username, first_name, last_name, hashed_password, salt, age, 0, 1))
+        """, (username, first_name, last_name, hashed_password, None, age, 0, 1))
         user_id = cursor.lastrowid
         conn.commit()
+        mark_changed('users')
         return True, user_id, "Registration successful."
     except sqlite3.IntegrityError:
         # Handle duplicate username case
@@ -54,8 +56,8 @@ def update_user_password(username, new_password):
             - success: True if password was updated
             - message: Success/error message
     """
-    # Generate new salt and hash for security
-    salt, hashed_password = hash_password(new_password)
+    # Generate new salt and hash for security, the salt is stored inside the encoded hash
+    hashed_password = hash_password(new_password)
     
     # Establish a connection to the database
     conn = get_connection()
@@ -68,7 +70,7 @@ def update_user_password(username, new_password):
                 salt = ?, 
                 password_changed = 1 
             WHERE username = ?
-        """, (hashed_password, salt, username))
+        """, (hashed_password, None, username))
         # Commit the changes to the database
         conn.commit()
         return True, "Password updated successfully!"
@@ -102,7 +104,7 @@ def initialize_admin():
     if not cursor.fetchone():
         # Create default admin from config settings
         admin_settings = get_default_admin()
-        salt, hashed_password = hash_password(admin_settings['password'])
+        hashed_password = hash_password(admin_settings['password'])
 
         # Set password_changed to 0 to force the admin user to change the default password on first login from the one in config.ini
         cursor.execute("""
@@ -113,7 +115,7 @@ def initialize_admin():
             admin_settings['first_name'], 
             admin_settings['last_name'],
             hashed_password,
-            salt,
+            None,  # salt, kept inside the encoded hash
             admin_settings['age'],
             1,  # is_admin
             0   # password_changed
@@ -165,6 +167,98 @@ def get_all_users():
     finally:
         conn.close()
 
+# Number of users shown per page on the manage users screen
+USER_PAGE_SIZE = 50
+
+# Sort orders for get_users_page: name -> sort key columns, ending with id so keys are unique.
+# NOCASE keys match the indexes created in create_tables.
+USER_SORT_ORDERS = {
+    'id': ('id',),
+    'username': ('username COLLATE NOCASE', 'id'),
+    'name': ('last_name COLLATE NOCASE', 'first_name COLLATE NOCASE', 'id')
+}
+
+def get_users_page(search=None, is_admin=None, order_by='id', cursor=None, limit=USER_PAGE_SIZE):
+    """Fetch one page of users using keyset pagination.
+    
+    Args:
+        search: Prefix matched case-insensitively against username, first
+                name and last name (None or blank for all users)
+        is_admin: True for admins only, False for customers only, None for both
+        order_by: Sort order from USER_SORT_ORDERS ('id', 'username' or 'name')
+        cursor: Cursor returned with the previous page (None for the first page)
+        limit: Maximum number of users to return
+        
+    Returns:
+        tuple: (users, next_cursor)
+            - users: List of (id, username, first_name, last_name, age, is_admin) tuples
+            - next_cursor: Cursor for the following page, None if this is the last page
+            
+    Raises:
+        ValueError: If order_by is not a known sort order
+        
+    Note:
+        Each search term is a range read on a NOCASE index and pages
+        continue from the sort key of the last row instead of an OFFSET, so
+        any page costs the same however many users are registered.
+    """
+    if order_by not in USER_SORT_ORDERS:
+        raise ValueError(f"Unknown user sort order: {order_by}")
+    sort_columns = USER_SORT_ORDERS[order_by]
+
+    conditions = []
+    params = []
+    if search and search.strip():
+        # Escape LIKE wildcards so the search is a plain prefix, which SQLite serves from the indexes
+        pattern = search.strip().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        # One indexed lookup per column, an OR across columns would fall back to a full scan
+        conditions.append("""id IN (
+            SELECT id FROM Users WHERE username LIKE ? ESCAPE '\\'
+            UNION SELECT id FROM Users WHERE first_name LIKE ? ESCAPE '\\'
+            UNION SELECT id FROM Users WHERE last_name LIKE ? ESCAPE '\\'
+        )""")
+        params.extend([pattern] * 3)
+    if is_admin is not None:
+        conditions.append("is_admin = ?")
+        params.append(1 if is_admin else 0)
+    if cursor is not None:
+        if len(sort_columns) == 1:
+            conditions.append(f"{sort_columns[0]} > ?")
+            params.append(cursor[0])
+        else:
+            # Bound on the leading column lets SQLite seek the index, the row value breaks ties
+            conditions.append(f"{sort_columns[0]} >= ? AND ({', '.join(sort_columns)}) > ({', '.join('?' * len(sort_columns))})")
+            params.append(cursor[0])
+            params.extend(cursor)
+
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    conn = get_connection()
+    try:
+        # Fetch one extra row to know whether another page follows
+        users = conn.execute(f"""
+            SELECT id, username, first_name, last_name, age, is_admin
+            FROM Users
+            {where}
+            ORDER BY {', '.join(sort_columns)}
+            LIMIT ?
+        """, params + [limit + 1]).fetchall()
+    finally:
+        conn.close()
+
+    if len(users) <= limit:
+        return users, None
+    users = users[:limit]
+    return users, _user_sort_key(users[-1], order_by)
+
+def _user_sort_key(user, order_by):
+    """Get the cursor values of a user row for a sort order."""
+    user_id, username, first_name, last_name = user[:4]
+    if order_by == 'username':
+        return (username, user_id)
+    if order_by == 'name':
+        return (last_name, first_name, user_id)
+    return (user_id,)
+
 def update_user_details(user_id, first_name, last_name, age, is_admin):
     """Update user details in database.
     
@@ -204,6 +298,7 @@ def update_user_details(user_id, first_name, last_name, age, is_admin):
             WHERE id = ?
         """, (first_name, last_name, age, is_admin, user_id))
         conn.commit()
+        mark_changed('users')
         return True, "User updated successfully"
     except sqlite3.Error as e:
         # Handle any errors that occur during the update
@@ -293,6 +388,7 @@ def delete_user(user_id):
         # Delete the user from the database
         cursor.execute("DELETE FROM Users WHERE id = ?", (user_id,))
         conn.commit()
+        mark_changed('users')
         return True, "User deleted successfully"
     except sqlite3.Error as e:
         return False, f"Error deleting user: {str(e)}"
@@ -311,6 +407,7 @@ def promote_user_to_admin(user_id):
     cursor.execute("UPDATE Users SET is_admin = 1 WHERE id = ?", (user_id,))
     conn.commit()
     conn.close()
+    mark_changed('users')
 
 def demote_user_from_admin(user_id, current_admin_id):
     """Demote a user from admin status.
@@ -348,4 +445,5 @@ def demote_user_from_admin(user_id, current_admin_id):
     cursor.execute("UPDATE Users SET is_admin = 0 WHERE id = ?", (user_id,))
     conn.commit()
     conn.close()
+    mark_changed('users')
     return "User demoted successfully."
\ No newline at end of file
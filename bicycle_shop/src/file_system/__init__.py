@@ -4,6 +4,9 @@ from .config import (
     verify_config,
     get_application_settings,
     get_logging_settings,
+    get_alert_settings,
+    get_security_settings,
+    get_store_settings,
     get_user_logging_status,
     set_user_logging_status,
     get_theme,
@@ -36,7 +39,8 @@ from .products import (
 __all__ = [
     # Config
     'get_absolute_path', 'create_initial_config', 'verify_config',
-    'get_application_settings', 'get_logging_settings',
+    'get_application_settings', 'get_logging_settings', 'get_alert_settings', 'get_security_settings',
+    'get_store_settings',
     'get_user_logging_status', 'set_user_logging_status',
     'get_theme', 'get_default_admin', 'get_paths', 'get_icon_paths',
     
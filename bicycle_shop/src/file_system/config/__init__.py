@@ -4,6 +4,9 @@ from .config_manager import (
     verify_config,
     get_application_settings,
     get_logging_settings,
+    get_alert_settings,
+    get_security_settings,
+    get_store_settings,
     get_user_logging_status,
     set_user_logging_status,
     get_theme,
@@ -20,6 +23,9 @@ __all__ = [
     'verify_config',
     'get_application_settings',
     'get_logging_settings',
+    'get_alert_settings',
+    'get_security_settings',
+    'get_store_settings',
     'get_user_logging_status',
     'set_user_logging_status',
     'get_theme',
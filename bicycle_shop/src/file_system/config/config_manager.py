@@ -39,6 +39,22 @@ SECTION_COMMENTS = {
         '# start_maximized: True to start in maximized window mode',
     ],
     'Logging': "# Logging configuration settings",
+    'Alerts': [
+        "# Dashboard alert thresholds, an alert shows once a count reaches its threshold",
+        "# *_window_minutes: How far back events are counted (at most 1440)"
+    ],
+    'Security': [
+        "# Password hashing cost, higher is slower to crack but slower to sign in",
+        "# password_algorithm: pbkdf2_sha256 or scrypt, used for new hashes",
+        "# password_iterations: PBKDF2-SHA256 iterations, scrypt_n/r/p: scrypt cost",
+        "# Existing passwords are rehashed with these settings on their next successful login",
+        "# login_*: Failed login throttling, accounts back off exponentially and lock after",
+        "# login_max_failures within the window, terminals back off after login_terminal_max_failures"
+    ],
+    'Store': [
+        "# cart_hold_minutes: How long items added to a cart are reserved from other tills",
+        "# reservation_sweep_seconds: How often expired reservations are cleared"
+    ],
     'Theme': "# Color scheme settings for the application interface",
     'DefaultAdmin': [
         "# Default administrator account settings (only used on first setup)",
@@ -57,7 +73,44 @@ DEFAULT_CONFIG = {
         'start_max_windowed': 'True',
     },
     'Logging': {
-        'user_logging_enabled': 'True'
+        'user_logging_enabled': 'True',
+        'tail_max_lines': '1000',
+        'tail_poll_interval_ms': '1000',
+        'retention_days': '90',
+        'retention_max_rows': '100000',
+        'log_level': 'INFO',
+        'log_max_bytes': '5000000',
+        'log_rotate_interval_hours': '24',
+        'log_backup_count': '5',
+        'log_compress_rotated': 'True'
+    },
+    'Alerts': {
+        'failed_admin_login_threshold': '2',
+        'failed_admin_login_window_minutes': '60',
+        'failed_user_login_threshold': '3',
+        'failed_user_login_window_minutes': '30',
+        'discount_use_threshold': '10',
+        'discount_use_window_minutes': '60',
+        'low_stock_threshold': '5',
+        'login_lockout_threshold': '1',
+        'login_lockout_window_minutes': '60'
+    },
+    'Security': {
+        'password_algorithm': 'pbkdf2_sha256',
+        'password_iterations': '100000',
+        'scrypt_n': '16384',
+        'scrypt_r': '8',
+        'scrypt_p': '1',
+        'login_max_failures': '5',
+        'login_terminal_max_failures': '20',
+        'login_failure_window_minutes': '15',
+        'login_lockout_minutes': '15',
+        'login_backoff_max_seconds': '30',
+        'login_throttle_persist': 'True'
+    },
+    'Store': {
+        'cart_hold_minutes': '30',
+        'reservation_sweep_seconds': '60'
     },
     'Theme': {
         'color_primary': '#171d22',
@@ -78,7 +131,9 @@ DEFAULT_CONFIG = {
     },
     'Paths': {
         'products_dir': './Products',
-        'icons_dir': './Icons'
+        'icons_dir': './Icons',
+        'log_archive_dir': './LogArchive',
+        'logs_dir': './Logs'
     },
     'Icons': {
         'password_show': 'visible.png',
@@ -99,6 +154,8 @@ def get_paths():
         dict: Directory paths with keys:
             - products_dir: Path to products directory
             - icons_dir: Path to icons directory
+            - log_archive_dir: Path to archived log files
+            - logs_dir: Path to application log files
     """
     if not os.path.exists(CONFIG_PATH):
         # Create initial config file if it doesn't exist
@@ -108,7 +165,9 @@ def get_paths():
     # Return the absolute paths for products and icons directories
     return {
         'products_dir': get_absolute_path(config['Paths']['products_dir']),
-        'icons_dir': get_absolute_path(config['Paths']['icons_dir'])
+        'icons_dir': get_absolute_path(config['Paths']['icons_dir']),
+        'log_archive_dir': get_absolute_path(config['Paths'].get('log_archive_dir', './LogArchive')),
+        'logs_dir': get_absolute_path(config['Paths'].get('logs_dir', './Logs'))
     }
 
 def get_icon_paths():
@@ -247,6 +306,15 @@ def get_logging_settings():
     Returns:
         dict: Logging settings with keys:
             - user_logging_enabled: Whether user logging is enabled
+            - tail_max_lines: Maximum lines kept on screen in live tail mode
+            - tail_poll_interval_ms: How often live tail mode checks for new logs
+            - retention_days: Age after which log rows are archived (0 to keep forever)
+            - retention_max_rows: Rows kept per log table before archiving (0 for no limit)
+            - log_level: Minimum level written to the application log file
+            - log_max_bytes: Size at which the application log rotates (0 to disable)
+            - log_rotate_interval_hours: Age at which the application log rotates (0 to disable)
+            - log_backup_count: Rotated application logs kept
+            - log_compress_rotated: Whether rotated application logs are gzipped
     """
     if not os.path.exists(CONFIG_PATH):
         # Create initial config file if it doesn't exist
@@ -255,9 +323,98 @@ def get_logging_settings():
     config.read(CONFIG_PATH)
     # Return logging settings from the config file
     return {
-        'user_logging_enabled': config['Logging'].getboolean('user_logging_enabled', fallback=True)
+        'user_logging_enabled': config['Logging'].getboolean('user_logging_enabled', fallback=True),
+        # Fallbacks keep older config files without these keys working
+        'tail_max_lines': config['Logging'].getint('tail_max_lines', fallback=1000),
+        'tail_poll_interval_ms': config['Logging'].getint('tail_poll_interval_ms', fallback=1000),
+        'retention_days': config['Logging'].getint('retention_days', fallback=90),
+        'retention_max_rows': config['Logging'].getint('retention_max_rows', fallback=100000),
+        'log_level': config['Logging'].get('log_level', fallback='INFO').upper(),
+        'log_max_bytes': config['Logging'].getint('log_max_bytes', fallback=5000000),
+        'log_rotate_interval_hours': config['Logging'].getint('log_rotate_interval_hours', fallback=24),
+        'log_backup_count': config['Logging'].getint('log_backup_count', fallback=5),
+        'log_compress_rotated': config['Logging'].getboolean('log_compress_rotated', fallback=True)
+    }
+
+def get_alert_settings():
+    """Get dashboard alert thresholds and windows.
+    
+    Returns:
+        dict: Alert settings with keys:
+            - failed_admin_login_threshold / failed_admin_login_window_minutes
+            - failed_user_login_threshold / failed_user_login_window_minutes
+            - discount_use_threshold / discount_use_window_minutes
+            - low_stock_threshold: Stock level below which listed products are flagged
+            - login_lockout_threshold / login_lockout_window_minutes
+            
+    Note:
+        Config files created before the Alerts section existed use the defaults.
+    """
+    if not os.path.exists(CONFIG_PATH):
+        # Create initial config file if it doesn't exist
+        create_initial_config()
+    # Read the config file
+    config.read(CONFIG_PATH)
+    defaults = DEFAULT_CONFIG['Alerts']
+    section = config['Alerts'] if config.has_section('Alerts') else {}
+    # Return every alert setting as an integer, falling back to the defaults
+    return {
+        key: int(section.get(key, default)) for key, default in defaults.items()
     }
 
+def get_security_settings():
+    """Get password hashing settings.
+    
+    Returns:
+        dict: Security settings with keys:
+            - password_algorithm: Algorithm for new password hashes
+            - password_iterations: PBKDF2-SHA256 iterations for password hashes
+            - scrypt_n, scrypt_r, scrypt_p: scrypt cost parameters
+            - login_max_failures: Failures before an account is locked
+            - login_terminal_max_failures: Failures before a terminal backs off
+            - login_failure_window_minutes: How long failures count towards a lockout
+            - login_lockout_minutes: How long a lockout lasts
+            - login_backoff_max_seconds: Longest delay between attempts on one account
+            - login_throttle_persist: Whether failures survive a restart
+            
+    Note:
+        Config files created before the Security section existed use the defaults.
+    """
+    if not os.path.exists(CONFIG_PATH):
+        # Create initial config file if it doesn't exist
+        create_initial_config()
+    # Read the config file
+    config.read(CONFIG_PATH)
+    defaults = DEFAULT_CONFIG['Security']
+    section = config['Security'] if config.has_section('Security') else {}
+    settings = {key: section.get(key, default) for key, default in defaults.items()}
+    settings['login_throttle_persist'] = str(settings['login_throttle_persist']).lower() in ('true', '1', 'yes', 'on')
+    # Every other setting except the algorithm name is an integer
+    return {
+        key: value if key in ('password_algorithm', 'login_throttle_persist') else int(value)
+        for key, value in settings.items()
+    }
+
+def get_store_settings():
+    """Get store stock reservation settings.
+    
+    Returns:
+        dict: Store settings with keys:
+            - cart_hold_minutes: How long cart items reserve their stock
+            - reservation_sweep_seconds: Interval of the expired reservation sweeper
+            
+    Note:
+        Config files created before the Store section existed use the defaults.
+    """
+    if not os.path.exists(CONFIG_PATH):
+        # Create initial config file if it doesn't exist
+        create_initial_config()
+    # Read the config file
+    config.read(CONFIG_PATH)
+    defaults = DEFAULT_CONFIG['Store']
+    section = config['Store'] if config.has_section('Store') else {}
+    return {key: int(section.get(key, default)) for key, default in defaults.items()}
+
 def get_user_logging_status():
     """Get user logging status from config.
     
@@ -1,7 +1,7 @@
 import tkinter as tk
 from tkinter import messagebox
 
-from src.database import get_current_user_admin_status
+from src.auth import is_session_admin
 from src.database.categories.category_manager import (
     get_categories, add_category, update_category, 
     delete_category, get_category_id, get_category_name
@@ -28,7 +28,7 @@ def show_manage_categories_screen(global_state):
         global_state: Global application state containing:
             - window: Main window instance
             - content_inner_frame: Main content frame
-            - current_username: Current user's username
+            - session: Signed in user's session
             - current_admin_id: Current admin's ID
             
     Note:
@@ -37,16 +37,16 @@ def show_manage_categories_screen(global_state):
     """
     # Pull/push from/to global state manager
     global_state['current_screen'] = show_manage_categories_screen
+    # Role comes from the session, refreshed first if users changed so the ids below are current
+    if not is_session_admin(global_state):
+        from ..store.listing import switch_to_store_listing
+        switch_to_store_listing(global_state)
+        return
+
     window = global_state['window']
     content_inner_frame = global_state['content_inner_frame']
-    current_username = global_state['current_username']
     current_admin_id = global_state['current_admin_id']
 
-    if not get_current_user_admin_status(current_username):
-        from ..store.listing import switch_to_store_listing
-        switch_to_store_listing(is_admin=False)
-        return
-
     # Unbind existing events before clearing frame
     window.unbind("<Configure>")
     window.unbind("<Button-1>")
@@ -1,12 +1,13 @@
 import tkinter as tk
 from tkinter import scrolledtext
-import os
 
-from src.database.logging import get_dashboard_stats, get_dashboard_alerts, export_logs_to_temp_file
+from src.auth import is_session_admin, get_locked_accounts, unlock_account
+from src.database.users.user_manager import get_user_id_by_username
+from src.database.logging import get_dashboard_stats, get_dashboard_alerts, get_log_page, LOG_PAGE_SIZE
 from src.utils.display import (
     create_nav_buttons, create_user_info_display, clear_frame,
     show_dropdown, hide_dropdown, hide_dropdown_on_click,
-    center_window
+    center_window, create_paged_log_loader
 )
 from src.utils.theme import get_style_config
 from src.utils.logging import log_action
@@ -43,6 +44,11 @@ def switch_to_admin_panel(global_state):
     """
     # Extract needed values from global_state
     global_state['current_screen'] = switch_to_admin_panel
+    # Role comes from the session, refreshed first if users changed so the details below are current
+    if not is_session_admin(global_state):
+        switch_to_store_listing(global_state)
+        return
+
     window = global_state['window']
     main_frame = global_state['main_frame']
     window_state = global_state['window_state']
@@ -202,7 +208,9 @@ def switch_to_admin_panel(global_state):
         ("Total Products", stats['total_products']),
         ("Listed Products", stats['listed_products']),
         ("Total Users", stats['total_users']),
-        ("Active Discounts", stats['active_discounts'])
+        ("Active Discounts", stats['active_discounts']),
+        ("Inventory Value", f"£{stats['inventory_value']:.2f}"),
+        ("Items In Carts", stats['cart_items'])
     ]
 
     # Iterate over the stats items and create labels for each stat item
@@ -240,6 +248,25 @@ def switch_to_admin_panel(global_state):
         tk.Label(alerts_container, text="No current alerts",
                 **styles['dashboard']['alert_text']).pack(fill="x", padx=10, pady=10)
 
+    def unlock(username, row_frame):
+        """Lift an account lockout and remove its row from the alerts."""
+        unlock_account(username)
+        log_action('MANAGE_USER', is_admin=True, admin_id=global_state['current_admin_id'],
+                  target_type='user', target_id=get_user_id_by_username(username),
+                  details=f"Unlocked login for user: {username}")
+        row_frame.destroy()
+
+    # Locked accounts, each with an unlock so an admin does not have to wait out the lockout
+    for username, remaining in get_locked_accounts():
+        locked_frame = tk.Frame(alerts_container, **styles['dashboard']['section_frame'])
+        locked_frame.pack(fill="x", padx=5, pady=2)
+        locked_style = styles['dashboard']['alert_text'].copy()
+        locked_style.update({'fg': 'red', 'anchor': 'w'})
+        tk.Label(locked_frame, text=f"Locked: {username} ({int(remaining // 60) + 1} min left)",
+                **locked_style).pack(side="left", fill="x", expand=True, padx=5, pady=2)
+        tk.Button(locked_frame, text="Unlock", **styles['dropdown']['buttons'],
+                 command=lambda name=username, row=locked_frame: unlock(name, row)).pack(side="right", padx=5)
+
     # Logs section
     log_frame = tk.Frame(bottom_frame, bg=styles['content']['inner_frame']['bg'])
     log_frame.pack(fill="both", expand=True)
@@ -250,18 +277,14 @@ def switch_to_admin_panel(global_state):
     admin_log_text = scrolledtext.ScrolledText(log_frame, height=10, width=50, **styles['dashboard']['log_text'])
     admin_log_text.pack(fill="both", expand=True)
 
-    # Export the admin logs to a temporary file
-    log_file = export_logs_to_temp_file(admin_only=True)
-    
-    # Open the temporary log file and read its contents
-    with open(log_file, 'r') as f:
-        # Clear the current content of the scrolled text widget
-        admin_log_text.delete('1.0', tk.END)
-        # Insert the log file content into the scrolled text widget
-        admin_log_text.insert(tk.END, f.read())
-    
-    # Remove the temporary log file after reading its content
-    os.remove(log_file)
+    # Load admin logs a page at a time, older pages load as the user scrolls
+    load_admin_logs = create_paged_log_loader(
+        admin_log_text, admin_log_text.vbar,
+        lambda before_id, limit: get_log_page(admin_only=True, before_id=before_id, limit=limit),
+        LOG_PAGE_SIZE,
+        on_error=lambda e: print(f"Error loading admin logs: {e}")
+    )
+    load_admin_logs()
 
     # Update global state held values
     global_state.update({
@@ -3,8 +3,9 @@ from tkinter import messagebox
 
 from src.database import (
     get_all_discounts, add_discount, update_discount, 
-    delete_discount, toggle_discount_status, get_current_user_admin_status
+    delete_discount, toggle_discount_status
 )
+from src.auth import is_session_admin
 from src.utils import (
     display_error, display_success, clear_frame, 
     get_style_config, create_scrollable_grid_frame, log_action
@@ -24,7 +25,7 @@ def show_manage_discounts_screen(global_state):
         global_state: Global application state containing:
             - window: Main window instance
             - content_inner_frame: Main content frame
-            - current_username: Current user's username
+            - session: Signed in user's session
             - current_admin_id: Current admin's ID
             
     Note:
@@ -33,16 +34,17 @@ def show_manage_discounts_screen(global_state):
         Creates QR codes automatically for discounts
     """
     global_state['current_screen'] = show_manage_discounts_screen
+    # Role comes from the session, refreshed first if users changed so the ids below are current
+    if not is_session_admin(global_state):
+        # If not an admin, redirect to the store listing
+        from ..store.listing import switch_to_store_listing
+        switch_to_store_listing(global_state)
+        return
+
     window = global_state['window']
     content_inner_frame = global_state['content_inner_frame']
-    current_username = global_state['current_username']
     current_admin_id = global_state['current_admin_id']
 
-    if not get_current_user_admin_status(current_username):
-        # If not an admin, redirect to the store listing
-        from ..store.listing import switch_to_store_listing
-        switch_to_store_listing(is_admin=False)
-        return
     
     # Unbind existing events before clearing frame
     window.unbind("<Configure>")
@@ -1,13 +1,22 @@
-import tkinter as tk
-from tkinter import ttk
 import os
+import threading
+from itertools import islice
+import tkinter as tk
+from tkinter import ttk, filedialog
 
-from src.database.users.user_manager import get_current_user_admin_status
-from src.database.logging.log_manager import export_logs_to_temp_file
-from src.utils.display import display_error, display_success, clear_frame
+from src.auth import is_session_admin
+from src.database.logging.log_manager import get_log_page, get_logs_since, LOG_PAGE_SIZE
+from src.database.logging.retention import list_archive_months, iter_archived_log_rows
+from src.database.logging.export import export_logs, LOG_WRITERS
+from src.utils.display import (
+    display_error, display_success, clear_frame,
+    create_paged_log_loader, start_log_tail
+)
 from src.utils.theme import get_style_config
 from src.utils.logging import log_action
-from src.file_system.config import get_user_logging_status, set_user_logging_status
+from src.file_system.config import (
+    get_user_logging_status, set_user_logging_status, get_logging_settings, get_paths
+)
 
 def show_logging_screen(global_state):
     """Display the logging management screen.
@@ -16,31 +25,36 @@ def show_logging_screen(global_state):
     - Toggling user action logging
     - Viewing user/admin action logs
     - Refreshing log display
-    - Cleaning up temporary log files
+    - Loading older log pages as the view is scrolled
+    - Live tail mode showing new entries as they are written
+    - Browsing archived logs by month
+    - Exporting the selected logs to CSV, JSON lines or text
     
     Args:
         global_state: Application state dictionary containing:
             - window: Main window instance
             - content_inner_frame: Main content frame 
-            - current_username: Current user's username
+            - session: Signed in user's session
             - current_admin_id: Current admin's ID
             
     Note:
         Only accessible by admin users
         Non-admin users are redirected to store listing
-        Temporary log files are cleaned up on window destroy
+        Logs are read in keyset pages and inserted in chunks so large logs never block the UI
+        Live tail line cap and poll interval come from the Logging section of config.ini
+        Archived months are read from the log archive written by the retention policy
     """
     global_state['current_screen'] = show_logging_screen
+    # Role comes from the session, refreshed first if users changed so the ids below are current
+    if not is_session_admin(global_state):
+        from ..store.listing import switch_to_store_listing
+        switch_to_store_listing(global_state)
+        return
+
     window = global_state['window']
     content_inner_frame = global_state['content_inner_frame']
-    current_username = global_state['current_username']
     current_admin_id = global_state['current_admin_id']
 
-    if not get_current_user_admin_status(current_username):
-        from ..store.listing import switch_to_store_listing
-        switch_to_store_listing(is_admin=False)
-        return
-
     clear_frame(content_inner_frame)
     styles = get_style_config()['logging']
 
@@ -114,13 +128,68 @@ def show_logging_screen(global_state):
     log_type_combo = ttk.Combobox(
         filters_frame,
         textvariable=log_type_var,
-        values=["Admin Actions", "User Actions"],
+        values=["Admin Actions", "User Actions", "Archived Admin Actions", "Archived User Actions"],
         state="readonly",
         style='Logging.TCombobox',
-        width=15
+        width=22
     )
     log_type_combo.pack(side="left", padx=5)
-    log_type_combo.bind('<<ComboboxSelected>>', lambda e: refresh_logs())
+
+    # Archive month selection, only used for the archived log types
+    tk.Label(filters_frame, text="Archive Month:", **styles['labels']).pack(side="left", padx=(20, 5))
+    archive_month_var = tk.StringVar(value="")
+    archive_month_combo = ttk.Combobox(
+        filters_frame,
+        textvariable=archive_month_var,
+        values=[],
+        state="disabled",
+        style='Logging.TCombobox',
+        width=8
+    )
+    archive_month_combo.pack(side="left", padx=5)
+    archive_month_combo.bind('<<ComboboxSelected>>', lambda e: refresh_logs())
+
+    archive_dir = get_paths()['log_archive_dir']
+
+    def is_archive_selected():
+        """Check whether an archived log type is selected."""
+        return log_type_var.get().startswith("Archived")
+
+    def is_admin_selected():
+        """Check whether an admin log type (live or archived) is selected."""
+        return log_type_var.get().endswith("Admin Actions")
+
+    def on_log_type_change(event):
+        """Update the archive month choices for the selected log type and reload.
+        
+        Args:
+            event: ComboBox selection event
+        """
+        if is_archive_selected():
+            months = list_archive_months('admin' if is_admin_selected() else 'user', archive_dir)
+            archive_month_combo.configure(values=months, state="readonly")
+            # Default to the newest archived month
+            archive_month_var.set(months[0] if months else "")
+        else:
+            archive_month_combo.configure(values=[], state="disabled")
+            archive_month_var.set("")
+        refresh_logs()
+
+    log_type_combo.bind('<<ComboboxSelected>>', on_log_type_change)
+
+    # Live tail toggle combobox
+    tk.Label(filters_frame, text="Live Tail:", **styles['labels']).pack(side="left", padx=(20, 5))
+    tail_var = tk.StringVar(value="Off")
+    tail_combo = ttk.Combobox(
+        filters_frame,
+        textvariable=tail_var,
+        values=["Off", "On"],
+        state="readonly",
+        style='Logging.TCombobox',
+        width=5
+    )
+    tail_combo.pack(side="left", padx=5)
+    tail_combo.bind('<<ComboboxSelected>>', lambda e: refresh_logs())
 
     # Create main log display frame
     log_frame = tk.Frame(content_inner_frame, **styles['frame'])
@@ -138,63 +207,140 @@ def show_logging_screen(global_state):
     # Make text widget read-only
     log_text.configure(state="disabled")
 
-    def cleanup_temp_files():
-        """Clean up temporary log files.
+    # Open reader of the archived month on display, continued page by page while scrolling
+    archive_cache = {'key': None, 'rows': None, 'last_id': None}
+
+    def load_archive_page(before_id, limit):
+        """Fetch a page of the selected archived month.
         
-        Removes all .log files from temp directory.
-        Called on window destroy and before refreshing logs.
+        Args:
+            before_id: Paging cursor, the id of the last row shown (None for the first page)
+            limit: Maximum rows to return
+            
+        Note:
+            Archives are shown oldest first, the order they are stored in,
+            so each page is streamed from the file and reading stops once
+            the page is full. The reader is kept open for the next page.
+        """
+        kind = 'admin' if is_admin_selected() else 'user'
+        month = archive_month_var.get()
+        if not month:
+            return []
+        if archive_cache['key'] != (kind, month) or archive_cache['last_id'] != before_id:
+            archive_cache.update({
+                'key': (kind, month),
+                'rows': iter_archived_log_rows(kind, archive_dir, month, after_id=before_id)
+            })
+        rows = list(islice(archive_cache['rows'], limit))
+        archive_cache['last_id'] = rows[-1][0] if rows else before_id
+        return rows
+
+    def load_log_page(before_id, limit):
+        """Fetch a page of the currently selected log type.
+        
+        Args:
+            before_id: Only return rows older than this id (None for newest)
+            limit: Maximum rows to return
+        """
+        if is_archive_selected():
+            return load_archive_page(before_id, limit)
+        admin_only = is_admin_selected()  # Determine if admin logs are selected
+        return get_log_page(admin_only=admin_only, before_id=before_id, limit=limit)
+
+    def load_new_logs(after_id, limit):
+        """Fetch rows of the currently selected log type written after after_id.
+        
+        Args:
+            after_id: Only return rows newer than this id
+            limit: Maximum rows to return
         """
-        temp_dir = os.path.join(os.path.dirname(__file__), 'temp')
-        # Check if the temporary directory exists
-        if os.path.exists(temp_dir):
-            # Iterate over all files in the temporary directory
-            for file in os.listdir(temp_dir):
-            # Check if the file is a log file
-                if file.endswith('.log'):
-                    try:
-                    # Attempt to remove the log file
-                        os.remove(os.path.join(temp_dir, file))
-                    except:
-                    # Ignore any errors during file removal
-                        pass
+        admin_only = is_admin_selected()
+        return get_logs_since(admin_only=admin_only, after_id=after_id, limit=limit)
+
+    def show_log_error(e):
+        """Display a log loading error in the message label."""
+        display_error(message_label, f"Failed to load logs: {str(e)}")
+
+    # Paged loader inserts rows in chunks and fetches older pages on scroll
+    reload_logs = create_paged_log_loader(
+        log_text, scrollbar, load_log_page, LOG_PAGE_SIZE, on_error=show_log_error
+    )
 
     def refresh_logs():
         """Refresh the log display.
         
-        Cleans old temp files, exports new logs based on selected type,
-        updates text display, and cleans up after reading.
+        Clears the display and loads the newest page of the selected
+        log type, older pages follow as the user scrolls.
+        In live tail mode the newest entries are shown instead and new
+        entries are added as they are written, archives never change so
+        they are always shown paged.
         Shows success/error message based on result.
         """
+        # Re-read archives on refresh in case the retention run added rows
+        archive_cache['key'] = None
         try:
-            cleanup_temp_files()  # Clean old files first
-            admin_only = log_type_var.get() == "Admin Actions"  # Determine if admin logs are selected
-            # Export logs to a temporary file
-            log_file = export_logs_to_temp_file(admin_only=admin_only)  
-            
-            # Make text widget editable
-            log_text.configure(state="normal")  
-            # Clear current content
-            log_text.delete(1.0, tk.END)
-            
-            # Open the log file for reading & Insert log content into text widget
-            with open(log_file, 'r') as f:
-                log_text.insert(tk.END, f.read())
-            
-            # Bring text widget back to read-only
-            log_text.configure(state="disabled")
-            
-            # Clean up after reading
-            try:
-                os.remove(log_file)
-            except:
-                pass  # Ignore any errors during file removal
-            
-            display_success(message_label, "Logs refreshed successfully")  # Display success message
+            # Loader and tail report their own errors through on_error
+            if tail_var.get() == "On" and not is_archive_selected():
+                settings = get_logging_settings()
+                if start_log_tail(log_text, scrollbar, load_log_page, load_new_logs,
+                                  settings['tail_max_lines'], settings['tail_poll_interval_ms'],
+                                  on_error=show_log_error):
+                    display_success(message_label, "Live tail started")
+            elif reload_logs():
+                display_success(message_label, "Logs refreshed successfully")  # Display success message
         except Exception as e:
             display_error(message_label, f"Failed to load logs: {str(e)}")  # Display error message if an exception occurs
 
-    # Add cleanup to window destroy binding
-    window.bind("<Destroy>", lambda e: cleanup_temp_files())
+    def export_selected_logs():
+        """Export the selected live log type to a file chosen by the admin.
+        
+        File format follows the chosen extension (.csv, .jsonl, .log/.txt).
+        Rows are streamed to the file on a background thread and the result
+        is reported once it finishes.
+        """
+        if is_archive_selected():
+            display_error(message_label, "Archived logs are already stored as files")
+            return
+
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".csv",
+            filetypes=[("CSV files", "*.csv"), ("JSON lines", "*.jsonl"), ("Text files", "*.log *.txt")]
+        )
+        if not file_path:
+            return
+        writer = LOG_WRITERS.get(os.path.splitext(file_path)[1].lower())
+        if writer is None:
+            display_error(message_label, "Unsupported export file type")
+            return
+
+        kind = 'admin' if is_admin_selected() else 'user'
+        result = {}
+
+        def run_export():
+            """Stream the logs to the file off the Tk thread."""
+            try:
+                with open(file_path, 'w', newline='', encoding='utf-8') as f:
+                    result['count'] = writer(export_logs(kind=kind), f, kind)
+            except Exception as e:
+                result['error'] = e
+
+        def check_export():
+            """Poll the export thread and report the result when done."""
+            if not message_label.winfo_exists():
+                return
+            if export_thread.is_alive():
+                message_label.after(100, check_export)
+            elif 'error' in result:
+                display_error(message_label, f"Failed to export logs: {str(result['error'])}")
+            else:
+                display_success(message_label, f"Exported {result['count']} log entries")
+                log_action('EXPORT_LOGS', is_admin=True, admin_id=current_admin_id,
+                          target_type='logs', target_id=None,
+                          details=f"Exported {result['count']} {kind} log entries")
+
+        export_thread = threading.Thread(target=run_export, daemon=True)
+        export_thread.start()
+        message_label.after(100, check_export)
 
     # Create a container for the message and refresh button
     right_controls = tk.Frame(controls_frame, **styles['frame'])
@@ -208,6 +354,9 @@ def show_logging_screen(global_state):
     tk.Button(right_controls, text="Refresh Logs", 
             command=refresh_logs,
             **styles['buttons']).pack(side="right", padx=5)
+    tk.Button(right_controls, text="Export Logs",
+            command=export_selected_logs,
+            **styles['buttons']).pack(side="right", padx=5)
     
     # Initial load
     refresh_logs()
\ No newline at end of file
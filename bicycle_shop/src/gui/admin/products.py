@@ -10,7 +10,7 @@ from src.utils import (
     display_error, display_success, clear_frame, get_style_config,
     create_scrollable_frame, setup_product_grid, create_product_management_frame,
     log_action, resize_product_image, resize_qr_code, setup_search_widget,
-    validate_product_fields
+    validate_product_fields, schedule_render, cancel_render, estimate_visible_products
 )
 
 def add_no_category_option(categories):
@@ -533,9 +533,17 @@ def show_manage_products_screen(global_state):
         Creates category headers with separators
         Displays products in responsive grid
         Enables scrolling if content overflows
+        
+        Note:
+            Widgets are built by the render scheduler, the visible products
+            first and the rest in small batches, so resizing or searching a
+            large catalogue does not freeze the window.
         """
+        # Stop any batches still building the previous layout
+        cancel_render(scrollable_frame)
         unbind_wheel()
         clear_frame(scrollable_frame)
+        scrollbar.pack_forget()
 
         if not products:
             message_label = tk.Label(scrollable_frame, text="", **styles['message'])
@@ -551,26 +559,31 @@ def show_manage_products_screen(global_state):
         # Group products by category
         categorized_products = {}
         uncategorized_products = []
+        # Category names looked up once per category rather than once per product
+        category_names = {}
         
         for product in products:
             if product[6]:  # If product has a category
-                category_name = get_category_name(product[6])
+                if product[6] not in category_names:
+                    category_names[product[6]] = get_category_name(product[6])
+                category_name = category_names[product[6]]
                 if category_name not in categorized_products:
                     categorized_products[category_name] = []
                 categorized_products[category_name].append(product)
             else:
                 uncategorized_products.append(product)
 
-        row_count = 0
+        # Row count shared between sections so scrolling is enabled once content overflows
+        render_state = {'row_count': 0}
 
-        # First display uncategorized products under "Unlisted" section
-        if uncategorized_products:
+        def render_section(section_name, section_products):
+            """Create a category header and its product frames, yielding after each one."""
             category_frame = tk.Frame(scrollable_frame, **styles['frame'])
             category_frame.pack(fill="x", pady=(20, 10))
             
             category_label = tk.Label(
                 category_frame, 
-                text="Unlisted",
+                text=section_name,
                 font=("Arial", 14, "bold"),
                 bg=styles['frame']['bg'],
                 fg=styles['category_labels']['fg']
@@ -579,50 +592,21 @@ def show_manage_products_screen(global_state):
             
             separator = ttk.Separator(category_frame, orient="horizontal")
             separator.pack(side="left", fill="x", expand=True, padx=10)
+            yield
 
             col = 0
             row_frame = None
             
-            for product in uncategorized_products:
+            for product in section_products:
                 if col % num_columns == 0:
                     row_frame = tk.Frame(scrollable_frame, **styles['frame'])
                     row_frame.pack(fill="x", pady=5)
-                    row_count += 1
-
-                create_product_management_frame(
-                    row_frame, 
-                    product,
-                    290,  # product_width
-                    lambda p_id=product[0]: show_edit_product_screen(global_state, p_id),
-                    lambda p=product: handle_delete_product(p[0])
-                )
-                col += 1
-
-        # Then display categorized products
-        for category_name, category_products in categorized_products.items():
-            category_frame = tk.Frame(scrollable_frame, **styles['frame'])
-            category_frame.pack(fill="x", pady=(20, 10))
-            
-            category_label = tk.Label(
-                category_frame, 
-                text=category_name,
-                font=("Arial", 14, "bold"),
-                bg=styles['frame']['bg'],
-                fg=styles['category_labels']['fg']
-            )
-            category_label.pack(side="left", padx=10)
-            
-            separator = ttk.Separator(category_frame, orient="horizontal")
-            separator.pack(side="left", fill="x", expand=True, padx=10)
+                    render_state['row_count'] += 1
 
-            col = 0
-            row_frame = None
-            
-            for product in category_products:
-                if col % num_columns == 0:
-                    row_frame = tk.Frame(scrollable_frame, **styles['frame'])
-                    row_frame.pack(fill="x", pady=5)
-                    row_count += 1
+                    # Enable scrolling as soon as the content overflows, while the rest is still building
+                    if render_state['row_count'] == 2:
+                        bind_wheel()
+                        scrollbar.pack(side="right", fill="y")
 
                 create_product_management_frame(
                     row_frame, 
@@ -632,16 +616,25 @@ def show_manage_products_screen(global_state):
                     lambda p_id=product[0]: handle_delete_product(p_id)
                 )
                 col += 1
-
-        # Enable scrolling if needed
-        if row_count > 1:
-            bind_wheel()
-            scrollbar.pack(side="right", fill="y")
-        else:
-            scrollbar.pack_forget()
-
-        # Update scroll region
-        canvas.configure(scrollregion=canvas.bbox("all"))
+                yield
+
+        def render_steps():
+            """Render the uncategorized products under "Unlisted" first, then each category."""
+            if uncategorized_products:
+                yield from render_section("Unlisted", uncategorized_products)
+            for category_name, category_products in categorized_products.items():
+                yield from render_section(category_name, category_products)
+
+        def update_scroll_region():
+            """Update scroll region once every product has been built."""
+            canvas.configure(scrollregion=canvas.bbox("all"))
+
+        # Render the visible products (plus their section header) straight away
+        schedule_render(
+            scrollable_frame, render_steps(),
+            priority_steps=estimate_visible_products(canvas, num_columns) + 1,
+            on_complete=update_scroll_region
+        )
 
     # Bind the resize event to update product display
     content_inner_frame.bind("<Configure>", lambda event: display_products(get_products(listed_only=False)))
@@ -1,13 +1,19 @@
+import os
+import threading
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
 
 from src.database.users.user_manager import (
-    get_current_user_admin_status, get_all_users, update_user_details,
+    get_users_page, update_user_details,
     delete_user, get_username_by_id
 )
+from src.database.users.bulk import (
+    read_user_records, import_users, write_import_report, export_users, USER_WRITERS
+)
 from src.utils.display import (
     display_error, display_success, clear_frame
 )
+from src.auth import is_session_admin
 from src.utils.frames import create_scrollable_grid_frame
 from src.utils.theme import get_style_config
 from src.utils.validation import validate_user_fields
@@ -19,17 +25,18 @@ def show_manage_users_screen(global_state):
     """Display the user management screen.
     
     Provides interface for managing user accounts including:
-    - Viewing all users in a grid layout
+    - Searching, filtering and paging through users in a grid layout
     - Editing user details
     - Changing user passwords
     - Managing admin privileges
     - Deleting users
+    - Importing and exporting users in bulk
     
     Args:
         global_state: Application state dictionary containing:
             - window: Main window instance
             - content_inner_frame: Main content frame
-            - current_username: Current user's username
+            - session: Signed in user's session
             - current_admin_id: Current admin's ID
             - icons: Application icons
             
@@ -39,15 +46,17 @@ def show_manage_users_screen(global_state):
         Cannot delete own account or remove own admin status
     """
     global_state['current_screen'] = show_manage_users_screen
+    # Role comes from the session, refreshed first if users changed so the ids below are current
+    if not is_session_admin(global_state):
+        from ..store.listing import switch_to_store_listing
+        switch_to_store_listing(global_state)
+        return
+
     window = global_state['window']
     content_inner_frame = global_state['content_inner_frame']
     current_username = global_state['current_username']
     current_admin_id = global_state['current_admin_id']
 
-    if not get_current_user_admin_status(current_username):
-        from ..store.listing import switch_to_store_listing
-        switch_to_store_listing(is_admin=False)
-        return
     
     # Unbind existing events before clearing frame
     window.unbind("<Configure>")
@@ -68,7 +77,7 @@ def show_manage_users_screen(global_state):
 
     # Configure main container frame
     user_list_frame.grid_columnconfigure(0, weight=1)  # Make single column expand
-    user_list_frame.grid_rowconfigure(3, weight=1)     # Make scrollable content expand
+    user_list_frame.grid_rowconfigure(4, weight=1)     # Make scrollable content expand
 
     # Force the frame to expand
     user_list_frame.grid_propagate(False)  # Changed to False to force size
@@ -89,6 +98,11 @@ def show_manage_users_screen(global_state):
     # Store resize timer as an attribute of the content_inner_frame
     content_inner_frame.resize_timer = None
 
+    # Keyset paging state: cursors[i] fetches page i, next_cursor is None on the last page
+    page_state = {'cursors': [None], 'next_cursor': None, 'search_timer': None}
+    sort_orders = {'ID': 'id', 'Username': 'username', 'Name': 'name'}
+    admin_filters = {'All Users': None, 'Admins': True, 'Customers': False}
+
     def open_edit_dialog(user_id, username, first_name, last_name, age, is_admin):
         """Open dialog to edit user details.
         
@@ -310,7 +324,7 @@ def show_manage_users_screen(global_state):
                         status='failed')
 
     def display_users():
-        """Display all users in scrollable grid layout.
+        """Display the current page of users in scrollable grid layout.
         
         Shows users with columns:
         - ID
@@ -320,7 +334,9 @@ def show_manage_users_screen(global_state):
         - Admin Status
         - Action buttons
         
-        Updates scroll region after displaying users
+        Only one page matching the search, filter and sort controls is
+        fetched and rendered, so the screen stays fast with thousands of
+        users. Updates scroll region and pager after displaying users
         """
         # Clear existing content
         for widget in scrollable_frame.winfo_children():
@@ -330,7 +346,17 @@ def show_manage_users_screen(global_state):
         for col, weight in enumerate(weights):
             scrollable_frame.grid_columnconfigure(col, weight=weight)
         
-        users = get_all_users()
+        users, page_state['next_cursor'] = get_users_page(
+            search=search_entry.get(),
+            is_admin=admin_filters[filter_var.get()],
+            order_by=sort_orders[sort_var.get()],
+            cursor=page_state['cursors'][-1]
+        )
+        if not users and len(page_state['cursors']) > 1:
+            # The last users of this page were deleted, step back a page
+            page_state['cursors'].pop()
+            display_users()
+            return
         
         for row, user in enumerate(users):
             user_id, username, first_name, last_name, age, is_admin = user[:6]
@@ -389,30 +415,209 @@ def show_manage_users_screen(global_state):
             )
             delete_btn.pack(side="left", padx=2)
         
-        # Update scroll region
+        # Update scroll region and return to the top of the new page
         canvas.configure(scrollregion=canvas.bbox("all"))
+        canvas.yview_moveto(0)
+        update_pager(len(users))
+
+    def update_pager(count):
+        """Update the page label and enable only the page buttons that lead somewhere."""
+        page = len(page_state['cursors'])
+        page_label.config(text=f"Page {page} ({count} user{'s' if count != 1 else ''})")
+        prev_button.config(state="normal" if page > 1 else "disabled")
+        next_button.config(state="normal" if page_state['next_cursor'] is not None else "disabled")
+
+    def show_next_page():
+        """Move to the following page of users."""
+        if page_state['next_cursor'] is not None:
+            page_state['cursors'].append(page_state['next_cursor'])
+            display_users()
+
+    def show_previous_page():
+        """Move back to the previous page of users."""
+        if len(page_state['cursors']) > 1:
+            page_state['cursors'].pop()
+            display_users()
+
+    def reset_pages(event=None):
+        """Show the first page after the search, filter or sort changed."""
+        page_state['cursors'] = [None]
+        display_users()
+
+    def handle_search(event=None):
+        """Search users once typing pauses for 300ms."""
+        if page_state['search_timer'] is not None:
+            window.after_cancel(page_state['search_timer'])
+        page_state['search_timer'] = window.after(300, search_now)
+
+    def search_now():
+        """Run the pending search."""
+        page_state['search_timer'] = None
+        reset_pages()
+
+    def run_in_background(task, on_done, on_error):
+        """Run a bulk task on a worker thread and report back on the Tk thread.
+        
+        Args:
+            task: Callable run off the Tk thread, its return value is passed to on_done
+            on_done: Called with the result once the task finishes
+            on_error: Called with the exception if the task fails
+        """
+        result = {}
+
+        def run():
+            try:
+                result['value'] = task()
+            except Exception as e:
+                result['error'] = e
+
+        def check():
+            if not message_label.winfo_exists():
+                return
+            if worker.is_alive():
+                message_label.after(100, check)
+            elif 'error' in result:
+                on_error(result['error'])
+            else:
+                on_done(result['value'])
+
+        worker = threading.Thread(target=run, daemon=True)
+        worker.start()
+        message_label.after(100, check)
+
+    def import_users_from_file():
+        """Import users from a CSV, JSON or JSON lines file chosen by the admin.
+        
+        Rows are validated like registrations and passwords are hashed in a
+        process pool off the Tk thread. Rejected rows are written to a
+        <file>_errors.csv report next to the imported file.
+        """
+        file_path = filedialog.askopenfilename(
+            filetypes=[("User files", "*.csv *.json *.jsonl"), ("CSV files", "*.csv"),
+                       ("JSON files", "*.json *.jsonl")]
+        )
+        if not file_path:
+            return
+        report_path = os.path.splitext(file_path)[0] + "_errors.csv"
+        import_button.config(state="disabled")
+        display_success(message_label, "Importing users...")
+
+        def run_import():
+            imported, errors = import_users(read_user_records(file_path))
+            if errors:
+                with open(report_path, 'w', newline='', encoding='utf-8') as f:
+                    write_import_report(errors, f)
+            return imported, errors
+
+        def on_done(result):
+            imported, errors = result
+            import_button.config(state="normal")
+            log_action('IMPORT_USERS', is_admin=True, admin_id=current_admin_id,
+                       target_type='user', target_id=None,
+                       details=f"Imported {imported} users from {os.path.basename(file_path)}, "
+                               f"{len(errors)} rows rejected",
+                       status='success' if imported or not errors else 'failed')
+            if errors:
+                display_error(message_label, f"Imported {imported} users, {len(errors)} rows rejected "
+                                             f"(see {os.path.basename(report_path)})")
+            else:
+                display_success(message_label, f"Imported {imported} users")
+            reset_pages()
+
+        def on_error(error):
+            import_button.config(state="normal")
+            display_error(message_label, f"Failed to import users: {str(error)}")
+            log_action('IMPORT_USERS', is_admin=True, admin_id=current_admin_id,
+                       target_type='user', target_id=None,
+                       details=f"Failed to import users from {os.path.basename(file_path)}: {error}",
+                       status='failed')
+
+        run_in_background(run_import, on_done, on_error)
+
+    def export_users_to_file():
+        """Export every user to a CSV or JSON lines file chosen by the admin.
+        
+        Rows are streamed to the file on a background thread, passwords are
+        never exported.
+        """
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".csv",
+            filetypes=[("CSV files", "*.csv"), ("JSON lines", "*.jsonl")]
+        )
+        if not file_path:
+            return
+        writer = USER_WRITERS.get(os.path.splitext(file_path)[1].lower())
+        if writer is None:
+            display_error(message_label, "Unsupported export file type")
+            return
+
+        def run_export():
+            with open(file_path, 'w', newline='', encoding='utf-8') as f:
+                return writer(export_users(), f)
+
+        def on_done(count):
+            display_success(message_label, f"Exported {count} users")
+            log_action('EXPORT_USERS', is_admin=True, admin_id=current_admin_id,
+                       target_type='user', target_id=None,
+                       details=f"Exported {count} users")
+
+        run_in_background(
+            run_export, on_done,
+            lambda error: display_error(message_label, f"Failed to export users: {str(error)}")
+        )
 
 
     def handle_resize(event=None):
         """Handle window resize events with debouncing.
         
-        Delays refresh of user list for 150ms after last resize
-        to prevent excessive updates during continuous resize.
+        Delays the scroll region update for 150ms after last resize
+        to prevent excessive updates during continuous resize. The rows
+        stretch with the grid weights so they are not rebuilt.
         
         Args:
             event: Window resize event
         """
         if hasattr(content_inner_frame, 'resize_timer') and content_inner_frame.resize_timer is not None:
             window.after_cancel(content_inner_frame.resize_timer)
-        content_inner_frame.resize_timer = window.after(150, display_users)
+        content_inner_frame.resize_timer = window.after(
+            150, lambda: canvas.winfo_exists() and canvas.configure(scrollregion=canvas.bbox("all"))
+        )
 
     # Bind the resize event with debouncing
     content_inner_frame.bind("<Configure>", handle_resize)
 
+    # Search, filter and sort controls
+    controls_frame = tk.Frame(user_list_frame, **styles['frame'])
+    controls_frame.grid(row=2, column=0, sticky="ew", padx=5, pady=(0, 5))
+
+    tk.Label(controls_frame, text="Search:", **styles['text']).pack(side="left", padx=(0, 5))
+    search_entry = tk.Entry(controls_frame, width=30, **styles['entries'])
+    search_entry.pack(side="left", padx=(0, 15))
+    search_entry.bind("<KeyRelease>", handle_search)
+
+    tk.Label(controls_frame, text="Show:", **styles['text']).pack(side="left", padx=(0, 5))
+    filter_var = tk.StringVar(value="All Users")
+    filter_combobox = ttk.Combobox(controls_frame, textvariable=filter_var, values=list(admin_filters),
+                                   width=12, state='readonly')
+    filter_combobox.pack(side="left", padx=(0, 15))
+    filter_combobox.bind("<<ComboboxSelected>>", reset_pages)
+
+    tk.Label(controls_frame, text="Sort by:", **styles['text']).pack(side="left", padx=(0, 5))
+    sort_var = tk.StringVar(value="ID")
+    sort_combobox = ttk.Combobox(controls_frame, textvariable=sort_var, values=list(sort_orders),
+                                 width=12, state='readonly')
+    sort_combobox.pack(side="left")
+    sort_combobox.bind("<<ComboboxSelected>>", reset_pages)
+
+    export_button = tk.Button(controls_frame, text="Export Users", command=export_users_to_file, **styles['buttons'])
+    export_button.pack(side="right", padx=5)
+    import_button = tk.Button(controls_frame, text="Import Users", command=import_users_from_file, **styles['buttons'])
+    import_button.pack(side="right", padx=5)
+
     # Headers frame
     scrollbar_width = 10  # Standard scrollbar width on canvas
     headers_frame = tk.Frame(user_list_frame, **styles['frame'])
-    headers_frame.grid(row=2, column=0, sticky="ew", padx=(5, scrollbar_width + 10))
+    headers_frame.grid(row=3, column=0, sticky="ew", padx=(5, scrollbar_width + 10))
 
     headers = ['ID', 'Username', 'Name', 'Age', 'Admin', 'Actions']
     weights = [1, 2, 3, 1, 1, 2]
@@ -439,9 +644,19 @@ def show_manage_users_screen(global_state):
 
     # Create scrollable frame using grid
     wrapper, canvas, scrollbar, scrollable_frame, bind_wheel, unbind_wheel = create_scrollable_grid_frame(user_list_frame)
-    wrapper.grid(row=3, column=0, sticky="nsew", pady=(0, 10))
+    wrapper.grid(row=4, column=0, sticky="nsew", pady=(0, 10))
     wrapper.grid_columnconfigure(0, weight=1)
     wrapper.grid_rowconfigure(0, weight=1)
 
+    # Pager below the table
+    pager_frame = tk.Frame(user_list_frame, **styles['frame'])
+    pager_frame.grid(row=5, column=0, pady=(0, 10))
+    prev_button = tk.Button(pager_frame, text="Previous", command=show_previous_page, **styles['buttons'])
+    prev_button.pack(side="left", padx=5)
+    page_label = tk.Label(pager_frame, text="", **styles['text'])
+    page_label.pack(side="left", padx=10)
+    next_button = tk.Button(pager_frame, text="Next", command=show_next_page, **styles['buttons'])
+    next_button.pack(side="left", padx=5)
+
     # Initial display
     display_users()
\ No newline at end of file
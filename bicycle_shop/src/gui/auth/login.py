@@ -1,12 +1,10 @@
 import tkinter as tk
 
 from src.database.users.user_manager import get_current_user_admin_status
-from src.auth import authenticate_user
+from src.auth import authenticate_user, run_auth_task, start_session, LoginThrottledError
 from src.utils.display import display_error, clear_frame, create_password_field, center_window
 from src.utils.logging import log_action
 from src.utils.theme import get_style_config
-from src.database.users.user_manager import get_current_user_admin_status
-from src.auth import authenticate_user
 from src.gui.admin.dashboard import switch_to_admin_panel
 from src.gui.store.listing import switch_to_store_listing
 from src.gui.auth.register import show_register_screen
@@ -72,8 +70,66 @@ def show_login_screen(global_state):
         style="light"
     )
 
+    # Guards against repeat submissions while a sign in is running in the background
+    login_state = {'busy': False}
+
+    def set_signing_in(busy):
+        """Show or clear the signing in state while credentials are checked."""
+        login_state['busy'] = busy
+        button_state = "disabled" if busy else "normal"
+        login_button.config(state=button_state)
+        register_button.config(state=button_state)
+        message_label.config(text="Signing in..." if busy else "", fg=styles['labels']['fg'])
+
+    def check_credentials(username, password):
+        """Verify the password and look up the account type, runs off the Tk thread.
+
+        Throttled attempts are refused by authenticate_user before any database
+        work, the account type is only looked up to log a failed attempt.
+        """
+        result = authenticate_user(username, password)
+        is_admin_account = result[1] if result[0] else get_current_user_admin_status(username)
+        return is_admin_account, result
+
     def login(event=None):
-        """Handle login attempt and navigation.
+        """Start a login attempt.
+        
+        Credentials are checked on a worker thread so the window stays
+        responsive, finish_login handles the result on the Tk thread.
+        
+        Args:
+            event: Key event when triggered by enter key (optional)
+        """
+        if login_state['busy']:
+            return
+        try:
+            # Store values before potentially destroying widgets
+            username = username_entry.get()
+            password = password_entry.get()
+            set_signing_in(True)
+        except tk.TclError:
+            # Handle case where widgets are already destroyed
+            return
+
+        def on_error(error):
+            set_signing_in(False)
+            if isinstance(error, LoginThrottledError):
+                # Refused before the password was checked, recorded apart from real failures
+                log_action('LOGIN', user_id=None,
+                        details=f"Throttled login attempt for: {username}",
+                        status='throttled')
+                display_error(message_label, str(error))
+            else:
+                display_error(message_label, f"Error signing in: {error}")
+
+        run_auth_task(
+            login_button, check_credentials, (username, password),
+            on_done=lambda result: finish_login(username, *result),
+            on_error=on_error
+        )
+
+    def finish_login(username, is_admin_account, result):
+        """Handle login result and navigation.
         
         Validates credentials and navigates to appropriate screen:
         - Admin dashboard for admin users
@@ -81,20 +137,17 @@ def show_login_screen(global_state):
         - Store listing for regular users
         
         Args:
-            event: Key event when triggered by enter key (optional)
+            username: Username that was submitted
+            is_admin_account: Whether the username belongs to an admin
+            result: Tuple returned by authenticate_user
             
         Note:
-            Updates global state with user information
+            Starts the session holding the user's details and role
             Logs login attempts and results
             Handles cleanup of login screen elements
         """
         try:
-            # Store values before potentially destroying widgets
-            username = username_entry.get()
-            password = password_entry.get()
-
-            is_admin_account = get_current_user_admin_status(username)
-            success, is_admin, password_changed, first_name, last_name, user_id = authenticate_user(username, password)
+            success, is_admin, password_changed, first_name, last_name, user_id = result
             
             if success:
                 # Clear bindings before screen switch
@@ -102,14 +155,8 @@ def show_login_screen(global_state):
                 main_frame.unbind('<Return>')
                 login_button.unbind('<Return>')
 
-                # Update state with user information
-                global_state.update({
-                    'current_username': username,
-                    'current_first_name': first_name,
-                    'current_last_name': last_name,
-                    'current_user_id': user_id,
-                    'current_admin_id': user_id if is_admin else None
-                })
+                # Start the session, screens read the user's details and role from it
+                start_session(global_state, user_id, username, first_name, last_name, is_admin)
                 
                 log_action('LOGIN', user_id=global_state['current_user_id'], 
                         details=f"Successful login")
@@ -144,6 +191,12 @@ def show_login_screen(global_state):
                             target_id=None,
                             details=f"Failed admin login attempt for: {username}",
                             status='failed')
+                else:
+                    # Feeds the failed user login alert
+                    log_action('LOGIN', user_id=None,
+                            details=f"Failed login attempt for: {username}",
+                            status='failure')
+                set_signing_in(False)
                 display_error(message_label, "Invalid username or password")
                 username_entry.focus_set()  # Return focus to username field
         except tk.TclError:
@@ -1,4 +1,7 @@
+from src.auth.session import end_session
+from src.database.cart.cart_model import discard_cart_model
 from src.utils.logging import log_action
+from src.utils.display.screen_cache import invalidate_screen_cache
 
 def logout(global_state):
     """Handle user logout process.
@@ -17,19 +20,18 @@ def logout(global_state):
     Note:
         Logs the logout action before clearing state
         Handles cleanup of user session data
+        Drops cached screens since they show the previous user's data
         Redirects to login screen after logout
     """
     log_action('LOGOUT', user_id=global_state['current_user_id'], 
               details=f"User {global_state['current_username']} logged out")
     
+    # Cached screens hold the previous user's header and cart state
+    invalidate_screen_cache(global_state)
+    discard_cart_model(global_state['current_user_id'])
+
     # Reset user state
-    global_state.update({
-        'current_username': None,
-        'current_first_name': None,
-        'current_last_name': None,
-        'current_user_id': None,
-        'current_admin_id': None
-    })
+    end_session(global_state)
     
     from ..auth.login import show_login_screen
     show_login_screen(global_state)
\ No newline at end of file
@@ -6,6 +6,8 @@ from src.database.users.user_manager import (
     update_user_password
 )
 from src.auth.core import authenticate_user
+from src.auth.service import run_auth_task
+from src.auth.throttle import LoginThrottledError
 from src.utils.display import (
     display_error, display_success, clear_frame
 )
@@ -236,6 +238,9 @@ def switch_to_change_password(username, from_source="login", parent_dialog=None,
     if eye_closed_image is None and global_state is not None:
         eye_closed_image = global_state.get('icons', {}).get('eye_closed')
 
+    # Guards against repeat submissions while the password is being hashed
+    change_state = {'busy': False}
+
     def change_password():
             """Handle password change validation and update.
             
@@ -249,16 +254,12 @@ def switch_to_change_password(username, from_source="login", parent_dialog=None,
             Shows success/error message
             Handles appropriate navigation after success
             """
+            if change_state['busy']:
+                return
             new_password = new_password_entry.get()
             confirm_password = confirm_password_entry.get()
             current_password = current_password_entry.get() if from_source == "self" else None
 
-            if from_source == "self":
-                success, *_ = authenticate_user(username, current_password)
-                if not success:
-                    display_error(message_label, "Current password is incorrect")
-                    return
-
             is_valid, validation_message = validate_user_fields(
                 username=username,
                 first_name="",
@@ -273,7 +274,39 @@ def switch_to_change_password(username, from_source="login", parent_dialog=None,
                 display_error(message_label, validation_message)
                 return
 
-            success, message = update_user_password(username, new_password)
+            # Both password checks hash, run them on a worker thread so the window stays responsive
+            change_state['busy'] = True
+            change_button.config(state="disabled")
+            message_label.config(text="Updating password...")
+            run_auth_task(
+                change_button, verify_and_update_password, (current_password, new_password),
+                on_done=lambda result: finish_change_password(*result),
+                on_error=lambda error: finish_change_password(
+                    *(False, False, str(error)) if isinstance(error, LoginThrottledError)
+                    else (True, False, f"Error changing password: {error}")
+                )
+            )
+
+    def verify_and_update_password(current_password, new_password):
+            """Check the current password if needed and store the new one, runs off the Tk thread.
+            
+            Returns:
+                tuple: (current_password_ok, success, message)
+            """
+            if from_source == "self":
+                authenticated, *_ = authenticate_user(username, current_password)
+                if not authenticated:
+                    return False, False, "Current password is incorrect"
+            return (True,) + tuple(update_user_password(username, new_password))
+
+    def finish_change_password(current_password_ok, success, message):
+            """Show and log the password change result on the Tk thread."""
+            change_state['busy'] = False
+            change_button.config(state="normal")
+            if not current_password_ok:
+                display_error(message_label, message)
+                return
+
             if success:
                 display_success(message_label, message)
                 if from_source == "login":
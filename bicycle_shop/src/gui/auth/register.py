@@ -1,6 +1,7 @@
 import tkinter as tk
 
 from src.database.users.user_manager import register_user
+from src.auth import run_auth_task
 from src.utils import (
     display_error, display_success, clear_frame, get_style_config,
     create_password_field, center_window, log_action, validate_user_fields
@@ -82,6 +83,9 @@ def show_register_screen(global_state):
     message_label = tk.Label(main_frame, text="", **styles['message'])
     message_label.pack()
 
+    # Guards against repeat submissions while an account is being created
+    register_state = {'busy': False}
+
     def register(event=None):
         """Handle user registration attempt.
         
@@ -99,6 +103,8 @@ def show_register_screen(global_state):
         Args:
             event: Key event when triggered by enter key (optional)
         """
+        if register_state['busy']:
+            return
         username = username_entry.get()
         first_name = first_name_entry.get()
         last_name = last_name_entry.get()
@@ -110,8 +116,20 @@ def show_register_screen(global_state):
             display_error(message_label, validation_message)
             return
 
-        success, user_id, message = register_user(username, first_name, last_name, password, int(age))
-
+        # Hashing the password is slow, create the account on a worker thread
+        register_state['busy'] = True
+        register_button.config(state="disabled")
+        message_label.config(text="Creating account...", fg=styles['labels']['fg'])
+        run_auth_task(
+            register_button, register_user, (username, first_name, last_name, password, int(age)),
+            on_done=lambda result: finish_register(username, *result),
+            on_error=lambda error: finish_register(username, False, None, f"Error registering user: {error}")
+        )
+
+    def finish_register(username, success, user_id, message):
+        """Show and log the registration result on the Tk thread."""
+        register_state['busy'] = False
+        register_button.config(state="normal")
         if success: # Success message if all requirements are met and user is created
             display_success(message_label, message)
             log_action('REGISTER', user_id=user_id, details=f"New user registered: {username}")
@@ -3,6 +3,10 @@ from tkinter import PhotoImage
 
 from src.database.core.schema import create_tables
 from src.database.users.user_manager import initialize_admin
+from src.database.logging.log_writer import stop_log_writer
+from src.database.cart.reservations import stop_reservation_sweeper
+from src.utils.logging.file_logging import shutdown_file_logging
+from src.utils.logging.policies import flush_log_aggregates
 from src.file_system.config import get_application_settings, get_icon_paths
 from src.utils.display import create_fullscreen_handler
 
@@ -63,6 +67,7 @@ def start_app():
         'current_last_name': None,
         'current_user_id': None, 
         'current_admin_id': None,
+        'session': None,
         'disable_search': None,
         'enable_search': None,
         'user_log_text': None,
@@ -102,5 +107,11 @@ def start_app():
     # Start main event loop
     window.mainloop()
 
+    # Write any log entries and application log lines still queued before the application exits
+    flush_log_aggregates()
+    stop_log_writer()
+    stop_reservation_sweeper()
+    shutdown_file_logging()
+
 if __name__ == "__main__":
     start_app()
\ No newline at end of file
@@ -1,13 +1,11 @@
 import tkinter as tk
-from tkinter import ttk, filedialog
+from tkinter import ttk, filedialog, messagebox
 import cv2
 
-from src.database.cart.cart_manager import (
-    get_cart_items, update_cart_quantity
-)
-from src.database.discounts.discount_manager import (
-    verify_discount_qr, increment_discount_uses
-)
+from src.database.cart.cart_manager import apply_cart_changes
+from src.database.cart.cart_model import get_cart_model
+from src.database.discounts.discount_manager import lookup_discount
+from src.database.orders.order_manager import new_checkout_token, checkout
 from src.utils.display import (
     display_error, display_success, clear_frame
 )
@@ -19,6 +17,9 @@ from src.utils.qr import (
 from src.utils.frames.scrollable import create_scrollable_frame
 from src.utils.images.processors import resize_product_image
 
+# Quantity clicks within this many milliseconds of each other are saved together
+QUANTITY_SAVE_DELAY_MS = 400
+
 def show_cart(global_state):
     """Display user's shopping cart with product details and checkout options.
     
@@ -64,7 +65,10 @@ def show_cart(global_state):
     button_styles = dict(styles['buttons'])
     if 'fg' in button_styles: button_styles.pop('fg')
 
-    cart_items = get_cart_items(current_user_id)
+    # Lines and totals come from the in-memory cart, product rows are only read when it is stale
+    cart = get_cart_model(current_user_id)
+    cart_items = [(product_id, line['name'], line['price'], line['image'], line['quantity'])
+                  for product_id, line in cart['lines'].items()]
 
     nav_frame = tk.Frame(content_inner_frame, **styles['frame'])
     nav_frame.pack(fill="x", pady=(10, 0))
@@ -77,7 +81,10 @@ def show_cart(global_state):
         
         Removes event bindings and wheel scrolling
         to prevent errors when switching views.
+        Saves quantities still waiting to be saved.
         """
+        if pending_changes:
+            save_quantities(refresh=False)
         unbind_wheel()
         canvas.unbind('<Configure>')
         window.unbind("<Button-1>")
@@ -96,8 +103,21 @@ def show_cart(global_state):
     )
     back_button.pack(side="left", padx=(0, 180))
     
-    total_items = sum(item[-1] for item in cart_items)
-    total_price = 0
+    total_items = cart['item_count']
+    total_price = cart['subtotal']
+
+    # One token per cart view so repeated clicks on Check Out place a single order,
+    # kept with the applied discount when the view is rebuilt after saving quantities
+    order_state = global_state.pop('cart_order_state', None) or {
+        'token': new_checkout_token(), 'discount_id': None, 'discount_percentage': None
+    }
+
+    # Saved quantities, and the clicked ones waiting to be saved in one write
+    saved_quantities = {item[0]: item[-1] for item in cart_items}
+    pending_changes = {}
+    pending_save = {'after_id': None}
+    # Quantity and line total labels of each row, updated as soon as a button is clicked
+    row_labels = {}
 
     tk.Label(
         nav_frame,
@@ -133,9 +153,9 @@ def show_cart(global_state):
         info_frame = tk.Frame(item_frame, **styles['frame'])
         info_frame.pack(side="left", fill="x", expand=True)
         
-        if item[7]:  # If image exists make it small icon size that is static
+        if item[3]:  # If image exists make it small icon size that is static
             image = resize_product_image(
-                item[7],
+                item[3],
                 max_width=100,
                 max_height=100,
                 min_width=100,
@@ -160,33 +180,32 @@ def show_cart(global_state):
         
         # Allows adding or reducing quantity of an item with + - button while showing quantity in the middle
         tk.Button(qty_frame, text="-", 
-            command=lambda pid=item[0], qty=item[-1]: update_quantity(pid, qty, -1), 
+            command=lambda pid=item[0]: update_quantity(pid, -1), 
             width=2, **button_styles).pack(side="left", padx=2)
 
-        tk.Label(qty_frame, text=str(item[-1]), width=3, fg="white", **label_styles).pack(side="left", padx=5)
+        qty_label = tk.Label(qty_frame, text=str(item[-1]), width=3, fg="white", **label_styles)
+        qty_label.pack(side="left", padx=5)
 
         tk.Button(qty_frame, text="+", 
-            command=lambda pid=item[0], qty=item[-1]: update_quantity(pid, qty, 1), 
+            command=lambda pid=item[0]: update_quantity(pid, 1), 
             width=2, **button_styles).pack(side="left", padx=2)
 
         item_total = item[2] * item[-1]
-        total_price += item_total
-        tk.Label(
+        item_total_label = tk.Label(
             item_frame,
             text=f"£{item_total:.2f}",
             font=("Arial", 11, "bold"),
             fg="white",
             **label_styles
-        ).pack(side="left", padx=(50, 10))
+        )
+        item_total_label.pack(side="left", padx=(50, 10))
+        row_labels[item[0]] = (qty_label, item_total_label, item[2])
         
         # Allows removal of all of an item no matter quantity
         remove_button = tk.Button(
             item_frame,
             text="×",
-            command=lambda pid=item[0]: (
-                update_cart_quantity(current_user_id, pid, 0),
-                show_cart(global_state)
-            ),
+            command=lambda pid=item[0]: remove_item(pid),
             font=("Arial", 16, "bold"),
             fg="red",
             bd=0,
@@ -253,42 +272,101 @@ def show_cart(global_state):
         font=("Arial", 12, "bold"),
         width=20,
         height=2,
+        command=lambda: handle_checkout(),
         **button_styles
     ).pack(pady=10)
 
-    def update_quantity(pid, current_qty, delta):
+    def handle_checkout():
+        """Place an order for the cart.
+        
+        Note:
+            Stock, prices and the applied discount are checked again when
+            the order is placed, a failure leaves the cart untouched.
+            Shows the order number and refreshes to the emptied cart.
+        """
+        # Quantities still waiting to be saved are part of the order
+        if not save_quantities(refresh=False):
+            return
+        success, order_id, message = checkout(current_user_id, order_state['token'], order_state['discount_id'])
+        if success:
+            log_action('CHECKOUT', user_id=current_user_id, details=f"Placed order {order_id}")
+            messagebox.showinfo("Order Placed", message)
+            cleanup_cart()
+            show_cart(global_state)
+        else:
+            log_action('CHECKOUT', user_id=current_user_id, details=f"Checkout failed: {message}", status='failed')
+            display_error(message_label, message)
+
+    def update_quantity(pid, delta):
         """Update quantity of item in cart.
         
         Args:
             pid: Product ID to update
-            current_qty: Current quantity in cart
             delta: Amount to change quantity by (+1/-1)
             
         Note:
+            Shows the new quantity straight away and saves it once the
+            clicks stop for QUANTITY_SAVE_DELAY_MS, so a burst of clicks
+            on any rows is a single write.
             Removes item if quantity becomes 0
-            Validates against available stock
+        """
+        new_qty = max(pending_changes.get(pid, saved_quantities[pid]) + delta, 0)
+        pending_changes[pid] = new_qty
+        show_row_quantity(pid, new_qty)
+
+        if pending_save['after_id']:
+            window.after_cancel(pending_save['after_id'])
+        pending_save['after_id'] = window.after(QUANTITY_SAVE_DELAY_MS, save_quantities)
+
+    def remove_item(pid):
+        """Remove an item from the cart, saved together with any pending quantities."""
+        pending_changes[pid] = 0
+        save_quantities()
+
+    def show_row_quantity(pid, quantity):
+        """Show a quantity and its line total on a cart row."""
+        qty_label, item_total_label, price = row_labels[pid]
+        qty_label.configure(text=str(quantity))
+        item_total_label.configure(text=f"£{price * quantity:.2f}")
+
+    def save_quantities(refresh=True):
+        """Save every pending quantity change in one transaction.
+        
+        Args:
+            refresh: Rebuild the cart view after saving (default: True)
+            
+        Returns:
+            bool: True if nothing was pending or every change was saved
+            
+        Note:
+            Validates against available stock, if any line does not fit
+            nothing is saved and the rows go back to the saved quantities.
             Logs all cart updates
-            Refreshes cart display after update
+            Only refreshes while the cart is still on screen
         """
-        new_qty = current_qty + delta
-        if new_qty <= 0:
-            # Remove item from cart if new quantity is 0 or less
-            success, message = update_cart_quantity(current_user_id, pid, 0)
-            if success:
-                log_action('CART_UPDATE', user_id=current_user_id, details=f"Removed product {pid} from cart")
-                show_cart(global_state)  # Refresh cart view
-            else:
-                log_action('CART_UPDATE', user_id=current_user_id, details=f"Failed to remove product {pid}: {message}", status='failed')
+        if pending_save['after_id']:
+            window.after_cancel(pending_save['after_id'])
+            pending_save['after_id'] = None
+        if not pending_changes:
+            return True
+
+        changes = list(pending_changes.items())
+        pending_changes.clear()
+        details = ", ".join(f"product {pid} to {qty}" for pid, qty in changes)
+        success, message, _ = apply_cart_changes(current_user_id, changes)
+        on_screen = summary_frame.winfo_exists()
+        if success:
+            log_action('CART_UPDATE', user_id=current_user_id, details=f"Updated quantities: {details}")
+            if refresh and on_screen:
+                global_state['cart_order_state'] = order_state
+                show_cart(global_state)  # Refresh cart view, keeping the applied discount
         else:
-            # Update item quantity in cart
-            success, message = update_cart_quantity(current_user_id, pid, new_qty)
-            if success:
-                log_action('CART_UPDATE', user_id=current_user_id, details=f"Updated product {pid} quantity to {new_qty}")
-                show_cart(global_state)  # Refresh cart view
-            else:
-            # Log failure to update quantity
-                log_action('CART_UPDATE', user_id=current_user_id, details=f"Failed to update product {pid} quantity: {message}", status='failed')
-        show_cart(global_state)  # Refresh cart view after any update too
+            log_action('CART_UPDATE', user_id=current_user_id, details=f"Failed to update quantities ({details}): {message}", status='failed')
+            if on_screen:
+                for pid, _ in changes:
+                    show_row_quantity(pid, saved_quantities[pid])
+                display_error(message_label, message)
+        return success
 
     def handle_webcam_scan():
         """Handle QR code scanning via webcam.
@@ -351,74 +429,56 @@ def show_cart(global_state):
             try:
                 qr_data = scan_qr_code_from_file(file_path)
                 if qr_data:
-                    success, discount_id, message = verify_discount_qr(qr_data)
-                    if success:
-                        process_discount(discount_id)  # Pass discount_id instead of qr_data
-                    else:
-                        display_error(message_label, message)
+                    process_discount(qr_data)
                 else:
                     display_error(message_label, "No valid QR code found in image")
             except Exception as e:
                 logging.error(f"Error processing QR code: {e}")
                 display_error(message_label, "Error processing QR code")
 
-    def process_discount(discount_id):
-        """Process verified discount ID.
+    def process_discount(qr_data):
+        """Verify a scanned discount code and apply it to the cart.
         
         Args:
-            discount_id: ID of the verified discount
+            qr_data: Data read from the discount QR code
             
         Note:
             Updates total price display
             Shows discount amount
             Logs discount application
-            Increments discount usage
+            Usage is counted when the order is placed, not here
         """
-        from src.database.core.connection import get_connection
-        from src.database.discounts.discount_manager import increment_discount_uses
-
-        # Fetch discount details using discount_id
-        conn = get_connection()
-        cursor = conn.cursor()
-
         try:
-            cursor.execute("""
-                SELECT name, percentage 
-                FROM Discounts 
-                WHERE id = ?
-            """, (discount_id,))
-            
-            result = cursor.fetchone()
-            if result:
-                name, percentage = result
-                # Calculate the discount amount and the new total price after applying the discount
-                discount_amount = total_price * (percentage / 100)
-                discounted_total = total_price - discount_amount
-                
-                # Update the discount label to show the discount applied
-                discount_label.configure(text=f"Discount applied: {percentage}% (-£{discount_amount:.2f})")
-                discount_label.pack(pady=(0, 5), before=coupon_button)
-                
-                # Update the total price label
-                total_label.configure(text=f"Total: £{discounted_total:.2f}")
-                
-                # Change the coupon button text
-                coupon_button.configure(text="Change Coupon")
-                
+            # One cached lookup gives the whole record, the preview needs no further query
+            success, discount, message = lookup_discount(qr_data)
+            if success:
+                percentage = discount['percentage']
+                show_discount(percentage)
                 display_success(message_label, "Discount applied successfully!")
                 log_action('APPLY_DISCOUNT', user_id=current_user_id, details=f"Applied {percentage}% discount to cart")
-                
-                # Increment discount usage
-                success, message = increment_discount_uses(discount_id)
-                if not success:
-                    logging.error(f"Error incrementing discount usage: {message}")
+                order_state['discount_id'] = discount['id']
+                order_state['discount_percentage'] = percentage
             else:
-                display_error(message_label, "Invalid discount ID")
+                display_error(message_label, message)
         except Exception as e:
             logging.error(f"Error processing discount: {e}")
             display_error(message_label, "Error processing discount")
-        finally:
-            conn.close()
+
+    def show_discount(percentage):
+        """Show a discount percentage in the cart summary and the total after it."""
+        # Rounded the same way checkout rounds the placed order
+        discount_amount = round(total_price * percentage / 100, 2)
+        discounted_total = round(total_price - discount_amount, 2)
+        
+        # Update the discount label to show the discount applied
+        discount_label.configure(text=f"Discount applied: {percentage}% (-£{discount_amount:.2f})")
+        discount_label.pack(pady=(0, 5), before=coupon_button)
+        
+        # Update the total price label
+        total_label.configure(text=f"Total: £{discounted_total:.2f}")
+        
+        # Change the coupon button text
+        coupon_button.configure(text="Change Coupon")
 
     def show_coupon_options():
         """Show dialog for selecting discount input method.
@@ -433,6 +493,8 @@ def show_cart(global_state):
         discount_label.pack_forget()
         discount_label.configure(text="")
         total_label.configure(text=f"Total: £{total_price:.2f}")
+        order_state['discount_id'] = None
+        order_state['discount_percentage'] = None
 
         choice_window = tk.Toplevel()
         choice_window.title("Select Scan Method")
@@ -490,4 +552,8 @@ def show_cart(global_state):
                 scrollbar.pack_forget()
 
     # Bind the canvas configuration event to check if scrollbar is needed
-    canvas.bind('<Configure>', check_scroll_needed)
\ No newline at end of file
+    canvas.bind('<Configure>', check_scroll_needed)
+
+    # A discount applied before the view was rebuilt still applies to the new subtotal
+    if order_state['discount_id'] is not None:
+        show_discount(order_state['discount_percentage'])
\ No newline at end of file
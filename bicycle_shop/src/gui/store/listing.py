@@ -1,18 +1,21 @@
 import tkinter as tk
 from tkinter import ttk
 
-from src.database.users.user_manager import get_current_user_admin_status
+from src.auth import get_session, is_session_admin
 from src.database.products.product_manager import get_products
 from src.database.categories.category_manager import get_category_name
+from src.database.cart.cart_model import get_cart_model
 from src.utils.display import (
     display_error, display_success, clear_frame,
     show_dropdown, hide_dropdown, hide_dropdown_on_click,
     setup_search_widget, create_user_info_display,
-    center_window
+    center_window, cache_screen, restore_screen,
+    schedule_render, cancel_render
 )
 from src.utils.display.dropdown import update_dropdown_position
 from src.utils.frames import (
-    create_scrollable_frame, setup_product_grid, create_product_listing_frame
+    create_scrollable_frame, setup_product_grid, create_product_listing_frame,
+    estimate_visible_products
 )
 from src.utils.theme import get_style_config
 from ..auth.profile import show_manage_user_screen
@@ -42,8 +45,14 @@ def switch_to_store_listing(global_state):
             - current_last_name: User's last name
             - current_user_id: User's ID
             - switch_to_admin_panel: Admin panel callback
+
+    Note:
+        The built screen is kept in the screen cache, returning to the listing
+        restores it instantly unless products, categories or users changed.
     """
     global_state['current_screen'] = switch_to_store_listing
+    # Refresh the session first so the header below never shows stale names or roles
+    get_session(global_state)
     window = global_state['window']
     main_frame = global_state['main_frame']
     window_state = global_state['window_state']
@@ -63,11 +72,16 @@ def switch_to_store_listing(global_state):
             window.state('normal')
             window.geometry("1920x1080")
             center_window(window, 1920, 1080)
+
+    # Restore the previously built listing if none of the data it shows has changed
+    screen_key = ('store_listing', current_user_id)
+    if restore_screen(global_state, screen_key):
+        return
     
     clear_frame(main_frame)
 
-    # Check admin status
-    is_admin = get_current_user_admin_status(current_username)
+    # Check admin status from the session
+    is_admin = is_session_admin(global_state)
 
     # Get icons from state
     user_icn = icons['user']
@@ -81,8 +95,12 @@ def switch_to_store_listing(global_state):
 
     styles = get_style_config()['store_listing']
 
+    # Hold the whole screen in one frame so it can be hidden and restored by the screen cache
+    screen_frame = tk.Frame(main_frame, bg=styles['content']['frame_bg'])
+    screen_frame.pack(fill="both", expand=True)
+
     # Create top bar
-    top_bar = tk.Frame(main_frame, height=100, bg=styles['top_bar']['bg'])
+    top_bar = tk.Frame(screen_frame, height=100, bg=styles['top_bar']['bg'])
     top_bar.pack(side="top", fill="x")
     top_bar.pack_propagate(False)
 
@@ -104,16 +122,27 @@ def switch_to_store_listing(global_state):
     user_info_frame.pack(side="left", padx=20, pady=10)
 
     # Create dropdown frame
-    dropdown_frame = tk.Frame(main_frame, **styles['dropdown']['frame'])
+    dropdown_frame = tk.Frame(screen_frame, **styles['dropdown']['frame'])
     dropdown_frame.place_forget()  # Initially hide the dropdown frame
 
     # Adds the options for a normal user/admin to the dropdown on store listing page (since only inner_content_frame is really setup in other further screens)
     if is_admin:
         tk.Button(dropdown_frame, text="Back to Admin Panel", command=lambda: switch_to_admin_panel(global_state), **styles['dropdown']['buttons'], width=20).pack(fill="x", padx=10, pady=5)
-    tk.Button(dropdown_frame, text="View Cart", command=lambda: show_cart(global_state), **styles['dropdown']['buttons'], width=20).pack(fill="x", padx=10, pady=5)
+    cart_button = tk.Button(dropdown_frame, text="View Cart", command=lambda: show_cart(global_state), **styles['dropdown']['buttons'], width=20)
+    cart_button.pack(fill="x", padx=10, pady=5)
     tk.Button(dropdown_frame, text="Manage Account", command=lambda: show_manage_user_screen(global_state), **styles['dropdown']['buttons'], width=20).pack(fill="x", padx=10, pady=5)
     tk.Button(dropdown_frame, text="Logout", command=lambda: logout(global_state), **styles['dropdown']['buttons'], width=20).pack(fill="x", padx=10, pady=5)
 
+    def refresh_cart_badge():
+        """Show the number of items in the cart on the View Cart button.
+        
+        Read from the in-memory cart, so it costs no query after the first.
+        """
+        item_count = get_cart_model(current_user_id)['item_count']
+        cart_button.configure(text=f"View Cart ({item_count})" if item_count else "View Cart")
+
+    refresh_cart_badge()
+
     def update_dropdown_position_handler(event=None):
         """Update dropdown menu position when window changes.
         
@@ -149,7 +178,7 @@ def switch_to_store_listing(global_state):
     window.bind("<Button-1>", lambda event: hide_dropdown_on_click(event, user_info_frame, dropdown_frame))
 
     # Create the content frame with the dark background for future addition of dynamic product listings
-    content_frame = tk.Frame(main_frame, bg=styles['content']['frame_bg'])
+    content_frame = tk.Frame(screen_frame, bg=styles['content']['frame_bg'])
     content_frame.pack(side="right", fill="both", expand=True)
 
     # Creates an inner content frame for the dynamic widgets
@@ -176,7 +205,8 @@ def switch_to_store_listing(global_state):
         'disable_search': disable_search,
         'enable_search': enable_search,
         'user_info_frame': user_info_frame,
-        'dropdown_frame': dropdown_frame
+        'dropdown_frame': dropdown_frame,
+        'refresh_cart_badge': refresh_cart_badge
     })
 
     def remove_focus(event):
@@ -203,6 +233,7 @@ def switch_to_store_listing(global_state):
 
     # Bind to all frames to catch clicks to remove the focus from the dropdown
     main_frame.bind('<Button-1>', remove_focus)
+    screen_frame.bind('<Button-1>', remove_focus)
     top_bar.bind('<Button-1>', remove_focus)
     content_frame.bind('<Button-1>', remove_focus)
     content_inner_frame.bind('<Button-1>', remove_focus)
@@ -243,9 +274,17 @@ def switch_to_store_listing(global_state):
         
         Args:
             products: List of product tuples to display
+            
+        Note:
+            Widgets are built by the render scheduler, products visible above
+            the fold are created immediately and the rest in small batches so
+            large catalogues never block the window.
         """
+        # Stop any batches still building the previous results
+        cancel_render(scrollable_frame)
         unbind_wheel()
         clear_frame(scrollable_frame)
+        scrollbar.pack_forget()
 
         if not products:
             message_label = tk.Label(scrollable_frame, text="", **styles['message'])
@@ -260,10 +299,14 @@ def switch_to_store_listing(global_state):
 
         # Group products by category
         categorized_products = {}
+        # Category names looked up once per category rather than once per product
+        category_names = {}
         
         for product in products:
             # Retrieve the category name for the product using its category ID
-            category_name = get_category_name(product[6])
+            if product[6] not in category_names:
+                category_names[product[6]] = get_category_name(product[6])
+            category_name = category_names[product[6]]
             # Check if the category name is not already a key in the categorized_products dictionary
             if category_name not in categorized_products:
                 # If not, initialize an empty list for this category
@@ -271,57 +314,117 @@ def switch_to_store_listing(global_state):
             # Append the product to the list of products under the corresponding category
             categorized_products[category_name].append(product)
 
-        row_count = 0
-
-        # Display categorized products
-        for category_name, category_products in categorized_products.items():
-            # Create category header
-            category_frame = tk.Frame(scrollable_frame, **styles['frame'])
-            category_frame.pack(fill="x", pady=(20, 10))
-            
-            category_label = tk.Label(
-                category_frame, 
-                text=category_name,
-                font=("Arial", 14, "bold"),
-                bg=styles['frame']['bg'],
-                fg=styles['category_labels']['fg']
-            )
-            category_label.pack(side="left", padx=10)
-            
-            # Built in separater line horizontal thin bar
-            separator = ttk.Separator(category_frame, orient="horizontal")
-            separator.pack(side="left", fill="x", expand=True, padx=10)
-
-            # Display products in this category
-            col = 0
-            row_frame = None
-            
-            for product in category_products:
-                if col % num_columns == 0:
-                    row_frame = tk.Frame(scrollable_frame, **styles['frame'])
-                    row_frame.pack(fill="x", pady=10, padx=20)
-                    row_count += 1
-
-                product_frame = create_product_listing_frame(
-                    row_frame, 
-                    product, 
-                    290,
-                    lambda p=product[0]: show_product_page(p, global_state)
+        def render_steps():
+            """Create the category headers and product frames, yielding after each one."""
+            row_count = 0
+
+            # Display categorized products
+            for category_name, category_products in categorized_products.items():
+                # Create category header
+                category_frame = tk.Frame(scrollable_frame, **styles['frame'])
+                category_frame.pack(fill="x", pady=(20, 10))
+                
+                category_label = tk.Label(
+                    category_frame, 
+                    text=category_name,
+                    font=("Arial", 14, "bold"),
+                    bg=styles['frame']['bg'],
+                    fg=styles['category_labels']['fg']
                 )
+                category_label.pack(side="left", padx=10)
+                
+                # Built in separater line horizontal thin bar
+                separator = ttk.Separator(category_frame, orient="horizontal")
+                separator.pack(side="left", fill="x", expand=True, padx=10)
+                yield
+
+                # Display products in this category
+                col = 0
+                row_frame = None
+                
+                for product in category_products:
+                    if col % num_columns == 0:
+                        row_frame = tk.Frame(scrollable_frame, **styles['frame'])
+                        row_frame.pack(fill="x", pady=10, padx=20)
+                        row_count += 1
+
+                        # Enable scrolling as soon as the content overflows, while the rest is still building
+                        if row_count == 2:
+                            scrollbar.pack(side="right", fill="y")
+                            # Skip the wheel if another screen replaced the listing mid render, restore rebinds it
+                            if screen_frame.winfo_manager() and wrapper.winfo_manager():
+                                bind_wheel()
+
+                    create_product_listing_frame(
+                        row_frame, 
+                        product, 
+                        290,
+                        lambda p=product[0]: show_product_page(p, global_state)
+                    )
+
+                    col += 1
+                    if col >= num_columns:
+                        col = 0
+                    yield
+
+        # Render the visible products (plus their category header) straight away
+        schedule_render(
+            scrollable_frame, render_steps(),
+            priority_steps=estimate_visible_products(canvas, num_columns) + 1
+        )
 
-                col += 1
-                if col >= num_columns:
-                    col = 0
+    # Initial display
+    display_products(get_products(listed_only=True))
 
-        # Enable scrolling if needed
-        if row_count > 1:
+    def restore_listing():
+        """Show the cached listing again without rebuilding it.
+        
+        Hides whatever replaced the screen (cached or not), re-packs the
+        product grid and restores the window bindings and global state.
+        """
+        global_state['current_screen'] = switch_to_store_listing
+        clear_frame(main_frame)
+        screen_frame.pack(fill="both", expand=True)
+
+        # The cart builds its own frame beside the listing's, swap the listing's back in
+        clear_frame(content_frame)
+        content_inner_frame.pack(fill="both", expand=True, padx=30, pady=30)
+
+        # Product pages are built inside the content frame, swap the grid back in
+        clear_frame(content_inner_frame)
+        wrapper.pack(fill="both", expand=True, pady=(30, 0))
+
+        window.unbind("<Configure>")
+        window.unbind("<Button-1>")
+        window.bind("<Configure>", update_dropdown_position_handler)
+        window.bind("<Button-1>", lambda event: hide_dropdown_on_click(event, user_info_frame, dropdown_frame))
+        dropdown_frame.place_forget()
+
+        enable_search()
+        # Only re-enable wheel scrolling if the grid overflowed when it was built
+        if scrollbar.winfo_manager():
             bind_wheel()
-            scrollbar.pack(side="right", fill="y")
-        else:
-            scrollbar.pack_forget()
 
-    # Initial display
-    display_products(get_products(listed_only=True))
+        global_state.update({
+            'content_frame': content_frame,
+            'content_inner_frame': content_inner_frame,
+            'disable_search': disable_search,
+            'enable_search': enable_search,
+            'user_info_frame': user_info_frame,
+            'dropdown_frame': dropdown_frame,
+            'refresh_cart_badge': refresh_cart_badge
+        })
+        refresh_cart_badge()
+
+    # Keep the built screen so back navigation is instant, the grid wrapper must also
+    # survive product pages clearing the inner frame, and the inner frame the cart
+    # clearing the content frame. Cart changes need no rebuild, restoring refreshes the badge
+    cache_screen(
+        global_state, screen_key, screen_frame,
+        depends_on=('products', 'categories', 'users'),
+        on_restore=restore_listing,
+        retained_widgets=(wrapper, content_inner_frame)
+    )
 
     # If this was called from show_product_page, update the cart button
     if hasattr(content_inner_frame, 'update_cart_callback'):
@@ -5,8 +5,11 @@ from src.database import (
 )
 from src.utils import (
     display_error, display_success, clear_frame, get_style_config,
-    create_scrollable_frame, log_action, resize_product_image,
-    resize_qr_code, show_dropdown, hide_dropdown
+    create_scrollable_frame, log_action, show_dropdown, hide_dropdown,
+    cache_screen, restore_screen
+)
+from src.utils.images import (
+    get_resized_image, get_resized_qr_code, snap_to_bucket, load_image_async
 )
 
 def show_product_page(product_id, global_state):
@@ -26,6 +29,12 @@ def show_product_page(product_id, global_state):
             - window: Main window instance
             - content_inner_frame: Content frame
             - current_user_id: Current user's ID
+
+    Note:
+        Text and controls are rendered first as a skeleton, the product image
+        and QR code are decoded in the background and filled in when ready.
+        Built pages are kept in the screen cache per product and restored
+        instantly on revisit until the product data changes.
     """
     # Extract needed values from global_state
     window = global_state['window']
@@ -40,12 +49,21 @@ def show_product_page(product_id, global_state):
     window.unbind("<Configure>")
     window.unbind("<Button-1>")
 
+    # Reuse the page built on a previous visit if the product has not changed since
+    screen_key = ('product_page', product_id)
+    if restore_screen(global_state, screen_key):
+        return
+
     product = get_product_by_id(product_id)
     if product:
         log_action('VIEW_PRODUCT', user_id=current_user_id, details=f"Viewed product: {product[1]}")
 
+        # Hold the page in its own frame so the screen cache can hide and restore it
+        page_frame = tk.Frame(content_inner_frame, **styles['frame'])
+        page_frame.pack(fill="both", expand=True)
+
         # Create title container frame to hold both title and back button
-        title_container = tk.Frame(content_inner_frame, **styles['frame'])
+        title_container = tk.Frame(page_frame, **styles['frame'])
         title_container.pack(fill="x", pady=(0, 8))
 
         # Back button on the left
@@ -61,7 +79,7 @@ def show_product_page(product_id, global_state):
         tk.Label(title_container, text=product[1], **styles['title']).pack(side="left", expand=True)
 
         # Create outer container with reduced padding
-        container_frame = tk.Frame(content_inner_frame, **styles['frame'])
+        container_frame = tk.Frame(page_frame, **styles['frame'])
         container_frame.pack(fill="both", expand=True)
 
         # Create scrollable frame setup
@@ -79,6 +97,12 @@ def show_product_page(product_id, global_state):
         # Left side - Product image
         left_frame = tk.Frame(details_frame, **styles['frame'])
         left_frame.pack(side="left", fill="both", expand=True, padx=(5, 5))
+
+        # Placeholder shown until the background image load completes
+        image_label = None
+        if product[7]:
+            image_label = tk.Label(left_frame, text="Loading image...", **styles['labels'])
+            image_label.pack()
         
         # Right side setup with fixed width
         right_frame = tk.Frame(details_frame, width=300, **styles['frame'])
@@ -97,7 +121,8 @@ def show_product_page(product_id, global_state):
         desc_frame = tk.Frame(inner_right_frame, **styles['frame'])
         desc_frame.pack(fill="x", pady=5)
         tk.Label(desc_frame, text="Description:", **styles['labels']).pack(anchor="n")
-        description_label = tk.Label(desc_frame, text=product[5], wraplength=280, **styles['description'])
+        # Description text is filled in after the skeleton has been drawn
+        description_label = tk.Label(desc_frame, text="", wraplength=280, **styles['description'])
         description_label.pack(pady=5)
 
         # Message label for success/error messages above cart button
@@ -117,11 +142,13 @@ def show_product_page(product_id, global_state):
                 display_error(message_label, "Please log in to add items to cart")
                 return
             
-            success, message = add_to_cart(global_state['current_user_id'], product_id)
+            success, message, quantity = add_to_cart(global_state['current_user_id'], product_id)
             if success:
-                display_success(message_label, message)
-                log_action('CART_ADD', user_id=global_state['current_user_id'], details=f"Added product {product[1]} to cart")
+                display_success(message_label, f"{message} ({quantity} in cart)")
+                log_action('CART_ADD', user_id=global_state['current_user_id'], details=f"Added product {product[1]} to cart, {quantity} in cart")
                 try:
+                    if global_state.get('refresh_cart_badge'):
+                        global_state['refresh_cart_badge']()
                     show_dropdown(None, global_state['user_info_frame'], global_state['dropdown_frame']) # Should show the dropdown to show user where the view cart button is, but doesnt seem to work?
                     window.after(5000, lambda: safe_hide_dropdown())
                 except tk.TclError:
@@ -147,6 +174,11 @@ def show_product_page(product_id, global_state):
         resize_timer = None
         wraplength_timer = None
 
+        # Rendered images keyed by (window size bucket, kind) so resizing back to
+        # an earlier size reuses the render instead of re-running LANCZOS
+        rendered_images = {}
+        current_bucket = None
+
         def debounced_resize(event=None):
             """Debounced version of resize_content.
             
@@ -173,19 +205,28 @@ def show_product_page(product_id, global_state):
             """Handle responsive resizing of product image and QR code.
             
             Calculates appropriate image dimensions based on:
-            - Window width/height
+            - Window width/height snapped to size buckets
             - Minimum/maximum size constraints
             - Screen resolution breakpoints
             
-            Updates image maintaining aspect ratio
+            Reuses renders already made for the current size bucket,
+            otherwise resizes in the background and swaps the image in
+            when ready. Does nothing if the bucket has not changed.
             """
+            nonlocal current_bucket
 
-            if not product[7] or not left_frame.winfo_exists():
+            if not left_frame.winfo_exists():
                 return
                 
-            # Calculate responsive dimensions based on window size
-            window_width = window.winfo_width()
-            window_height = window.winfo_height()
+            # Calculate responsive dimensions based on bucketed window size
+            window_width = snap_to_bucket(window.winfo_width())
+            window_height = snap_to_bucket(window.winfo_height())
+            bucket = (window_width, window_height)
+
+            # Configure fires for moves and child changes too, skip if size bucket is unchanged
+            if bucket == current_bucket:
+                return
+            current_bucket = bucket
             
             # Scale image relative to window size
             max_img_width = min(int(window_width * 0.5), 2000)
@@ -197,34 +238,68 @@ def show_product_page(product_id, global_state):
             qr_min_size = 150  # Minimum 150px
 
             # Resize product image
-            resized_image = resize_product_image(
-                product[7],
-                max_width=max_img_width,
-                max_height=max_img_height,
-                min_width=min_img_width,
-                min_height=min_img_height
-            )
-            
-            # Update product image
-            if resized_image:
-                for widget in left_frame.winfo_children():
-                    widget.destroy()
-                image_label = tk.Label(left_frame, image=resized_image)
-                image_label.image = resized_image
-                image_label.pack()
+            if product[7]:
+                if (bucket, 'image') in rendered_images:
+                    show_product_image(rendered_images[(bucket, 'image')])
+                else:
+                    load_image_async(
+                        left_frame, get_resized_image,
+                        lambda photo, b=bucket: on_image_loaded(b, 'image', photo),
+                        product[7],
+                        max_width=max_img_width,
+                        max_height=max_img_height,
+                        min_width=min_img_width,
+                        min_height=min_img_height
+                    )
 
             # Resize and update QR code
             if product[3]:
-                qr_size = min(max(qr_min_size, int(window_width * 0.15)), qr_max_size)
-                resized_qr = resize_qr_code(product[3], size=(qr_size, qr_size))
-                if resized_qr:
-                    if hasattr(inner_right_frame, 'qr_label'):
-                        inner_right_frame.qr_label.configure(image=resized_qr)
-                        inner_right_frame.qr_label.image = resized_qr
-                    else:
-                        inner_right_frame.qr_label = tk.Label(inner_right_frame, image=resized_qr, **styles['image_frame'])
-                        inner_right_frame.qr_label.image = resized_qr
-                        inner_right_frame.qr_label.pack(pady=10)
+                if (bucket, 'qr') in rendered_images:
+                    show_qr_code(rendered_images[(bucket, 'qr')])
+                else:
+                    qr_size = min(max(qr_min_size, int(window_width * 0.15)), qr_max_size)
+                    load_image_async(
+                        inner_right_frame, get_resized_qr_code,
+                        lambda photo, b=bucket: on_image_loaded(b, 'qr', photo),
+                        product[3],
+                        size=(qr_size, qr_size)
+                    )
+
+        def on_image_loaded(bucket, kind, photo):
+            """Store a finished background render and show it if still current.
+            
+            Args:
+                bucket: Window size bucket the image was rendered for
+                kind: 'image' for the product image, 'qr' for the QR code
+                photo: Rendered PhotoImage, None if loading failed
+            """
+            if not photo:
+                if kind == 'image' and image_label is not None and not image_label.cget('image'):
+                    image_label.configure(text="Image unavailable")
+                return
+            rendered_images[(bucket, kind)] = photo
+            # Ignore renders for a size the window has since moved away from
+            if bucket != current_bucket:
+                return
+            if kind == 'image':
+                show_product_image(photo)
+            else:
+                show_qr_code(photo)
+
+        def show_product_image(photo):
+            """Swap the rendered product image into the image label."""
+            image_label.configure(image=photo, text="")
+            image_label.image = photo
+
+        def show_qr_code(photo):
+            """Show the rendered QR code, creating its label on first use."""
+            if hasattr(inner_right_frame, 'qr_label'):
+                inner_right_frame.qr_label.configure(image=photo)
+                inner_right_frame.qr_label.image = photo
+            else:
+                inner_right_frame.qr_label = tk.Label(inner_right_frame, image=photo, **styles['image_frame'])
+                inner_right_frame.qr_label.image = photo
+                inner_right_frame.qr_label.pack(pady=10)
 
         def update_wraplength(event=None):
             """Update description text wrapping based on container width.
@@ -234,10 +309,20 @@ def show_product_page(product_id, global_state):
             """
             # Update description wraplength based on frame width
             new_width = right_frame.winfo_width() - 40
-            description_label.configure(wraplength=new_width)
+            # Frame may not have its real size yet when called before first layout
+            if new_width > 0:
+                description_label.configure(wraplength=new_width)
+
+        def render_deferred_content():
+            """Fill in description and start image loading after the skeleton is drawn."""
+            if not description_label.winfo_exists():
+                return
+            description_label.configure(text=product[5])
+            update_wraplength()
+            resize_content()
 
-        # Initial image loading
-        resize_content()
+        # Let Tk draw the skeleton first, then fill in the heavier content
+        window.after_idle(render_deferred_content)
 
         def safe_hide_dropdown():
             """Safely hide dropdown menu handling widget destruction.
@@ -257,6 +342,27 @@ def show_product_page(product_id, global_state):
         # Enable mouse wheel scrolling
         bind_wheel()
 
+        def restore_product_page():
+            """Show the cached product page again without rebuilding it.
+            
+            Hides the listing grid, re-packs the page, rebinds the resize
+            and scroll handlers and logs the view like a fresh visit.
+            """
+            clear_frame(content_inner_frame)
+            page_frame.pack(fill="both", expand=True)
+            window.unbind("<Configure>")
+            window.unbind("<Button-1>")
+            window.bind("<Configure>", debounced_resize)
+            bind_wheel()
+            log_action('VIEW_PRODUCT', user_id=global_state['current_user_id'], details=f"Viewed product: {product[1]}")
+
+        # The page shows no cart state until Add to Cart is used, so cart changes keep it valid
+        cache_screen(
+            global_state, screen_key, page_frame,
+            depends_on=('products',),
+            on_restore=restore_product_page
+        )
+
     else:
         message_label = tk.Label(content_inner_frame, text="", **styles['message'])
         message_label.pack()
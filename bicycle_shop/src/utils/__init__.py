@@ -12,13 +12,21 @@ from .display import (
     setup_search_widget,
     show_dropdown,
     hide_dropdown,
-    hide_dropdown_on_click
+    hide_dropdown_on_click,
+    cache_screen,
+    restore_screen,
+    invalidate_screen_cache,
+    create_paged_log_loader,
+    start_log_tail,
+    schedule_render,
+    cancel_render
 )
 
 from .frames import (
     create_scrollable_frame,
     create_scrollable_grid_frame,
     setup_product_grid,
+    estimate_visible_products,
     create_basic_product_frame,
     create_product_management_frame,
     create_product_listing_frame
@@ -26,14 +34,26 @@ from .frames import (
 
 from .images import (
     resize_product_image,
-    resize_qr_code
+    resize_qr_code,
+    get_resized_image,
+    get_resized_qr_code,
+    snap_to_bucket,
+    load_image_async
 )
 
 from .logging import (
     log_event,
     ACTION_TYPES,
     get_action_type,
-    log_action
+    log_action,
+    configure_file_logging,
+    shutdown_file_logging,
+    get_dropped_log_count,
+    JsonLinesFormatter,
+    ACTION_LOG_POLICIES,
+    SECURITY_ACTIONS,
+    get_log_policy,
+    flush_log_aggregates
 )
 
 from .qr import (
@@ -66,18 +86,23 @@ __all__ = [
     'create_user_info_display', 'create_nav_buttons',
     'toggle_password_visibility', 'create_password_field',
     'setup_search_widget', 'show_dropdown', 'hide_dropdown',
-    'hide_dropdown_on_click',
+    'hide_dropdown_on_click', 'cache_screen', 'restore_screen',
+    'invalidate_screen_cache', 'create_paged_log_loader', 'start_log_tail',
+    'schedule_render', 'cancel_render',
 
     # Frames
     'create_scrollable_frame', 'create_scrollable_grid_frame',
-    'setup_product_grid', 'create_basic_product_frame',
+    'setup_product_grid', 'estimate_visible_products', 'create_basic_product_frame',
     'create_product_management_frame', 'create_product_listing_frame',
 
     # Images
-    'resize_product_image', 'resize_qr_code',
+    'resize_product_image', 'resize_qr_code', 'get_resized_image',
+    'get_resized_qr_code', 'snap_to_bucket', 'load_image_async',
 
     # Logging
     'log_event', 'ACTION_TYPES', 'get_action_type', 'log_action',
+    'configure_file_logging', 'shutdown_file_logging', 'get_dropped_log_count', 'JsonLinesFormatter',
+    'ACTION_LOG_POLICIES', 'SECURITY_ACTIONS', 'get_log_policy', 'flush_log_aggregates',
 
     # QR
     'generate_qr_code', 'scan_qr_code', 'scan_qr_code_from_file',
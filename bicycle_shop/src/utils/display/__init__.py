@@ -24,6 +24,20 @@ from .dropdown import (
     hide_dropdown_on_click
 )
 
+from .screen_cache import (
+    cache_screen,
+    restore_screen,
+    invalidate_screen_cache
+)
+
+from .log_viewer import create_paged_log_loader, start_log_tail
+
+from .render_scheduler import (
+    schedule_render,
+    cancel_render,
+    RENDER_BUDGET_MS
+)
+
 __all__ = [
     'display_message',
     'display_error',
@@ -38,5 +52,13 @@ __all__ = [
     'setup_search_widget',
     'show_dropdown',
     'hide_dropdown',
-    'hide_dropdown_on_click'
+    'hide_dropdown_on_click',
+    'cache_screen',
+    'restore_screen',
+    'invalidate_screen_cache',
+    'create_paged_log_loader',
+    'start_log_tail',
+    'schedule_render',
+    'cancel_render',
+    'RENDER_BUDGET_MS'
 ]
\ No newline at end of file
@@ -0,0 +1,208 @@
+import tkinter as tk
+
+# Lines inserted into the text widget per event loop turn
+LOG_CHUNK_LINES = 100
+# Load the next page once the view is scrolled past this fraction of the content
+LOAD_MORE_THRESHOLD = 0.9
+
+def create_paged_log_loader(text_widget, scrollbar, fetch_page, page_size, on_error=None):
+    """Attach incremental, scroll driven log loading to a text widget.
+
+    Args:
+        text_widget: Text widget logs are displayed in
+        scrollbar: Scrollbar attached to the text widget
+        fetch_page: Function(before_id, limit) returning log rows newest first,
+                    each row starting with its id (e.g. get_log_page)
+        page_size: Number of rows requested per page
+        on_error: Optional callback taking the exception if a page fails to load
+
+    Returns:
+        Function: reload() which clears the widget and loads the newest page,
+                  returning False if the page failed to load
+
+    Note:
+        Rows are inserted in chunks of LOG_CHUNK_LINES using after() so the UI
+        never blocks on large logs. Further pages load when the user scrolls
+        near the end. Reloading cancels any chunks still pending, and any
+        live tail running on the same widget.
+    """
+    state = {
+        'cursor': None,
+        'exhausted': False,
+        'loading': False,
+        'generation': None
+    }
+
+    def on_scroll(first, last):
+        """Update the scrollbar and fetch the next page when near the end."""
+        scrollbar.set(first, last)
+        if float(last) >= LOAD_MORE_THRESHOLD:
+            load_next_page()
+
+    def reload():
+        """Clear the display and start again from the newest log rows."""
+        # A new generation makes pending chunks from earlier loads stop
+        state.update({
+            'cursor': None,
+            'exhausted': False,
+            'loading': False,
+            'generation': _begin_view(text_widget)
+        })
+        # Take the scroll callback back in case a live tail replaced it
+        text_widget.configure(yscrollcommand=on_scroll)
+        _write_text(text_widget, lambda: text_widget.delete('1.0', tk.END))
+        return load_next_page()
+
+    def load_next_page():
+        """Fetch the next page of rows and queue them for chunked insertion."""
+        if state['loading'] or state['exhausted']:
+            return True
+        state['loading'] = True
+
+        try:
+            rows = fetch_page(before_id=state['cursor'], limit=page_size)
+        except Exception as e:
+            state['loading'] = False
+            if on_error:
+                on_error(e)
+            return False
+
+        if len(rows) < page_size:
+            state['exhausted'] = True
+        if rows:
+            state['cursor'] = rows[-1][0]
+
+        # Drop the id column, remaining columns match the pipe-delimited export format
+        lines = [_format_lines((row,)) for row in rows]
+        insert_chunk(lines, 0, state['generation'])
+        return True
+
+    def insert_chunk(lines, start, generation):
+        """Insert one chunk of lines and schedule the rest for the next loop turn."""
+        if not _is_view_current(text_widget, generation):
+            return
+
+        end = start + LOG_CHUNK_LINES
+        chunk = "".join(lines[start:end])
+        if chunk:
+            _write_text(text_widget, lambda: text_widget.insert(tk.END, chunk))
+
+        if end < len(lines):
+            text_widget.after(1, insert_chunk, lines, end, generation)
+        else:
+            state['loading'] = False
+            # Short pages may not fill the view, keep loading until it scrolls or runs out
+            text_widget.after_idle(check_fill, generation)
+
+    def check_fill(generation):
+        """Load another page if the current content does not reach the load threshold."""
+        if not _is_view_current(text_widget, generation):
+            return
+        try:
+            _, last = text_widget.yview()
+        except tk.TclError:
+            return
+        if last >= LOAD_MORE_THRESHOLD:
+            load_next_page()
+
+    return reload
+
+def start_log_tail(text_widget, scrollbar, fetch_page, fetch_newer, max_lines,
+                   poll_interval_ms, on_error=None):
+    """Show the newest logs in a text widget and keep appending new rows as they are written.
+
+    Args:
+        text_widget: Text widget logs are displayed in
+        scrollbar: Scrollbar attached to the text widget
+        fetch_page: Function(before_id, limit) returning log rows newest first (e.g. get_log_page)
+        fetch_newer: Function(after_id, limit) returning rows newer than after_id,
+                     oldest first (e.g. get_logs_since)
+        max_lines: Maximum number of lines kept in the widget, oldest are trimmed
+        poll_interval_ms: Delay between checks for new rows
+        on_error: Optional callback taking the exception if a fetch fails
+
+    Returns:
+        bool: True if the initial rows loaded and polling started, False otherwise
+
+    Note:
+        New rows are inserted at the top, matching the newest first order of
+        the paged view, and only rows past the last seen id are fetched so a
+        poll never re-reads the whole log. Polling polls the database rather
+        than hooking the logging functions so entries written by other running
+        instances sharing the database also appear.
+        The tail stops when the widget is destroyed, or when a paged reload or
+        another tail starts on the same widget.
+    """
+    generation = _begin_view(text_widget)
+    # Older pages are not loaded while tailing, the view is capped at max_lines
+    text_widget.configure(yscrollcommand=scrollbar.set)
+    _write_text(text_widget, lambda: text_widget.delete('1.0', tk.END))
+
+    try:
+        rows = fetch_page(before_id=None, limit=max_lines)
+    except Exception as e:
+        if on_error:
+            on_error(e)
+        return False
+
+    state = {'last_id': rows[0][0] if rows else 0}
+    _write_text(text_widget, lambda: text_widget.insert(tk.END, _format_lines(rows)))
+
+    def poll():
+        """Fetch rows written since the last poll and prepend them to the view."""
+        if not _is_view_current(text_widget, generation):
+            return
+
+        try:
+            new_rows = fetch_newer(after_id=state['last_id'], limit=max_lines)
+        except Exception as e:
+            # Stop polling rather than repeating the same error every interval
+            if on_error:
+                on_error(e)
+            return
+
+        if new_rows:
+            state['last_id'] = new_rows[-1][0]
+            # Rows arrive oldest first, reverse them to keep the newest on top
+            text = _format_lines(reversed(new_rows))
+            def prepend():
+                text_widget.insert('1.0', text)
+                # Trim everything beyond the line cap from the bottom
+                text_widget.delete(f"{max_lines + 1}.0", tk.END)
+            _write_text(text_widget, prepend)
+
+        # A full batch means more rows may be waiting, catch up without waiting a full interval
+        delay = 1 if len(new_rows) >= max_lines else poll_interval_ms
+        text_widget.after(delay, poll)
+
+    text_widget.after(poll_interval_ms, poll)
+    return True
+
+def _format_lines(rows):
+    """Format log rows as pipe-delimited lines, dropping the leading id column."""
+    return "".join(" | ".join(map(str, row[1:])) + "\n" for row in rows)
+
+def _begin_view(text_widget):
+    """Start a new display generation on a widget, cancelling scheduled work from earlier ones.
+
+    Returns:
+        int: Generation number the new loader or tail must check before touching the widget
+    """
+    text_widget.log_view_generation = getattr(text_widget, 'log_view_generation', 0) + 1
+    return text_widget.log_view_generation
+
+def _is_view_current(text_widget, generation):
+    """Check the widget still exists and has not been taken over by a newer view."""
+    try:
+        if not text_widget.winfo_exists():
+            return False
+    except tk.TclError:
+        return False
+    return getattr(text_widget, 'log_view_generation', None) == generation
+
+def _write_text(text_widget, action):
+    """Run a modification on the text widget, preserving its read-only state."""
+    previous_state = text_widget.cget('state')
+    text_widget.configure(state="normal")
+    action()
+    text_widget.configure(state=previous_state)
@@ -0,0 +1,82 @@
+import time
+import tkinter as tk
+
+# Time a single batch of widget construction may take before yielding to the Tk loop
+RENDER_BUDGET_MS = 8
+
+def schedule_render(container, steps, priority_steps=0, budget_ms=RENDER_BUDGET_MS, on_complete=None):
+    """Build a screen's widgets in time boxed batches instead of one blocking loop.
+
+    Args:
+        container: Widget the content is built into, rendering stops if it is destroyed
+        steps: Generator that creates one piece of the screen (e.g. one product frame)
+               per step and yields after each
+        priority_steps: Number of leading steps to run straight away regardless of
+                        budget, used for the content visible above the fold
+        budget_ms: Maximum time spent per batch before yielding
+        on_complete: Optional callback run once all steps have finished
+
+    Note:
+        Priority steps run before this function returns so the visible content
+        is drawn in the same frame. Remaining steps run in batches of about
+        budget_ms, each scheduled with after_idle so redraws and input are
+        handled in between.
+        Scheduling a new render on the same container, or calling cancel_render,
+        stops any batches still pending from an earlier render.
+    """
+    generation = cancel_render(container)
+
+    def run_steps(limit=None, deadline=None):
+        """Advance the generator, returns False once it is exhausted or the container is gone."""
+        count = 0
+        try:
+            while limit is None or count < limit:
+                next(steps)
+                count += 1
+                if deadline is not None and time.perf_counter() >= deadline:
+                    break
+        except StopIteration:
+            return False
+        except tk.TclError:
+            # Container destroyed while building, nothing left to render into
+            return False
+        return True
+
+    def run_batch():
+        """Run steps until the time budget is used, then yield to the event loop."""
+        if not _is_render_current(container, generation):
+            return
+        deadline = time.perf_counter() + budget_ms / 1000
+        if run_steps(deadline=deadline):
+            container.after_idle(run_batch)
+        elif on_complete and _is_render_current(container, generation):
+            on_complete()
+
+    # Above the fold content is rendered immediately
+    if priority_steps and not run_steps(limit=priority_steps):
+        if on_complete and _is_render_current(container, generation):
+            on_complete()
+        return
+
+    container.after_idle(run_batch)
+
+def cancel_render(container):
+    """Stop any scheduled render batches for a container.
+
+    Args:
+        container: Widget a render was scheduled on
+
+    Returns:
+        int: New render generation for the container
+    """
+    container.render_generation = getattr(container, 'render_generation', 0) + 1
+    return container.render_generation
+
+def _is_render_current(container, generation):
+    """Check the container still exists and no newer render has replaced this one."""
+    try:
+        if not container.winfo_exists():
+            return False
+    except tk.TclError:
+        return False
+    return getattr(container, 'render_generation', None) == generation
@@ -0,0 +1,142 @@
+from collections import OrderedDict
+import tkinter as tk
+
+from src.database.core.changes import get_data_versions
+
+# Maximum number of hidden screens kept alive at once, least recently used are destroyed first
+MAX_CACHED_SCREENS = 6
+
+def get_screen_cache(global_state):
+    """Get the screen cache stored in global state, creating it if needed.
+
+    Args:
+        global_state: Application state dictionary
+
+    Returns:
+        OrderedDict: Cache entries keyed by screen key, oldest first
+    """
+    return global_state.setdefault('screen_cache', OrderedDict())
+
+def cache_screen(global_state, key, frame, depends_on=(), on_restore=None, retained_widgets=()):
+    """Keep a built screen alive so it can be restored without rebuilding.
+
+    Args:
+        global_state: Application state dictionary
+        key: Hashable key identifying the screen and its arguments
+        frame: Root frame of the screen
+        depends_on: Data domains the screen displays (e.g. 'products', 'categories')
+        on_restore: Callback that re-packs the screen and rebinds its events
+        retained_widgets: Extra widgets that must survive clear_frame for the screen to be restorable
+
+    Note:
+        Cached widgets are flagged so clear_frame hides them with pack_forget
+        instead of destroying them.
+        Evicts least recently used hidden screens above MAX_CACHED_SCREENS.
+    """
+    cache = get_screen_cache(global_state)
+
+    previous = cache.pop(key, None)
+    if previous and previous['frame'] is not frame:
+        _destroy_entry(previous)
+
+    widgets = (frame,) + tuple(retained_widgets)
+    for widget in widgets:
+        widget.screen_cached = True
+
+    cache[key] = {
+        'frame': frame,
+        'widgets': widgets,
+        'depends_on': tuple(depends_on),
+        'versions': get_data_versions(*depends_on),
+        'on_restore': on_restore
+    }
+    _enforce_cache_limit(cache)
+
+def restore_screen(global_state, key):
+    """Restore a cached screen if it is still valid.
+
+    Args:
+        global_state: Application state dictionary
+        key: Key the screen was cached under
+
+    Returns:
+        Frame | None: Restored screen frame, None if not cached or stale
+
+    Note:
+        Stale entries (underlying data changed or widgets destroyed) are
+        removed and destroyed so the caller rebuilds the screen.
+    """
+    cache = get_screen_cache(global_state)
+    entry = cache.get(key)
+    if entry is None:
+        return None
+
+    if not _is_entry_valid(entry):
+        del cache[key]
+        _destroy_entry(entry)
+        return None
+
+    # Mark as most recently used
+    cache.move_to_end(key)
+    try:
+        if entry['on_restore']:
+            entry['on_restore']()
+    except tk.TclError:
+        # Widget tree changed underneath the cache, fall back to a rebuild
+        cache.pop(key, None)
+        _destroy_entry(entry)
+        return None
+    return entry['frame']
+
+def invalidate_screen_cache(global_state, key=None):
+    """Remove one or all screens from the cache.
+
+    Args:
+        global_state: Application state dictionary
+        key: Key of screen to remove, None to clear the whole cache
+
+    Note:
+        Used on logout since cached screens hold the previous user's data.
+    """
+    cache = get_screen_cache(global_state)
+    if key is None:
+        entries = list(cache.values())
+        cache.clear()
+    else:
+        entry = cache.pop(key, None)
+        entries = [entry] if entry else []
+
+    for entry in entries:
+        _destroy_entry(entry)
+
+def _is_entry_valid(entry):
+    """Check cached widgets still exist and their data has not changed."""
+    try:
+        if not all(widget.winfo_exists() for widget in entry['widgets']):
+            return False
+    except tk.TclError:
+        return False
+    return get_data_versions(*entry['depends_on']) == entry['versions']
+
+def _destroy_entry(entry):
+    """Destroy the widgets held by a cache entry, ignoring ones already gone."""
+    for widget in entry['widgets']:
+        try:
+            widget.destroy()
+        except tk.TclError:
+            pass
+
+def _enforce_cache_limit(cache):
+    """Evict least recently used hidden screens until within MAX_CACHED_SCREENS."""
+    for key in list(cache.keys()):
+        if len(cache) <= MAX_CACHED_SCREENS:
+            break
+        entry = cache[key]
+        try:
+            # Never evict a screen that is currently on display (or contains the one on display)
+            if entry['frame'].winfo_exists() and entry['frame'].winfo_ismapped():
+                continue
+        except tk.TclError:
+            pass
+        del cache[key]
+        _destroy_entry(entry)
@@ -59,6 +59,10 @@ def clear_frame(frame):
         
     Note:
         Destroys all child widgets in frame
+        Cached screens are hidden with pack_forget instead so they can be restored
     """
     for widget in frame.winfo_children():
-        widget.destroy()
\ No newline at end of file
+        if getattr(widget, 'screen_cached', False):
+            widget.pack_forget()
+        else:
+            widget.destroy()
\ No newline at end of file
@@ -5,6 +5,7 @@ from .scrollable import (
 
 from .products import (
     setup_product_grid,
+    estimate_visible_products,
     create_basic_product_frame,
     create_product_management_frame,
     create_product_listing_frame
@@ -14,6 +15,7 @@ __all__ = [
     'create_scrollable_frame',
     'create_scrollable_grid_frame',
     'setup_product_grid',
+    'estimate_visible_products',
     'create_basic_product_frame',
     'create_product_management_frame',
     'create_product_listing_frame'
@@ -3,6 +3,9 @@ from ..theme import get_style_config
 from ..images import resize_qr_code
 from ..display import display_error
 
+# Approximate height of one row of product frames (labels, buttons and 290px QR code)
+PRODUCT_ROW_HEIGHT = 380
+
 def setup_product_grid(scrollable_frame, canvas, products, product_width=290, padding=5):
     """Sets up the basic grid layout for products.
     
@@ -39,6 +42,23 @@ def setup_product_grid(scrollable_frame, canvas, products, product_width=290, pa
     num_columns = max(1, content_width // (product_width + padding))
     return num_columns # Calculated number of columns
 
+def estimate_visible_products(canvas, num_columns, row_height=PRODUCT_ROW_HEIGHT):
+    """Estimate how many products fit in the visible part of a product grid.
+    
+    Args:
+        canvas: Canvas widget containing the scrollable grid
+        num_columns: Number of columns from setup_product_grid
+        row_height: Approximate height of one row of product frames
+        
+    Returns:
+        int: Number of products to render first so the initial view is filled
+        
+    Note:
+        Adds one extra row so content is ready when the user starts scrolling.
+    """
+    visible_rows = max(1, canvas.winfo_height() // row_height) + 1
+    return num_columns * visible_rows
+
 def create_basic_product_frame(row_frame, product, product_width, buttons=None):
     """Creates standard product frame with common elements.
     
@@ -1,9 +1,18 @@
 from .processors import (
     resize_product_image,
-    resize_qr_code
+    resize_qr_code,
+    get_resized_image,
+    get_resized_qr_code,
+    snap_to_bucket
 )
 
+from .loader import load_image_async
+
 __all__ = [
     'resize_product_image',
-    'resize_qr_code'
-]
\ No newline at end of file
+    'resize_qr_code',
+    'get_resized_image',
+    'get_resized_qr_code',
+    'snap_to_bucket',
+    'load_image_async'
+]
@@ -0,0 +1,53 @@
+from concurrent.futures import ThreadPoolExecutor
+import tkinter as tk
+
+from PIL import ImageTk
+
+# Shared worker pool for decoding and resizing images off the Tk main thread
+_image_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="image-loader")
+
+# How often the Tk thread checks for finished background loads
+POLL_INTERVAL_MS = 15
+
+def load_image_async(widget, loader, callback, *args, **kwargs):
+    """Decode and resize an image in the background then deliver it on the Tk thread.
+
+    Args:
+        widget: Widget used to schedule polling, result is dropped if it is destroyed
+        loader: Function returning a PIL image (e.g. get_resized_image)
+        callback: Called on the Tk thread with the PhotoImage, or None on failure
+        *args: Positional arguments for loader
+        **kwargs: Keyword arguments for loader
+
+    Returns:
+        Future: Future of the background load
+
+    Note:
+        Tkinter is not thread safe, so the worker only produces the PIL image
+        and the PhotoImage is created after polling from the Tk event loop
+    """
+    future = _image_executor.submit(loader, *args, **kwargs)
+
+    def check_result():
+        """Poll the background load and hand over the result once done."""
+        try:
+            if not widget.winfo_exists():
+                return
+        except tk.TclError:
+            return
+
+        if not future.done():
+            widget.after(POLL_INTERVAL_MS, check_result)
+            return
+
+        try:
+            image = future.result()
+            photo = ImageTk.PhotoImage(image) if image else None
+        except Exception as e:
+            # Match the synchronous resize helpers which report and return None
+            print(f"Error loading image: {e}")
+            photo = None
+        callback(photo)
+
+    widget.after(POLL_INTERVAL_MS, check_result)
+    return future
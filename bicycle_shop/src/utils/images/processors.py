@@ -1,5 +1,149 @@
+from collections import OrderedDict
+import os
+import threading
+
 from PIL import Image, ImageTk
 
+# Resized PIL images keyed by source file, modification time and target constraints
+# Shared between the Tk thread and background loaders, so guarded by a lock
+# Bounded by entry count and total pixels since full size product renders are large
+MAX_CACHED_IMAGES = 48
+MAX_CACHED_PIXELS = 16_000_000
+_resized_images = OrderedDict()
+_resized_images_lock = threading.Lock()
+_cached_pixels = 0
+
+# Window dimensions are snapped to buckets of this many pixels before sizing images
+IMAGE_SIZE_BUCKET = 100
+
+def snap_to_bucket(value, bucket=IMAGE_SIZE_BUCKET):
+    """Round a window dimension down to its size bucket.
+    
+    Args:
+        value: Dimension in pixels
+        bucket: Bucket size in pixels
+        
+    Returns:
+        int: Dimension rounded down to a multiple of bucket (at least one bucket)
+        
+    Note:
+        Small resizes within a bucket produce identical image sizes,
+        so previously rendered images can be reused from the cache
+    """
+    return max(bucket, (int(value) // bucket) * bucket)
+
+def calculate_image_size(orig_width, orig_height, max_width, max_height, min_width, min_height):
+    """Calculate resized dimensions maintaining aspect ratio within constraints.
+    
+    Args:
+        orig_width: Original image width in pixels
+        orig_height: Original image height in pixels
+        max_width: Maximum allowed width in pixels
+        max_height: Maximum allowed height in pixels
+        min_width: Minimum allowed width in pixels
+        min_height: Minimum allowed height in pixels
+        
+    Returns:
+        tuple: (width, height) in whole pixels
+    """
+    aspect_ratio = orig_width / orig_height
+    
+    new_width = min(max_width, orig_width)
+    new_height = new_width / aspect_ratio
+    
+    # If the new height exceeds the maximum height, adjust the height and width
+    if new_height > max_height:
+        new_height = max_height
+        new_width = new_height * aspect_ratio
+    
+    # If the new width is less than the minimum width, adjust the width and height
+    if new_width < min_width:
+        new_width = min_width
+        new_height = new_width / aspect_ratio
+        
+    # If the new height is less than the minimum height, adjust the height and width
+    if new_height < min_height:
+        new_height = min_height
+        new_width = new_height * aspect_ratio
+
+    return int(new_width), int(new_height)
+
+def _get_cached_resize(image_path, size_key, calculate_size):
+    """Return a resized PIL image from the cache, resizing and storing it on a miss.
+    
+    Args:
+        image_path: Path to image file to resize
+        size_key: Hashable description of the requested size
+        calculate_size: Function taking the original (width, height) and returning the new size
+        
+    Returns:
+        Image: Resized PIL image
+        
+    Note:
+        Safe to call from worker threads, only PhotoImage creation must stay on the Tk thread
+    """
+    global _cached_pixels
+
+    key = (image_path, os.path.getmtime(image_path), size_key)
+    with _resized_images_lock:
+        if key in _resized_images:
+            _resized_images.move_to_end(key)
+            return _resized_images[key]
+
+    with Image.open(image_path) as img:
+        resized = img.resize(calculate_size(img.size), Image.Resampling.LANCZOS)
+
+    with _resized_images_lock:
+        if key not in _resized_images:
+            _resized_images[key] = resized
+            _cached_pixels += resized.width * resized.height
+        # Drop least recently used renders to bound memory use, always keeping the newest
+        while len(_resized_images) > 1 and (
+            len(_resized_images) > MAX_CACHED_IMAGES or _cached_pixels > MAX_CACHED_PIXELS
+        ):
+            _, evicted = _resized_images.popitem(last=False)
+            _cached_pixels -= evicted.width * evicted.height
+    return resized
+
+def get_resized_image(image_path, max_width=800, max_height=600, min_width=200, min_height=150):
+    """Get product image resized within constraints as a PIL image.
+    
+    Args:
+        image_path: Path to image file to resize
+        max_width: Maximum allowed width in pixels
+        max_height: Maximum allowed height in pixels
+        min_width: Minimum allowed width in pixels
+        min_height: Minimum allowed height in pixels
+        
+    Returns:
+        Image: Resized PIL image (cached per file and constraints)
+        
+    Raises:
+        OSError: If the image cannot be opened
+    """
+    return _get_cached_resize(
+        image_path,
+        ('product', max_width, max_height, min_width, min_height),
+        lambda size: calculate_image_size(*size, max_width, max_height, min_width, min_height)
+    )
+
+def get_resized_qr_code(qr_path, size=(150, 150)):
+    """Get QR code resized to a square as a PIL image.
+    
+    Args:
+        qr_path: Path to QR code image file
+        size: Tuple of (width, height) in pixels, smaller dimension is used
+        
+    Returns:
+        Image: Resized PIL image (cached per file and size)
+        
+    Raises:
+        OSError: If the image cannot be opened
+    """
+    # Force square aspect ratio by using the smaller dimension of the image
+    dimension = min(size[0], size[1])
+    return _get_cached_resize(qr_path, ('qr', dimension), lambda _: (dimension, dimension))
+
 def resize_product_image(image_path, max_width=800, max_height=600, min_width=200, min_height=150):
     """Resize product image maintaining aspect ratio within constraints.
     
@@ -18,33 +162,10 @@ def resize_product_image(image_path, max_width=800, max_height=600, min_width=20
         Uses LANCZOS resampling for high quality
         Maintains original aspect ratio
         Ensures image fits within min/max constraints
+        Reuses cached renders for repeated sizes
     """
     try:
-        img = Image.open(image_path)
-        orig_width, orig_height = img.size
-        
-        aspect_ratio = orig_width / orig_height
-        
-        new_width = min(max_width, orig_width)
-        new_height = new_width / aspect_ratio
-        
-        # If the new height exceeds the maximum height, adjust the height and width
-        if new_height > max_height:
-            new_height = max_height
-            new_width = new_height * aspect_ratio
-        
-        # If the new width is less than the minimum width, adjust the width and height
-        if new_width < min_width:
-            new_width = min_width
-            new_height = new_width / aspect_ratio
-            
-        # If the new height is less than the minimum height, adjust the height and width
-        if new_height < min_height:
-            new_height = min_height
-            new_width = new_height * aspect_ratio
-        
-        # Resize the image to the new dimensions using the LANCZOS resampling filter
-        resized = img.resize((int(new_width), int(new_height)), Image.Resampling.LANCZOS)
+        resized = get_resized_image(image_path, max_width, max_height, min_width, min_height)
         return ImageTk.PhotoImage(resized) 
     except Exception as e:
         # Print an error message if an exception occurs during the resizing process
@@ -67,16 +188,8 @@ def resize_qr_code(qr_path, size=(150, 150)):
         Uses LANCZOS resampling for high quality
     """
     try:
-        qr_img = Image.open(qr_path) # Open the image file from the given path
-
-        # Force square aspect ratio by using the smaller dimension of the image
-        dimension = min(size[0], size[1])
-
-        # Resize the image to a square with the calculated dimension
-        qr_resized = qr_img.resize((dimension, dimension), Image.Resampling.LANCZOS)
-
-        # Convert the resized image to a format suitable for Tkinter
-        return ImageTk.PhotoImage(qr_resized)
+        # Convert the cached resized image to a format suitable for Tkinter
+        return ImageTk.PhotoImage(get_resized_qr_code(qr_path, size))
     except Exception as e:
         # Print an error message if any exception occurs during the process
         print(f"Error resizing QR code: {e}")
@@ -1,13 +1,31 @@
 from .core import (
     log_event,
     ACTION_TYPES,
+    ACTION_LOG_POLICIES,
+    SECURITY_ACTIONS,
     get_action_type,
+    get_log_policy,
     log_action
 )
+from .file_logging import (
+    configure_file_logging,
+    shutdown_file_logging,
+    get_dropped_log_count,
+    JsonLinesFormatter
+)
+from .policies import flush_log_aggregates
 
 __all__ = [
     'log_event',
     'ACTION_TYPES',
     'get_action_type',
-    'log_action'
+    'log_action',
+    'configure_file_logging',
+    'shutdown_file_logging',
+    'get_dropped_log_count',
+    'JsonLinesFormatter',
+    'ACTION_LOG_POLICIES',
+    'SECURITY_ACTIONS',
+    'get_log_policy',
+    'flush_log_aggregates'
 ]
\ No newline at end of file
@@ -1,5 +1,11 @@
+import logging
+
 from src.file_system.config.config_manager import get_logging_settings
 from src.database.logging.log_manager import log_user_action, log_admin_action
+from src.utils.logging.policies import should_sample, aggregate_log_entry
+
+# Logger for application events, handled by the root logger's file handler
+_app_logger = logging.getLogger('bicycle_shop')
 
 # User Action Types
 ACTION_TYPES = {
@@ -12,7 +18,8 @@ ACTION_TYPES = {
         'CART_UPDATE': 'update_cart',
         'PROFILE_UPDATE': 'update_profile',
         'PASSWORD_CHANGE': 'change_password',
-        'APPLY_DISCOUNT': 'apply_discount'
+        'APPLY_DISCOUNT': 'apply_discount',
+        'CHECKOUT': 'checkout'
     },
     'admin': {
         'ADMIN_LOGIN': 'admin_login',
@@ -29,22 +36,67 @@ ACTION_TYPES = {
         'DELETE_DISCOUNT': 'delete_discount',
         'MANAGE_USER': 'manage_user',
         'DELETE_USER': 'delete_user',
-        'TOGGLE_USER_LOGGING': 'toggle_logging'
+        'TOGGLE_USER_LOGGING': 'toggle_logging',
+        'EXPORT_LOGS': 'export_logs',
+        'IMPORT_USERS': 'import_users',
+        'EXPORT_USERS': 'export_users'
     }
 }
 
-def log_event(event):
-    """Log an event to a file.
+# Write policies for high-volume action types, anything not listed is always logged:
+#   ('sample', percent): log roughly percent% of successful entries
+#   ('aggregate', seconds): collapse repeats of the same entry into one row per window
+ACTION_LOG_POLICIES = {
+    'user': {
+        'VIEW_PRODUCT': ('aggregate', 60),
+        'CART_UPDATE': ('sample', 10)
+    },
+    'admin': {}
+}
+
+# Security-relevant actions are always logged in full whatever ACTION_LOG_POLICIES says
+SECURITY_ACTIONS = {
+    'user': {'LOGIN', 'LOGOUT', 'REGISTER', 'PASSWORD_CHANGE'},
+    'admin': {'ADMIN_LOGIN', 'FIRST_LOGIN_PASSWORD', 'MANAGE_USER', 'DELETE_USER'}
+}
+
+ALWAYS_POLICY = ('always', None)
+
+def get_log_policy(type_group, action, status='success'):
+    """Get the write policy for a log entry.
+
+    Args:
+        type_group: Group of actions ('user' or 'admin')
+        action: Action key from ACTION_TYPES
+        status: Status of the entry being logged
+
+    Returns:
+        tuple: (mode, value) where mode is 'always', 'sample' or 'aggregate'
+
+    Note:
+        Only successful entries are ever sampled or aggregated, failures
+        and security actions are always written individually.
+    """
+    if status != 'success' or action in SECURITY_ACTIONS.get(type_group, ()):
+        return ALWAYS_POLICY
+    return ACTION_LOG_POLICIES.get(type_group, {}).get(action, ALWAYS_POLICY)
+
+def log_event(event, level=logging.INFO, **fields):
+    """Log an application event.
     
     Args:
         event: Event text to log
+        level: Logging level of the event (default: INFO)
+        **fields: Extra structured fields, written under 'fields' in the JSON
+                  line so any name can be used without clashing with the
+                  attributes of the log record
         
     Note:
-        Logs to app.log in application directory
-        Creates file if it doesn't exist
+        Goes through Python logging, so once configure_file_logging has run
+        it is written as a JSON line to the application log file by the
+        background writer instead of blocking the caller on file I/O
     """
-    with open("app.log", "a") as f:
-        f.write(f"{event}\n")
+    _app_logger.log(level, event, extra={'fields': fields})
 
 def get_action_type(type_group, action):
     """Get action type string from dictionary.
@@ -79,26 +131,58 @@ def log_action(action_type, is_admin=False, **kwargs):
         Only logs user actions if user logging is enabled
         Admin actions are always logged
         Uses consistent action types from ACTION_TYPES dict
+        High-volume actions follow their ACTION_LOG_POLICIES entry: sampled
+        entries are written with their sampling rate in the details and
+        aggregated entries are written once per window with a repeat count.
+        Failures and security actions are never sampled or aggregated.
     """
     # Determine the type group based on whether the user is an admin
     type_group = 'admin' if is_admin else 'user'
     action_string = get_action_type(type_group, action_type)
-    
+
+    # Only log user actions if enabled
+    if not is_admin and not get_logging_settings()['user_logging_enabled']:
+        return
+
+    status = kwargs.get('status', 'success')
+    details = kwargs.get('details', '')
+    mode, value = get_log_policy(type_group, action_type, status)
+
+    if mode == 'sample':
+        if not should_sample(value):
+            return
+        details = f"{details} (sampled at {value}%)"
+    elif mode == 'aggregate':
+        actor_id = kwargs.get('admin_id') if is_admin else kwargs.get('user_id')
+        key = (type_group, action_string, actor_id, kwargs.get('target_type'), kwargs.get('target_id'), details)
+
+        def write_aggregate(count, window, first_seen):
+            summary = details if count == 1 else f"{details} (x{count} in {window}s)"
+            # Stamped with the window start, not the time the window is flushed
+            _write_action(is_admin, action_string, summary, status, kwargs, created_at=first_seen)
+
+        aggregate_log_entry(key, value, write_aggregate)
+        return
+
+    _write_action(is_admin, action_string, details, status, kwargs)
+
+def _write_action(is_admin, action_string, details, status, fields, created_at=None):
+    """Write a single entry to the user or admin action log, created_at defaulting to now."""
     if is_admin:
         log_admin_action(
-            admin_id=kwargs.get('admin_id'),
+            admin_id=fields.get('admin_id'),
             action_type=action_string,
-            target_type=kwargs.get('target_type'),
-            target_id=kwargs.get('target_id'),
-            details=kwargs.get('details', ''),
-            status=kwargs.get('status', 'success')
+            target_type=fields.get('target_type'),
+            target_id=fields.get('target_id'),
+            details=details,
+            status=status,
+            created_at=created_at
         )
     else:
-        # Only log user actions if enabled
-        if get_logging_settings()['user_logging_enabled']:
-            log_user_action(
-                user_id=kwargs.get('user_id'),
-                action_type=action_string,
-                details=kwargs.get('details', ''),
-                status=kwargs.get('status', 'success')
-            )
\ No newline at end of file
+        log_user_action(
+            user_id=fields.get('user_id'),
+            action_type=action_string,
+            details=details,
+            status=status,
+            created_at=created_at
+        )
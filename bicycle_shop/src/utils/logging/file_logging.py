@@ -0,0 +1,249 @@
+import atexit
+import copy
+import gzip
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import shutil
+import threading
+import time
+from datetime import datetime, timezone
+
+# Name of the active log file inside the logs directory
+LOG_FILE_NAME = 'app.jsonl'
+# Records held in memory waiting for the writer, further records are dropped when full
+LOG_QUEUE_SIZE = 10000
+# Buffered lines are written once this many are waiting
+LOG_BUFFER_RECORDS = 100
+# Seconds buffered lines may wait before being written
+LOG_FLUSH_INTERVAL = 1.0
+
+# Attributes every LogRecord has, anything else was passed through extra= and is logged as a field
+_STANDARD_RECORD_ATTRS = set(vars(logging.makeLogRecord({}))) | {'message', 'asctime'}
+
+_file_logging = {'handler': None, 'thread': None, 'queue': None, 'dropped': 0}
+_file_logging_lock = threading.Lock()
+
+class JsonLinesFormatter(logging.Formatter):
+    """Format log records as one JSON object per line.
+
+    Each line has ts (UTC ISO 8601), level, logger and message, followed by
+    any fields passed with extra= and the formatted exception if present.
+    """
+
+    def format(self, record):
+        entry = {
+            'ts': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage()
+        }
+        for key, value in vars(record).items():
+            if key not in _STANDARD_RECORD_ATTRS and not key.startswith('_'):
+                entry[key] = value
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            # Formatted by _DroppingQueueHandler.prepare before the record crossed threads
+            entry['exception'] = record.exc_text
+        # default=str keeps unexpected field types from breaking the line
+        return json.dumps(entry, default=str)
+
+class _DroppingQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that drops records instead of blocking when the writer falls behind."""
+
+    def prepare(self, record):
+        """Make a record safe to hand to the writer thread, keeping its exception separate.
+
+        QueueHandler.prepare merges the traceback into the message, here it
+        is formatted into exc_text instead so the JSON line keeps it in its
+        own exception field.
+        """
+        record = copy.copy(record)
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        # Resolve the message now, args and tracebacks may not survive the trip to another thread
+        record.msg = record.getMessage()
+        record.args = None
+        record.exc_info = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            # Application logs must never stall the UI, count what was lost instead
+            _file_logging['dropped'] += 1
+
+def configure_file_logging(log_dir, level='INFO', max_bytes=5_000_000, rotate_interval_hours=24,
+                           backup_count=5, compress=True):
+    """Send Python logging output to a rotating JSON lines file written on a background thread.
+
+    Args:
+        log_dir: Absolute directory for the log file and rotated backups
+        level: Minimum level written (name or number)
+        max_bytes: Rotate once the file would exceed this size (0 disables size rotation)
+        rotate_interval_hours: Rotate once the file is this old (0 disables time rotation)
+        backup_count: Rotated files kept, the oldest are deleted
+        compress: Gzip rotated files
+
+    Note:
+        Installs a queue handler on the root logger, so existing logging
+        calls (e.g. logging.error in the cart screen) and log_event are
+        captured. Callers only pay for a queue put. Formatting, buffering,
+        writing and rotation happen on the writer thread. Calling again
+        replaces the previous configuration.
+    """
+    shutdown_file_logging()
+    os.makedirs(log_dir, exist_ok=True)
+
+    log_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+    handler = _DroppingQueueHandler(log_queue)
+    writer_state = {
+        'path': os.path.join(log_dir, LOG_FILE_NAME),
+        'max_bytes': max_bytes,
+        'rotate_interval': rotate_interval_hours * 3600,
+        'backup_count': backup_count,
+        'compress': compress,
+        'formatter': JsonLinesFormatter()
+    }
+    thread = threading.Thread(target=_file_writer_loop, args=(log_queue, writer_state),
+                              name="file-log-writer", daemon=True)
+
+    with _file_logging_lock:
+        root = logging.getLogger()
+        root.addHandler(handler)
+        root.setLevel(level)
+        _file_logging.update({'handler': handler, 'thread': thread, 'queue': log_queue, 'dropped': 0})
+    thread.start()
+
+def shutdown_file_logging(timeout=5.0):
+    """Write buffered records, close the log file and detach from the root logger.
+
+    Args:
+        timeout: Maximum seconds to wait for the writer thread
+
+    Note:
+        Registered with atexit so buffered lines are written on exit.
+    """
+    with _file_logging_lock:
+        handler, thread, log_queue = _file_logging['handler'], _file_logging['thread'], _file_logging['queue']
+        if handler is None:
+            return
+        logging.getLogger().removeHandler(handler)
+        _file_logging.update({'handler': None, 'thread': None, 'queue': None})
+
+    # Stop message goes behind any queued records so they are written first
+    log_queue.put(None)
+    thread.join(timeout)
+
+def get_dropped_log_count():
+    """Get the number of records dropped because the writer queue was full.
+
+    Returns:
+        int: Records dropped since logging was configured
+    """
+    return _file_logging['dropped']
+
+def _file_writer_loop(log_queue, state):
+    """Buffer formatted records and write them on size, time or error thresholds."""
+    buffer = []
+    first_buffered = None
+    log_file = _open_log_file(state)
+
+    while True:
+        timeout = None if first_buffered is None else max(0, first_buffered + LOG_FLUSH_INTERVAL - time.monotonic())
+        try:
+            record = log_queue.get(timeout=timeout)
+        except queue.Empty:
+            record = False  # Flush interval elapsed with nothing new
+
+        if record is None:
+            _write_lines(log_file, buffer, state)
+            log_file.close()
+            return
+
+        if record:
+            try:
+                buffer.append(state['formatter'].format(record) + "\n")
+            except Exception as e:
+                print(f"Error formatting log record: {e}")
+            if first_buffered is None:
+                first_buffered = time.monotonic()
+
+        # Errors are written straight away so they survive a crash
+        urgent = record and record.levelno >= logging.ERROR
+        interval_elapsed = first_buffered is not None and time.monotonic() - first_buffered >= LOG_FLUSH_INTERVAL
+        if buffer and (urgent or interval_elapsed or len(buffer) >= LOG_BUFFER_RECORDS):
+            log_file = _write_lines(log_file, buffer, state)
+            buffer, first_buffered = [], None
+
+def _open_log_file(state):
+    """Open the active log file for appending and record when it was started."""
+    log_file = open(state['path'], 'a', encoding='utf-8')
+    state['opened_at'] = time.time()
+    if log_file.tell():
+        # An existing file keeps the age of its first entry so restarts do not postpone time rotation
+        try:
+            with open(state['path'], 'r', encoding='utf-8') as existing:
+                first_ts = json.loads(existing.readline())['ts']
+            state['opened_at'] = datetime.fromisoformat(first_ts).timestamp()
+        except (OSError, ValueError, KeyError):
+            pass
+    return log_file
+
+def _write_lines(log_file, lines, state):
+    """Write buffered lines, rotating the file first if it is due.
+
+    Returns:
+        file: The file to keep writing to (a new one after rotation)
+    """
+    if not lines:
+        return log_file
+    data = "".join(lines)
+    try:
+        if _should_rotate(log_file, len(data.encode('utf-8')), state):
+            log_file = _rotate(log_file, state)
+        log_file.write(data)
+        log_file.flush()
+    except OSError as e:
+        print(f"Error writing application log: {e}")
+    return log_file
+
+def _should_rotate(log_file, pending_bytes, state):
+    """Check the size and age limits against the active file."""
+    size = log_file.tell()
+    if size == 0:
+        return False
+    if state['max_bytes'] and size + pending_bytes > state['max_bytes']:
+        return True
+    return bool(state['rotate_interval']) and time.time() - state['opened_at'] >= state['rotate_interval']
+
+def _rotate(log_file, state):
+    """Move the active file to a timestamped backup, compress it and prune old backups."""
+    log_file.close()
+    base, ext = os.path.splitext(state['path'])
+    stamp = datetime.now(timezone.utc).strftime('%Y%m%d-%H%M%S-%f')
+    rotated = f"{base}-{stamp}{ext}"
+    os.replace(state['path'], rotated)
+
+    if state['compress']:
+        with open(rotated, 'rb') as source, gzip.open(rotated + '.gz', 'wb') as target:
+            shutil.copyfileobj(source, target)
+        os.remove(rotated)
+
+    # Timestamped names sort oldest first, delete everything beyond backup_count
+    directory, prefix = os.path.split(base)
+    backups = sorted(
+        name for name in os.listdir(directory)
+        if name.startswith(prefix + '-') and (name.endswith(ext) or name.endswith(ext + '.gz'))
+    )
+    for name in backups[:max(0, len(backups) - state['backup_count'])]:
+        os.remove(os.path.join(directory, name))
+
+    return _open_log_file(state)
+
+# Make sure buffered lines reach the file however the application exits
+atexit.register(shutdown_file_logging)
@@ -0,0 +1,102 @@
+import atexit
+import random
+import threading
+import time
+
+# How often pending aggregates are checked for an elapsed window, in seconds
+AGGREGATE_TICK = 1.0
+
+# Pending aggregates: key -> [count, write callback, flush due time, window, first seen unix time]
+_aggregates = {}
+_aggregate_lock = threading.Lock()
+_flusher_thread = None
+
+def should_sample(percent):
+    """Decide whether a sampled entry is written.
+
+    Args:
+        percent: Percentage of entries kept (0-100)
+
+    Returns:
+        bool: True if this entry should be written
+    """
+    return random.random() * 100 < percent
+
+def aggregate_log_entry(key, window, write):
+    """Count an entry towards its aggregate row instead of writing it now.
+
+    Args:
+        key: Hashable identity of the entry, repeats with the same key are collapsed
+        window: Seconds entries are collected before the aggregate row is written
+        write: Callback taking (count, window, first_seen) that writes the
+               aggregate row, first_seen being the Unix time of the first entry
+
+    Note:
+        The row is written by a background thread once the window ends, by
+        flush_log_aggregates, or at exit, so it reaches the log tables up to
+        window seconds after the first entry. The row carries the time of
+        the first entry (the window start) rather than the write time, so
+        time ordered views and retention see when the views happened.
+    """
+    with _aggregate_lock:
+        pending = _aggregates.get(key)
+        if pending:
+            pending[0] += 1
+            return
+        _aggregates[key] = [1, write, time.monotonic() + window, window, time.time()]
+    _ensure_flusher_started()
+
+def flush_log_aggregates():
+    """Write every pending aggregate row now.
+
+    Note:
+        Registered with atexit and called when the application closes so
+        no counted entries are lost.
+    """
+    _flush_due(force=True)
+
+def _flush_due(force=False):
+    """Write the aggregates whose window has ended.
+
+    Args:
+        force: Write every pending aggregate regardless of its window
+
+    Returns:
+        bool: True if aggregates are still pending
+    """
+    now = time.monotonic()
+    with _aggregate_lock:
+        due = [key for key, pending in _aggregates.items() if force or pending[2] <= now]
+        flushed = [_aggregates.pop(key) for key in due]
+        remaining = bool(_aggregates)
+
+    # Callbacks run outside the lock so writers can log without deadlocking
+    for count, write, _, window, first_seen in flushed:
+        try:
+            write(count, window, first_seen)
+        except Exception as e:
+            print(f"Error writing aggregated log entry: {e}")
+    return remaining
+
+def _ensure_flusher_started():
+    """Start the aggregate flusher thread if it is not already running."""
+    global _flusher_thread
+    with _aggregate_lock:
+        if _flusher_thread is None or not _flusher_thread.is_alive():
+            _flusher_thread = threading.Thread(target=_flusher_loop, name="log-aggregate-flusher", daemon=True)
+            _flusher_thread.start()
+
+def _flusher_loop():
+    """Write aggregates as their windows end, exiting once nothing is pending."""
+    global _flusher_thread
+    while True:
+        time.sleep(AGGREGATE_TICK)
+        if not _flush_due():
+            with _aggregate_lock:
+                # A new aggregate may have arrived since the flush, only stop if still empty
+                if not _aggregates:
+                    _flusher_thread = None
+                    return
+
+# Make sure counted entries reach the log tables however the application exits
+atexit.register(flush_log_aggregates)
@@ -13,12 +13,14 @@ def validate_username_uniqueness(username):
             
     Note:
         Uses parameterized query for SQL injection protection
+        Usernames differing only in case are the same username, sign in
+        throttling counts them together
     """
     conn = get_connection()
     cursor = conn.cursor()
     
     # Execute an SQL query to check if the username exists in the Users table
-    cursor.execute("SELECT 1 FROM Users WHERE username = ?", (username,))
+    cursor.execute("SELECT 1 FROM Users WHERE username = ? COLLATE NOCASE", (username,))
     
     # Fetch the first result from the query
     result = cursor.fetchone()
@@ -60,7 +62,8 @@ def validate_age(age):
     # If age is 18 or older, return True with a valid message
     return True, "Valid"
 
-def validate_user_fields(username, first_name, last_name, password, confirm_password, age, check_type="register"):
+def validate_user_fields(username, first_name, last_name, password, confirm_password, age, check_type="register",
+                         check_unique=True):
     """Validate user fields for registration, editing, and password changes.
     
     Performs different validations based on check_type:
@@ -76,6 +79,8 @@ def validate_user_fields(username, first_name, last_name, password, confirm_pass
         confirm_password: Password confirmation (if required) 
         age: Age to validate
         check_type: Type of validation ("register", "edit", or "password")
+        check_unique: Whether "register" checks the username against the database,
+                      bulk imports check a whole chunk of usernames at once instead
         
     Returns:
         tuple: (is_valid, message)
@@ -92,9 +97,10 @@ def validate_user_fields(username, first_name, last_name, password, confirm_pass
             return False, message
             
         # Validate that the username is unique
-        is_valid, message = validate_username_uniqueness(username)
-        if not is_valid:
-            return False, message
+        if check_unique:
+            is_valid, message = validate_username_uniqueness(username)
+            if not is_valid:
+                return False, message
             
     elif check_type == "edit":
         # Validate that all required fields for editing profile are not empty
@@ -0,0 +1,35 @@
+import json
+import logging
+
+from src.utils.logging.file_logging import configure_file_logging, shutdown_file_logging, LOG_FILE_NAME
+from src.utils.logging.core import log_event
+
+def read_entries(log_dir):
+    """Read the JSON lines written to the application log."""
+    with open(log_dir / LOG_FILE_NAME, encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+def test_exception_written_to_its_own_field(tmp_path):
+    configure_file_logging(str(tmp_path))
+    try:
+        try:
+            raise ValueError("bad quantity")
+        except ValueError:
+            logging.getLogger("test").exception("Cart update failed")
+    finally:
+        shutdown_file_logging()
+
+    entry, = read_entries(tmp_path)
+    assert entry['message'] == "Cart update failed"
+    assert "ValueError: bad quantity" in entry['exception']
+
+def test_event_fields_may_use_record_attribute_names(tmp_path):
+    configure_file_logging(str(tmp_path))
+    try:
+        log_event("Checkout", message="kept", name="till 1", args=3)
+    finally:
+        shutdown_file_logging()
+
+    entry, = read_entries(tmp_path)
+    assert entry['message'] == "Checkout"
+    assert entry['fields'] == {'message': "kept", 'name': "till 1", 'args': 3}
@@ -0,0 +1,39 @@
+from datetime import datetime, timezone
+
+import pytest
+
+# Loaded first, the database package is imported through it like in main.py
+import src.file_system
+from src.database.core import connection
+from src.database.core.schema import create_tables
+from src.database.logging import log_user_action, get_logs_since, get_log_partitions, flush_logs
+from src.database.logging.partitions import forget_log_partitions
+
+@pytest.fixture
+def database(tmp_path, monkeypatch):
+    """Fresh database in a temporary directory."""
+    monkeypatch.setattr(connection, 'DB_PATH', str(tmp_path / 'test.db'))
+    forget_log_partitions()
+    create_tables()
+    yield
+    forget_log_partitions()
+
+def unix_time(timestamp):
+    return datetime.strptime(timestamp, '%Y-%m-%d %H:%M:%S').replace(tzinfo=timezone.utc).timestamp()
+
+def test_tail_finds_row_backdated_into_previous_month(database):
+    log_user_action(None, 'view_product', "October view", created_at=unix_time('2026-10-01 00:00:05'))
+    flush_logs()
+    tail = get_logs_since(after_id=0)
+    assert [row[4] for row in tail] == ["October view"]
+
+    # Stamped before the month boundary but written after the October row
+    log_user_action(None, 'view_product', "September view", created_at=unix_time('2026-09-30 23:59:50'))
+    flush_logs()
+
+    conn = connection.get_connection()
+    try:
+        assert [month for month, _ in get_log_partitions(conn.cursor(), 'user')] == ['2026-10', '2026-09']
+    finally:
+        conn.close()
+    assert [row[4] for row in get_logs_since(after_id=tail[-1][0])] == ["September view"]
@@ -0,0 +1,41 @@
+import tkinter as tk
+
+import pytest
+
+from src.utils.display.screen_cache import cache_screen, restore_screen
+from src.utils.display.windows import clear_frame
+
+@pytest.fixture
+def root():
+    """Tk root window, skipped where no display is available."""
+    try:
+        window = tk.Tk()
+    except tk.TclError:
+        pytest.skip("No display available for Tk")
+    window.withdraw()
+    yield window
+    window.destroy()
+
+def test_cart_visit_keeps_listing_cached(root):
+    # Same frame layout as the store listing
+    screen_frame = tk.Frame(root)
+    screen_frame.pack()
+    content_frame = tk.Frame(screen_frame)
+    content_frame.pack()
+    content_inner_frame = tk.Frame(content_frame)
+    content_inner_frame.pack()
+    wrapper = tk.Frame(content_inner_frame)
+    wrapper.pack()
+
+    global_state = {}
+    key = ('store_listing', 1)
+    cache_screen(global_state, key, screen_frame,
+                 retained_widgets=(wrapper, content_inner_frame))
+
+    # show_cart clears the content frame and builds its own frame beside the listing's
+    clear_frame(content_frame)
+    tk.Frame(content_frame).pack()
+
+    assert content_inner_frame.winfo_exists()
+    assert wrapper.winfo_exists()
+    assert restore_screen(global_state, key) is screen_frame